@@ -4,6 +4,7 @@ from django.contrib.auth import authenticate, login, logout, get_user_model
 from django.contrib import messages
 from django.views.decorators.csrf import csrf_protect
 from artisans.models import ArtisanProfile
+from cart.anonymous import merge_anonymous_cart
 from influencers.models import InfluencerProfile
 from .forms import UserSignUpForm, UserSignInForm, UserProfileForm, ArtisanProfileForm, InfluencerProfileForm
 from .decorators import login_required
@@ -47,12 +48,15 @@ def signup_view(request):
             # Role-based redirect
             if user.role == 'artisan':
                 messages.info(request, 'Please complete your artisan profile to start selling.')
-                return redirect('artisan_setup')
+                response = redirect('artisan_setup')
             elif user.role == 'influencer':
                 messages.info(request, 'Please complete your influencer profile to start collaborating.')
-                return redirect('influencer_setup')
+                response = redirect('influencer_setup')
             else:  # customer
-                return redirect('products_list')
+                response = redirect('products_list')
+            # Keep whatever was added to the cart before signing up
+            merge_anonymous_cart(request, response, user)
+            return response
         else:
             # Show form errors
             for field, errors in form.errors.items():
@@ -94,7 +98,10 @@ def signin_view(request):
                     
                     # Redirect to next page or dashboard
                     next_page = request.GET.get('next', 'dashboard')
-                    return redirect(next_page)
+                    response = redirect(next_page)
+                    # Fold the cart built before signing in into the user's cart
+                    merge_anonymous_cart(request, response, user)
+                    return response
                 else:
                     messages.error(request, 'Invalid email or password.')
             except User.DoesNotExist:
@@ -154,9 +161,15 @@ def dashboard_view(request):
             artisan = ArtisanProfile.objects.get(user=request.user)
             context['artisan'] = artisan
             context['products_count'] = artisan.products.count()
+            # Headline numbers and the 90-day series come from the daily rollup
+            from orders.rollups import artisan_sales_summary
+            sales = artisan_sales_summary(request.user, days=90)
+            context['sales_totals'] = sales['totals']
+            context['sales_series'] = sales['series']
+            context['sales_peak'] = max(point['revenue'] for point in sales['series']) or 1
             # Get recent order items for this artisan
             from orders.models import OrderItem
-            recent_items = OrderItem.objects.filter(artisan=request.user).select_related('order', 'product').order_by('-created_at')[:10]
+            recent_items = OrderItem.objects.filter(artisan=request.user).select_related('order__customer', 'product').order_by('-created_at')[:10]
             # Group by order
             recent_orders = {}
             for item in recent_items:
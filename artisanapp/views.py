@@ -1,20 +1,26 @@
 from django.shortcuts import render
+from products.facets import apply_catalog_filters, catalog_facets, parse_catalog_filters, price_band_bounds
 from products.models import Product, Category
 
 
 def marketplace_view(request):
-    """Marketplace view: shows active products and category filtering"""
-    products = Product.objects.filter(status='active').select_related('category', 'artisan')
-    categories = Category.objects.all()
+    """Marketplace view: shows active products with search, filters and facet counts"""
+    active = Product.objects.filter(status='active')
+    categories = list(Category.objects.all())
 
-    # Category filtering via GET ?category=<id>
-    category = request.GET.get('category')
-    if category:
-        products = products.filter(category__id=category)
+    # Same filters as the catalog (?search=, ?category=, ?price_band=, ...)
+    filters = parse_catalog_filters(request.GET)
+    bounds = price_band_bounds()
+    products = apply_catalog_filters(active, filters, bounds).select_related('category', 'artisan')
+    if filters['search']:
+        products = products.order_by('-search_rank', '-id')
 
     context = {
         'products': products,
         'categories': categories,
-        'selected_category': str(category) if category else ''
+        'facets': catalog_facets(active, filters, categories, bounds),
+        'selected_category': str(filters['category']) if filters['category'] is not None else '',
+        'search': filters['search'],
+        'filters': filters,
     }
     return render(request, 'marketplace.html', context)
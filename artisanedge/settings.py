@@ -63,6 +63,7 @@ INSTALLED_APPS = [
     'orders.apps.OrdersConfig',
     'collaborations.apps.CollaborationsConfig',
     'core.apps.CoreConfig',
+    'jobs.apps.JobsConfig',
     'artisanapp',  # Keep legacy app for now
 ]
 
@@ -73,6 +74,7 @@ LOGIN_REDIRECT_URL = 'dashboard'
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.QueryProfilingMiddleware',  # No-op unless SQL_PROFILING is on
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,6 +95,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'cart.context_processors.cart_summary',
             ],
         },
     },
@@ -174,6 +177,63 @@ MAX_PRICE_INR = 5000
 # Shipping defaults (INR)
 SHIPPING_COST_INR = 50
 
+# Catalog pagination (products per page; the max is a hard server-side cap)
+CATALOG_PAGE_SIZE = 24
+CATALOG_MAX_PAGE_SIZE = 60
+# Reviews shown per page on the product page / per "load more" request
+REVIEWS_PAGE_SIZE = 10
+REVIEWS_MAX_PAGE_SIZE = 50
+# Customer order history page size (default, max)
+ORDERS_PAGE_SIZE = 20
+ORDERS_MAX_PAGE_SIZE = 100
+# Most order items an artisan can move to a new status in one request
+ORDER_STATUS_BULK_MAX = 200
+# Finished orders older than this many days move to the archive tables (orders.archive)
+ORDER_ARCHIVE_AFTER_DAYS = 365
+ORDER_ARCHIVE_BATCH_SIZE = 500
+# Seconds to cache facet counts per filter combination
+CATALOG_FACET_CACHE_SECONDS = 300
+# Bulk product import (rows per validation chunk / bulk write)
+PRODUCT_IMPORT_BATCH_SIZE = 500
+# Image for imported rows without one (shipped in media/products)
+PRODUCT_IMPORT_DEFAULT_IMAGE = 'products/placeholder.jpg'
+# Seconds to keep a rendered product card (entries are also dropped on change)
+PRODUCT_CARD_CACHE_SECONDS = 3600
+# Seconds to keep a user's cart badge summary (dropped on cart changes)
+CART_SUMMARY_CACHE_SECONDS = 300
+# Most cart lines one bulk update request may change (cart.bulk)
+CART_BULK_MAX_CHANGES = 100
+# cleanup_carts: carts untouched for this many days are deleted, in batches
+CART_STALE_DAYS = 90
+CART_CLEANUP_BATCH_SIZE = 1000
+# Anonymous carts live in a signed cookie until sign-in (cart.anonymous)
+ANONYMOUS_CART_COOKIE = 'cart'
+ANONYMOUS_CART_MAX_AGE = 60 * 60 * 24 * 30  # 30 days
+ANONYMOUS_CART_MAX_LINES = 50
+
+# Cache (in-process by default; set DJANGO_CACHE_BACKEND/LOCATION to a shared
+# file or database cache when running several workers)
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', 'artisanedge'),
+    }
+}
+
+# SQL profiling (core.middleware.QueryProfilingMiddleware); off unless enabled
+SQL_PROFILING = os.environ.get('SQL_PROFILING', '').lower() in ('1', 'true', 'yes')
+SQL_SLOW_QUERY_MS = float(os.environ.get('SQL_SLOW_QUERY_MS', 100))
+SQL_PROFILE_DUPLICATE_THRESHOLD = 3  # Same statement shape this often = likely N+1
+SQL_PROFILE_SLOWEST = 5
+
+# Background jobs (jobs.queue; run with `manage.py run_workers`)
+JOBS_WORKERS = int(os.environ.get('JOBS_WORKERS', 2))
+JOBS_POLL_INTERVAL = 1.0  # Seconds between polls of an idle queue
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_BACKOFF_SECONDS = 10  # Doubles with every failed attempt...
+JOBS_RETRY_BACKOFF_MAX_SECONDS = 3600  # ...up to this
+JOBS_LOCK_TIMEOUT_SECONDS = 600  # Running longer than this = worker died, requeue
+
 # Logging
 LOGGING = {
     'version': 1,
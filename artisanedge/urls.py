@@ -37,6 +37,7 @@ urlpatterns = [
     path('orders/', include('orders.urls')),
     path('collaborations/', include('collaborations.urls')),
     path('marketplace/', include('artisanapp.urls')),
+    path('jobs/', include('jobs.urls')),
 ]
 
 # Serve media files during development
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artisans', '0002_artisanteam_artisanprofile_team_artisanteammember'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artisanprofile',
+            index=models.Index(fields=['rating', 'id'], name='artisans_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artisanprofile',
+            index=models.Index(fields=['created_at', 'id'], name='artisans_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artisanprofile',
+            index=models.Index(fields=['total_sales', 'id'], name='artisans_sales_idx'),
+        ),
+    ]
@@ -86,6 +86,13 @@ class ArtisanProfile(models.Model):
         ('other', 'Other'),
     )
     
+    # Supported listing sorts: (key, label, ordering); see core.sorting
+    SORT_CHOICES = (
+        ('rating', 'Highest Rated', ('-rating', '-id')),
+        ('newest', 'Newest', ('-created_at', '-id')),
+        ('best_selling', 'Most Sales', ('-total_sales', '-id')),
+    )
+    
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='artisan_profile')
     team = models.ForeignKey(ArtisanTeam, on_delete=models.SET_NULL, null=True, blank=True, related_name='artisans')
     craft_type = models.CharField(max_length=50, choices=CRAFT_CATEGORIES)
@@ -106,6 +113,11 @@ class ArtisanProfile(models.Model):
         db_table = 'artisans_profile'
         verbose_name = 'Artisan Profile'
         verbose_name_plural = 'Artisan Profiles'
+        indexes = [
+            models.Index(fields=['rating', 'id'], name='artisans_rating_idx'),
+            models.Index(fields=['created_at', 'id'], name='artisans_created_idx'),
+            models.Index(fields=['total_sales', 'id'], name='artisans_sales_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.get_craft_type_display()}"
@@ -3,6 +3,7 @@ from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from .models import ArtisanProfile
 from products.models import Product
+from core.sorting import resolve_sort, sort_options
 
 
 @require_http_methods(["GET"])
@@ -10,7 +11,7 @@ def artisans_list_view(request):
     """
     List all artisans with search and filter
     """
-    artisans = ArtisanProfile.objects.all()
+    artisans = ArtisanProfile.objects.select_related('user')
     
     # Search by craft type or name
     search = request.GET.get('search', '')
@@ -26,14 +27,16 @@ def artisans_list_view(request):
     if featured_only:
         artisans = artisans.filter(is_featured=True)
     
-    # Sort options
-    sort = request.GET.get('sort', '-rating')
-    artisans = artisans.order_by(sort)
+    # Sort options (whitelisted, index-backed)
+    sort, _, ordering = resolve_sort(ArtisanProfile.SORT_CHOICES, request.GET.get('sort'))
+    artisans = artisans.order_by(*ordering)
     
     context = {
         'artisans': artisans,
         'search': search,
         'featured_only': featured_only,
+        'sort': sort,
+        'sort_options': sort_options(ArtisanProfile.SORT_CHOICES),
     }
     
     return render(request, 'artisans/artisans_list.html', context)
@@ -45,15 +48,19 @@ def artisan_detail_view(request, artisan_id):
     Artisan detail page
     """
     try:
-        artisan = ArtisanProfile.objects.get(id=artisan_id)
+        artisan = ArtisanProfile.objects.select_related('user').get(id=artisan_id)
     except ArtisanProfile.DoesNotExist:
         return render(request, '404.html', status=404)
     
-    products = Product.objects.filter(artisan=artisan, status='active')
+    # Six newest products; the seventh only tells us whether to link to the rest
+    products = list(
+        Product.objects.filter(artisan=artisan, status='active').select_related('category')[:7]
+    )
     
     context = {
         'artisan': artisan,
-        'products': products,
+        'products': products[:6],
+        'has_more_products': len(products) > 6,
     }
     
     return render(request, 'artisans/artisan_detail.html', context)
@@ -65,24 +72,26 @@ def artisan_products_view(request, artisan_id):
     List products by a specific artisan
     """
     try:
-        artisan = ArtisanProfile.objects.get(id=artisan_id)
+        artisan = ArtisanProfile.objects.select_related('user').get(id=artisan_id)
     except ArtisanProfile.DoesNotExist:
         return render(request, '404.html', status=404)
     
-    products = Product.objects.filter(artisan=artisan, status='active')
+    products = Product.objects.filter(artisan=artisan, status='active').select_related('category', 'artisan__user')
     
     # Filtering
     category = request.GET.get('category')
     if category:
         products = products.filter(category__id=category)
     
-    # Sorting
-    sort = request.GET.get('sort', '-created_at')
-    products = products.order_by(sort)
+    # Sorting (whitelisted, index-backed)
+    sort, _, ordering = resolve_sort(Product.SORT_CHOICES, request.GET.get('sort'))
+    products = products.order_by(*ordering)
     
     context = {
         'artisan': artisan,
         'products': products,
+        'sort': sort,
+        'sort_options': sort_options(Product.SORT_CHOICES),
     }
     
     return render(request, 'artisans/artisan_products.html', context)
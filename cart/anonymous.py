@@ -0,0 +1,123 @@
+"""
+Anonymous carts in a signed cookie
+
+Visitors who are not signed in keep their cart in a signed cookie
+({product id: quantity}), so browsing and adding to cart writes nothing to
+the database. Signing in or signing up folds that cart into the user's
+persistent Cart with one bulk upsert (`merge_anonymous_cart`), adding
+quantities to lines the user already had, capped at available stock.
+"""
+
+import json
+
+from django.conf import settings
+
+from products.models import Product
+from .summary import CartSummary, invalidate_cart_summary
+
+
+COOKIE_SALT = 'cart.anonymous'
+
+
+def read_anonymous_cart(request):
+    """{product id: quantity} from the cart cookie ({} if absent or tampered with)."""
+    raw = request.get_signed_cookie(settings.ANONYMOUS_CART_COOKIE, default=None, salt=COOKIE_SALT)
+    if not raw:
+        return {}
+    try:
+        lines = json.loads(raw)
+        return {int(product_id): int(quantity) for product_id, quantity in lines.items() if int(quantity) > 0}
+    except (ValueError, TypeError, AttributeError):
+        return {}
+
+
+def save_anonymous_cart(response, lines):
+    """Write `lines` to the cart cookie on `response` (or drop the cookie when empty)."""
+    if not lines:
+        forget_anonymous_cart(response)
+        return response
+    # Keep the newest lines if the cookie would grow past the cap
+    kept = dict(list(lines.items())[-settings.ANONYMOUS_CART_MAX_LINES:])
+    response.set_signed_cookie(
+        settings.ANONYMOUS_CART_COOKIE,
+        json.dumps(kept, separators=(',', ':')),
+        salt=COOKIE_SALT,
+        max_age=settings.ANONYMOUS_CART_MAX_AGE,
+        httponly=True,
+        samesite='Lax',
+    )
+    return response
+
+
+def forget_anonymous_cart(response):
+    response.delete_cookie(settings.ANONYMOUS_CART_COOKIE, samesite='Lax')
+    return response
+
+
+def anonymous_cart_lines(request, lines=None):
+    """
+    The cookie cart (or `lines` about to be written to it) as CartLines of
+    unsaved CartItems (one product query). Products that are gone or no
+    longer for sale are left out and removed from `lines`, so writing
+    `lines` back drops them from the cookie.
+    """
+    from .models import CartItem, CartLines
+
+    if lines is None:
+        lines = read_anonymous_cart(request)
+    products = (
+        Product.objects.filter(pk__in=lines, status='active').select_related('artisan__user', 'team').in_bulk()
+    )
+    for product_id in set(lines) - set(products):
+        del lines[product_id]
+    return CartLines([
+        CartItem(product=products[product_id], quantity=quantity)
+        for product_id, quantity in lines.items()
+        if product_id in products
+    ])
+
+
+def anonymous_cart_summary(request):
+    """Badge counts straight from the cookie; the total needs prices, so it is None."""
+    lines = read_anonymous_cart(request)
+    return CartSummary(sum(lines.values()), len(lines), None)
+
+
+def merge_anonymous_cart(request, response, user):
+    """
+    Fold the cookie cart into `user`'s Cart and clear the cookie on
+    `response`. Returns the number of lines merged.
+    """
+    from .models import Cart, CartItem
+
+    lines = read_anonymous_cart(request)
+    if not lines:
+        return 0
+    forget_anonymous_cart(response)
+
+    stock = dict(
+        Product.objects.filter(pk__in=lines, status='active', quantity_in_stock__gt=0)
+        .values_list('pk', 'quantity_in_stock')
+    )
+    if not stock:
+        return 0
+    cart, _ = Cart.objects.get_or_create(user=user)
+    existing = dict(cart.items.filter(product_id__in=stock).values_list('product_id', 'quantity'))
+    merged = [
+        CartItem(
+            cart=cart,
+            product_id=product_id,
+            quantity=max(existing.get(product_id, 0), min(existing.get(product_id, 0) + quantity, stock[product_id])),
+        )
+        for product_id, quantity in lines.items()
+        if product_id in stock
+    ]
+    # Insert new lines and overwrite quantities of existing ones in one statement
+    CartItem.objects.bulk_create(
+        merged,
+        update_conflicts=True,
+        unique_fields=['cart', 'product'],
+        update_fields=['quantity', 'updated_at'],
+    )
+    invalidate_cart_summary(user.pk)
+    return len(merged)
@@ -0,0 +1,135 @@
+"""
+Multi-line cart edits in one request
+
+The cart page posts every changed line at once as JSON:
+
+    {"items": [{"product_id": 12, "quantity": 3}, {"product_id": 7, "quantity": 0}]}
+
+A quantity of 0 removes the line. Stock for all lines is checked against
+one query; if any line fails, nothing is applied and the errors are
+returned per product. Otherwise the changes are written with one
+`bulk_update` and one DELETE. The response carries the new line totals and
+cart summary so the page can update in place.
+"""
+
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from products.models import Product
+from products.templatetags.currency_filters import usd_to_inr
+
+
+class CartChangesError(ValueError):
+    """The request body is not a valid list of cart changes."""
+
+
+def parse_changes(body):
+    """{product id: quantity} from a JSON request body (later entries win)."""
+    try:
+        data = json.loads(body or b'{}')
+        items = data['items']
+        changes = {int(item['product_id']): int(item['quantity']) for item in items}
+    except (ValueError, TypeError, KeyError):
+        raise CartChangesError('Expected {"items": [{"product_id": ..., "quantity": ...}, ...]}.')
+    if not changes:
+        raise CartChangesError('No changes given.')
+    if len(changes) > settings.CART_BULK_MAX_CHANGES:
+        raise CartChangesError(f'At most {settings.CART_BULK_MAX_CHANGES} lines can be changed at once.')
+    if any(quantity < 0 for quantity in changes.values()):
+        raise CartChangesError('Quantities cannot be negative.')
+    return changes
+
+
+def _stock_error(product_id, quantity, stock):
+    if quantity > stock:
+        return {'product_id': product_id, 'error': f'Only {stock} items available.'}
+    return None
+
+
+def apply_cart_changes(cart, changes):
+    """
+    Apply `changes` to a persistent cart. Returns a list of per-line errors
+    (nothing is written when it is not empty).
+    """
+    # One query: the affected lines with their products' stock
+    items = {
+        item.product_id: item
+        for item in cart.items.filter(product_id__in=changes).select_related('product')
+    }
+    errors = []
+    for product_id, quantity in changes.items():
+        item = items.get(product_id)
+        if item is None:
+            errors.append({'product_id': product_id, 'error': 'Product not in cart.'})
+        elif quantity:
+            error = _stock_error(product_id, quantity, item.product.quantity_in_stock)
+            if error:
+                errors.append(error)
+    if errors:
+        return errors
+
+    now = timezone.now()
+    updated, removed = [], []
+    for product_id, quantity in changes.items():
+        item = items[product_id]
+        if not quantity:
+            removed.append(item.pk)
+        elif item.quantity != quantity:
+            item.quantity = quantity
+            item.updated_at = now
+            updated.append(item)
+    with transaction.atomic():
+        if updated:
+            cart.items.bulk_update(updated, ['quantity', 'updated_at'])
+        if removed:
+            # Through cart.items so the delete signal sees the cart without a query
+            cart.items.filter(pk__in=removed).delete()
+    return []
+
+
+def apply_anonymous_changes(lines, changes):
+    """
+    Apply `changes` to a cookie cart ({product id: quantity}) in place.
+    Returns per-line errors, like apply_cart_changes.
+    """
+    stock = dict(Product.objects.filter(pk__in=changes).values_list('pk', 'quantity_in_stock'))
+    errors = []
+    for product_id, quantity in changes.items():
+        if product_id not in lines:
+            errors.append({'product_id': product_id, 'error': 'Product not in cart.'})
+        elif quantity:
+            error = _stock_error(product_id, quantity, stock.get(product_id, 0))
+            if error:
+                errors.append(error)
+    if errors:
+        return errors
+    for product_id, quantity in changes.items():
+        if quantity:
+            lines[product_id] = quantity
+        else:
+            del lines[product_id]
+    return []
+
+
+def cart_payload(lines):
+    """JSON body describing CartLines: each line's total and the cart summary."""
+    return {
+        'items': [
+            {
+                'product_id': item.product_id,
+                'quantity': item.quantity,
+                'line_total': str(item.get_total_price()),
+                'line_total_display': usd_to_inr(item.get_total_price()),
+            }
+            for item in lines
+        ],
+        'summary': {
+            'item_count': lines.item_count,
+            'unique_count': lines.unique_count,
+            'total': str(lines.total),
+            'total_display': usd_to_inr(lines.total),
+        },
+    }
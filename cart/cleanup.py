@@ -0,0 +1,112 @@
+"""
+Abandoned-cart cleanup
+
+Carts are kept until something removes them, so without cleanup the cart
+tables only grow. `manage.py cleanup_carts` (run it from cron) removes:
+
+- stale carts: neither the cart nor any of its items changed in
+  CART_STALE_DAYS days, including carts that were never filled;
+- items for products that are no longer active (inactive or discontinued),
+  which could not be checked out anyway.
+
+Rows are deleted in batches of CART_CLEANUP_BATCH_SIZE ids, each batch in
+its own short statement, so a large backlog never holds long locks on the
+tables the cart pages write to. Cart items are loaded with their carts
+before they are deleted, so the summary-invalidation signal
+(cart.signals) costs no extra query per row.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models.deletion import Collector
+from django.utils import timezone
+
+from .models import Cart, CartItem
+
+
+def stale_carts(older_than_days=None):
+    """Carts with no activity (cart or item updates) in `older_than_days` days."""
+    days = older_than_days if older_than_days is not None else settings.CART_STALE_DAYS
+    cutoff = timezone.now() - timedelta(days=days)
+    return Cart.objects.filter(updated_at__lt=cutoff).exclude(items__updated_at__gte=cutoff)
+
+
+def unavailable_items():
+    """Cart items whose product is no longer for sale."""
+    return CartItem.objects.exclude(product__status='active')
+
+
+def _batches(queryset, batch_size):
+    """Successive lists of up to `batch_size` ids still matched by `queryset`."""
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+
+
+def _delete_items(ids):
+    # QuerySet.delete() drops select_related, so collect the loaded rows instead
+    items = list(CartItem.objects.filter(pk__in=ids).select_related('cart'))
+    collector = Collector(using=CartItem.objects.db)
+    collector.collect(items)
+    deleted, _ = collector.delete()
+    return deleted
+
+
+def purge_unavailable_items(batch_size=None, pause=0, dry_run=False):
+    """Delete cart items for inactive or discontinued products. Returns the count."""
+    if dry_run:
+        return unavailable_items().count()
+    deleted = 0
+    for ids in _batches(unavailable_items(), batch_size or settings.CART_CLEANUP_BATCH_SIZE):
+        deleted += _delete_items(ids)
+        time.sleep(pause)
+    return deleted
+
+
+def purge_stale_carts(older_than_days=None, batch_size=None, pause=0, dry_run=False):
+    """
+    Delete stale carts and their items. Returns (carts, items) deleted (or
+    that would be, with `dry_run`).
+    """
+    carts = stale_carts(older_than_days)
+    if dry_run:
+        return carts.count(), CartItem.objects.filter(cart__in=carts).count()
+    batch_size = batch_size or settings.CART_CLEANUP_BATCH_SIZE
+    deleted_carts = deleted_items = 0
+    for ids in _batches(carts, batch_size):
+        # Re-check staleness on every delete: a shopper may come back mid-run
+        still_stale = stale_carts(older_than_days).filter(pk__in=ids)
+        for item_ids in _batches(CartItem.objects.filter(cart__in=still_stale), batch_size):
+            deleted_items += _delete_items(item_ids)
+        _, per_model = still_stale.delete()
+        deleted_carts += per_model.get(Cart._meta.label, 0)
+        deleted_items += per_model.get(CartItem._meta.label, 0)
+        time.sleep(pause)
+    return deleted_carts, deleted_items
+
+
+def table_sizes():
+    """Row counts of the cart tables."""
+    return {'carts': Cart.objects.count(), 'items': CartItem.objects.count()}
+
+
+def compact_cart_tables():
+    """
+    Give space freed by deletes back to the database (VACUUM). Returns False
+    on backends where there is nothing to do.
+    """
+    tables = [Cart._meta.db_table, CartItem._meta.db_table]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f"VACUUM (ANALYZE) {', '.join(tables)}")
+        elif connection.vendor == 'sqlite':
+            # SQLite can only vacuum the whole file
+            cursor.execute('VACUUM')
+        else:
+            return False
+    return True
@@ -0,0 +1,20 @@
+from django.utils.functional import SimpleLazyObject
+
+from .anonymous import anonymous_cart_summary
+from .summary import get_cart_summary
+
+
+def cart_summary(request):
+    """
+    `cart_summary` (item_count, unique_count, total) for the navbar badge.
+
+    Resolved lazily, so pages that never render it cost nothing, and served
+    from the cache otherwise. Anonymous visitors get counts from their cart
+    cookie (no total).
+    """
+    user = getattr(request, 'user', None)
+    if user is None:
+        return {}
+    if not user.is_authenticated:
+        return {'cart_summary': SimpleLazyObject(lambda: anonymous_cart_summary(request))}
+    return {'cart_summary': SimpleLazyObject(lambda: get_cart_summary(user))}
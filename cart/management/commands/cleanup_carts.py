@@ -0,0 +1,53 @@
+"""
+Delete abandoned carts and cart items for products no longer for sale
+(see cart.cleanup). Meant to run from cron, e.g. nightly.
+
+Usage:
+    python manage.py cleanup_carts [--days 90] [--batch-size 1000] [--pause 0.1] [--dry-run] [--vacuum]
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from cart.cleanup import compact_cart_tables, purge_stale_carts, purge_unavailable_items, table_sizes
+
+
+class Command(BaseCommand):
+    help = 'Delete stale carts and items for inactive products, in batches, and report rows reclaimed.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.CART_STALE_DAYS,
+                            help=f'Delete carts untouched for this many days (default {settings.CART_STALE_DAYS}).')
+        parser.add_argument('--batch-size', type=int, default=settings.CART_CLEANUP_BATCH_SIZE,
+                            help=f'Rows deleted per statement (default {settings.CART_CLEANUP_BATCH_SIZE}).')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to sleep between batches, to spread the load.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be deleted.')
+        parser.add_argument('--vacuum', action='store_true',
+                            help='Compact the database afterwards (VACUUM) so freed space is returned.')
+
+    def handle(self, *args, **options):
+        before = table_sizes()
+        batch = dict(batch_size=options['batch_size'], pause=options['pause'], dry_run=options['dry_run'])
+        unavailable = purge_unavailable_items(**batch)
+        carts, items = purge_stale_carts(options['days'], **batch)
+
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(f'{verb} {unavailable} item(s) for inactive or discontinued products.')
+        self.stdout.write(
+            f"{verb} {carts} cart(s) untouched for {options['days']} day(s), with {items} item(s)."
+        )
+        if options['dry_run']:
+            return
+
+        after = table_sizes()
+        self.stdout.write(
+            f"cart_cart: {before['carts']} -> {after['carts']} row(s), "
+            f"cart_cartitem: {before['items']} -> {after['items']} row(s)"
+        )
+        if options['vacuum']:
+            if compact_cart_tables():
+                self.stdout.write('Compacted the cart tables.')
+            else:
+                self.stdout.write('VACUUM is not supported on this database; skipped.')
+        self.stdout.write(self.style.SUCCESS(f'Reclaimed {unavailable + carts + items} row(s).'))
@@ -1,8 +1,32 @@
-from django.db import models
+from decimal import Decimal
+from django.db import models, transaction
 from accounts.models import User
 from products.models import Product
 from django.core.validators import MinValueValidator
 
+
+class CartLines:
+    """
+    A cart's items loaded once (see Cart.load_lines), with totals computed
+    from those rows in memory. Iterates like the list of items.
+    """
+    
+    def __init__(self, items):
+        self.items = items
+        self.total = sum((item.get_total_price() for item in items), Decimal('0'))
+        self.item_count = sum(item.quantity for item in items)
+        self.unique_count = len(items)
+    
+    def __iter__(self):
+        return iter(self.items)
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __bool__(self):
+        return bool(self.items)
+
+
 class Cart(models.Model):
     """
     Shopping cart for customers
@@ -19,21 +43,43 @@ class Cart(models.Model):
     def __str__(self):
         return f"Cart for {self.user.get_full_name()}"
     
+    def load_lines(self):
+        """
+        All items with their products (and the products' artisan and team,
+        for display) in one query, plus totals computed from that result.
+        Items for products no longer for sale are left out (cleanup_carts
+        deletes them).
+        """
+        items = (
+            self.items.filter(product__status='active')
+            .select_related('product__artisan__user', 'product__team')
+            .order_by('id')
+        )
+        return CartLines(list(items))
+    
     def get_total_price(self):
         """Calculate total price of all items in cart"""
-        return sum(item.get_total_price() for item in self.items.all())
+        return sum(item.get_total_price() for item in self.items.select_related('product'))
     
     def get_item_count(self):
         """Get total number of items in cart"""
-        return sum(item.quantity for item in self.items.all())
+        return self.items.aggregate(count=models.Sum('quantity'))['count'] or 0
     
     def get_unique_product_count(self):
         """Get number of unique products in cart"""
         return self.items.count()
     
     def clear(self):
-        """Remove all items from cart"""
+        """
+        Remove all items from cart: one SELECT and one DELETE whatever the
+        number of items (loaded through cart.items, the delete signals need
+        no query per row). The owner's cached summary is dropped again
+        once the surrounding transaction commits.
+        """
+        from .summary import invalidate_cart_summary
+
         self.items.all().delete()
+        transaction.on_commit(lambda: invalidate_cart_summary(self.user_id))
 
 
 class CartItem(models.Model):
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CartItem
+from .summary import invalidate_cart_summary
+
+
+@receiver(post_save, sender=CartItem)
+@receiver(post_delete, sender=CartItem)
+def drop_cart_summary(sender, instance, **kwargs):
+    """Any change to a cart line makes the owner's cached summary stale."""
+    # Items loaded through cart.items already carry their cart (no query)
+    invalidate_cart_summary(instance.cart.user_id)
@@ -0,0 +1,70 @@
+"""
+Cart summary for the navbar badge
+
+Item count, distinct product count and total for a user's cart, computed
+with one aggregate query over cart items joined to products, and cached
+per user. CartItem saves and deletes drop the entry (see cart.signals),
+as does Cart.clear() once its transaction commits;
+price edits on products are picked up when the entry expires
+(CART_SUMMARY_CACHE_SECONDS), so the badge total is for display only -
+checkout always prices from the product rows.
+"""
+
+from collections import namedtuple
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, DecimalField, F, Sum
+from django.db.models.functions import Coalesce
+
+
+CART_SUMMARY_PREFIX = 'cart_summary'
+
+CartSummary = namedtuple('CartSummary', 'item_count unique_count total')
+EMPTY_SUMMARY = CartSummary(0, 0, Decimal('0.00'))
+
+
+def summary_key(user_id):
+    return f'{CART_SUMMARY_PREFIX}:{user_id}'
+
+
+def compute_cart_summary(user_id):
+    """One aggregate query over the user's cart items and their products."""
+    from .models import CartItem
+
+    line_total = F('quantity') * Coalesce('product__selling_price', 'product__price')
+    totals = CartItem.objects.filter(cart__user_id=user_id, product__status='active').aggregate(
+        item_count=Coalesce(Sum('quantity'), 0),
+        unique_count=Count('id'),
+        total=Sum(line_total, output_field=DecimalField(max_digits=12, decimal_places=2)),
+    )
+    return CartSummary(
+        totals['item_count'],
+        totals['unique_count'],
+        Decimal(totals['total'] or 0).quantize(Decimal('0.01')),
+    )
+
+
+def get_cart_summary(user):
+    """The cached summary for `user`'s cart (EMPTY_SUMMARY for anonymous users)."""
+    if not user.is_authenticated:
+        return EMPTY_SUMMARY
+    key = summary_key(user.pk)
+    summary = cache.get(key)
+    if summary is None:
+        summary = compute_cart_summary(user.pk)
+        cache.set(key, tuple(summary), settings.CART_SUMMARY_CACHE_SECONDS)
+        return summary
+    return CartSummary(*summary)
+
+
+def store_cart_summary(user_id, lines):
+    """Cache the summary of lines already loaded (Cart.load_lines), saving the aggregate."""
+    summary = CartSummary(lines.item_count, lines.unique_count, lines.total.quantize(Decimal('0.01')))
+    cache.set(summary_key(user_id), tuple(summary), settings.CART_SUMMARY_CACHE_SECONDS)
+    return summary
+
+
+def invalidate_cart_summary(user_id):
+    cache.delete(summary_key(user_id))
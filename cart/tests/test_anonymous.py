@@ -0,0 +1,92 @@
+from decimal import Decimal
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from cart.models import Cart, CartItem
+from products.models import Product
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class AnonymousCartTests(TestCase):
+    def setUp(self):
+        artisan = ArtisanProfile.objects.create(
+            user=User.objects.create_user(username='carver', password='pass123', role='artisan'),
+            craft_type='woodwork', description='d', workshop_location='x'
+        )
+        self.spoon, self.bowl = [
+            Product.objects.create(
+                artisan=artisan, name=name, description='d', price=Decimal('10.00'),
+                quantity_in_stock=stock, image='products/placeholder.jpg'
+            )
+            for name, stock in (('Spoon', 10), ('Bowl', 3))
+        ]
+        self.user = User.objects.create_user(
+            username='shopper', email='shopper@example.com', password='pass123', role='customer'
+        )
+
+    def _add(self, product, quantity):
+        return self.client.post(reverse('add_to_cart', args=[product.id]), {'quantity': quantity})
+
+    def test_adding_to_cart_writes_nothing_to_the_database(self):
+        with CaptureQueriesContext(connection) as queries:
+            self._add(self.spoon, 2)
+            self._add(self.spoon, 1)
+            self._add(self.bowl, 1)
+        writes = [q['sql'] for q in queries if not q['sql'].lstrip().upper().startswith('SELECT')]
+        self.assertEqual(writes, [])
+        self.assertFalse(CartItem.objects.exists())
+
+        response = self.client.get(reverse('cart'))
+        self.assertEqual(response.context['item_count'], 4)
+        self.assertEqual(response.context['total_price'], Decimal('40.00'))
+        self.assertContains(response, '<span class="badge rounded-pill bg-danger">4</span>', html=True)
+
+        self.client.post(reverse('update_cart_item', args=[self.spoon.id]), {'quantity': 5})
+        self.client.post(reverse('remove_from_cart', args=[self.bowl.id]))
+        self.assertEqual(self.client.get(reverse('cart')).context['item_count'], 5)
+
+    def test_products_no_longer_for_sale_drop_out_of_the_cookie(self):
+        self._add(self.spoon, 2)
+        self._add(self.bowl, 1)
+        Product.objects.filter(pk=self.bowl.pk).update(status='discontinued')
+
+        response = self.client.get(reverse('cart'))
+        self.assertEqual([item.product for item in response.context['cart_items']], [self.spoon])
+        self.assertEqual(response.context['total_price'], Decimal('20.00'))
+        self.assertIn(settings.ANONYMOUS_CART_COOKIE, response.cookies)
+        response = self.client.get(reverse('cart'))
+        self.assertContains(response, '<span class="badge rounded-pill bg-danger">2</span>', html=True)
+
+    def test_tampered_cookie_is_ignored(self):
+        self.client.cookies[settings.ANONYMOUS_CART_COOKIE] = f'{{"{self.spoon.id}":9}}'
+        self.assertEqual(self.client.get(reverse('cart')).context['item_count'], 0)
+
+    def test_signin_merges_into_the_persistent_cart(self):
+        cart = Cart.objects.create(user=self.user)
+        CartItem.objects.create(cart=cart, product=self.bowl, quantity=2)
+        self._add(self.spoon, 2)
+        self._add(self.bowl, 2)
+
+        response = self.client.post(
+            reverse('signin') + '?next=' + reverse('cart'),
+            {'email': 'shopper@example.com', 'password': 'pass123'},
+        )
+        self.assertRedirects(response, reverse('cart'), fetch_redirect_response=False)
+        self.assertEqual(response.cookies[settings.ANONYMOUS_CART_COOKIE].value, '')
+        quantities = dict(cart.items.values_list('product__name', 'quantity'))
+        # Bowl: 2 + 2 capped at the 3 in stock
+        self.assertEqual(quantities, {'Spoon': 2, 'Bowl': 3})
+        self.assertEqual(self.client.get(reverse('cart')).context['item_count'], 5)
+
+    def test_signup_merges_into_a_new_cart(self):
+        self._add(self.spoon, 3)
+        self.client.post(reverse('signup'), {
+            'email': 'newbie@example.com', 'first_name': 'New', 'last_name': 'Bie',
+            'role': 'customer', 'password1': 'Sup3r-secret-pw', 'password2': 'Sup3r-secret-pw',
+        })
+        user = User.objects.get(email='newbie@example.com')
+        self.assertEqual(list(user.cart.items.values_list('quantity', flat=True)), [3])
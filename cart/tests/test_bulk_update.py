@@ -0,0 +1,99 @@
+import json
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from cart.models import Cart, CartItem
+from cart.summary import get_cart_summary
+from products.models import Product
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class BulkCartUpdateTests(TestCase):
+    def setUp(self):
+        artisan = ArtisanProfile.objects.create(
+            user=User.objects.create_user(username='carver', password='pass123', role='artisan'),
+            craft_type='woodwork', description='d', workshop_location='x'
+        )
+        self.products = [
+            Product.objects.create(
+                artisan=artisan, name=f'Item {i}', description='d', price=Decimal('10.00'),
+                quantity_in_stock=5, image='products/placeholder.jpg'
+            )
+            for i in range(6)
+        ]
+        self.user = User.objects.create_user(username='shopper', password='pass123', role='customer')
+        self.cart = Cart.objects.create(user=self.user)
+        for product in self.products:
+            CartItem.objects.create(cart=self.cart, product=product, quantity=1)
+        self.url = reverse('bulk_update_cart')
+
+    def _post(self, changes):
+        items = [{'product_id': product.id, 'quantity': quantity} for product, quantity in changes]
+        return self.client.post(self.url, json.dumps({'items': items}), content_type='application/json')
+
+    def _quantities(self):
+        return dict(self.cart.items.values_list('product_id', 'quantity'))
+
+    def test_updates_and_removes_lines_and_returns_summary(self):
+        self.client.login(username='shopper', password='pass123')
+        get_cart_summary(self.user)  # cached before the change
+        first, second, third = self.products[:3]
+        response = self._post([(first, 3), (second, 0), (third, 2)])
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['summary']['item_count'], 3 + 2 + 3)
+        self.assertEqual(data['summary']['unique_count'], 5)
+        self.assertEqual(data['summary']['total'], '80.00')
+        self.assertEqual(
+            {item['product_id']: item['line_total'] for item in data['items']}[first.id], '30.00'
+        )
+        quantities = self._quantities()
+        self.assertNotIn(second.id, quantities)
+        self.assertEqual((quantities[first.id], quantities[third.id]), (3, 2))
+        self.assertEqual(get_cart_summary(self.user).item_count, 8)
+
+    def test_query_count_does_not_grow_with_lines(self):
+        self.client.login(username='shopper', password='pass123')
+        with CaptureQueriesContext(connection) as few:
+            self._post([(self.products[0], 2), (self.products[1], 0)])
+        with CaptureQueriesContext(connection) as many:
+            self._post([(product, 3) for product in self.products[2:]] + [(self.products[0], 0)])
+        self.assertEqual(len(few), len(many))
+
+    def test_any_invalid_line_applies_nothing(self):
+        self.client.login(username='shopper', password='pass123')
+        other = Product.objects.create(
+            artisan=self.products[0].artisan, name='Other', description='d', price=Decimal('10.00'),
+            quantity_in_stock=5, image='products/placeholder.jpg'
+        )
+        response = self._post([(self.products[0], 2), (self.products[1], 6), (other, 1)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            {error['product_id'] for error in response.json()['errors']}, {self.products[1].id, other.id}
+        )
+        self.assertEqual(set(self._quantities().values()), {1})
+
+    def test_malformed_body_is_rejected(self):
+        self.client.login(username='shopper', password='pass123')
+        for body in ('not json', '{}', '{"items": [{"product_id": 1}]}', '{"items": []}'):
+            response = self.client.post(self.url, body, content_type='application/json')
+            self.assertEqual(response.status_code, 400, body)
+        self.assertEqual(self._post([(self.products[0], -1)]).status_code, 400)
+
+    def test_anonymous_cart_is_updated_in_the_cookie(self):
+        first, second = self.products[:2]
+        for product in (first, second):
+            self.client.post(reverse('add_to_cart', args=[product.id]), {'quantity': 1})
+
+        response = self._post([(first, 4), (second, 0)])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['summary']['item_count'], 4)
+        self.assertEqual(self.client.get(reverse('cart')).context['item_count'], 4)
+        self.assertEqual(self._quantities()[first.id], 1)
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from cart import cleanup
+from cart.cleanup import purge_stale_carts, purge_unavailable_items
+from cart.models import Cart, CartItem
+from products.models import Product
+
+
+class CartCleanupTests(TestCase):
+    def setUp(self):
+        artisan = ArtisanProfile.objects.create(
+            user=User.objects.create_user(username='carver', password='pass123', role='artisan'),
+            craft_type='woodwork', description='d', workshop_location='x'
+        )
+        self.active, self.retired = [
+            Product.objects.create(
+                artisan=artisan, name=name, description='d', price=Decimal('10.00'),
+                quantity_in_stock=5, image='products/placeholder.jpg', status=status
+            )
+            for name, status in (('Spoon', 'active'), ('Bowl', 'discontinued'))
+        ]
+        self.carts = []
+        for i in range(5):
+            user = User.objects.create_user(username=f'shopper{i}', password='pass123', role='customer')
+            cart = Cart.objects.create(user=user)
+            CartItem.objects.create(cart=cart, product=self.active, quantity=1)
+            self.carts.append(cart)
+        self.old = timezone.now() - timedelta(days=120)
+
+    def _age(self, carts, items_too=True):
+        Cart.objects.filter(pk__in=[cart.pk for cart in carts]).update(updated_at=self.old)
+        if items_too:
+            CartItem.objects.filter(cart__in=carts).update(updated_at=self.old)
+
+    def test_stale_carts_are_deleted_in_batches(self):
+        self._age(self.carts[:3])
+        self._age(self.carts[3:4], items_too=False)  # an item changed recently
+
+        self.assertEqual(purge_stale_carts(90, dry_run=True), (3, 3))
+        self.assertEqual(purge_stale_carts(90, batch_size=2), (3, 3))
+        self.assertEqual(
+            set(Cart.objects.values_list('pk', flat=True)), {self.carts[3].pk, self.carts[4].pk}
+        )
+
+    def test_carts_used_again_mid_run_are_kept(self):
+        self._age(self.carts[:2])
+        batches = cleanup._batches
+
+        def shopper_returns(queryset, batch_size):
+            for ids in batches(queryset, batch_size):
+                if queryset.model is Cart:
+                    # Between reading the batch and deleting it
+                    CartItem.objects.create(cart=self.carts[0], product=self.retired, quantity=1)
+                yield ids
+
+        with mock.patch('cart.cleanup._batches', shopper_returns):
+            self.assertEqual(purge_stale_carts(90), (1, 1))
+        self.assertEqual(CartItem.objects.filter(cart=self.carts[0]).count(), 2)
+        self.assertFalse(Cart.objects.filter(pk=self.carts[1].pk).exists())
+
+    def test_delete_queries_do_not_grow_per_row(self):
+        self._age(self.carts[:1])
+        with CaptureQueriesContext(connection) as one:
+            purge_stale_carts(90)
+        self._age(self.carts[1:])
+        with CaptureQueriesContext(connection) as four:
+            purge_stale_carts(90)
+        self.assertEqual(len(one), len(four))
+
+    def test_items_for_unavailable_products_are_purged(self):
+        for cart in self.carts[:2]:
+            CartItem.objects.create(cart=cart, product=self.retired, quantity=1)
+        self.assertEqual(purge_unavailable_items(batch_size=1), 2)
+        self.assertFalse(CartItem.objects.filter(product=self.retired).exists())
+        self.assertEqual(CartItem.objects.count(), 5)
+
+    def test_command_reports_rows_reclaimed(self):
+        CartItem.objects.create(cart=self.carts[4], product=self.retired, quantity=1)
+        self._age(self.carts[:2])
+        out = StringIO()
+        call_command('cleanup_carts', '--days', '90', stdout=out)
+        self.assertIn('Deleted 1 item(s) for inactive', out.getvalue())
+        self.assertIn('Deleted 2 cart(s)', out.getvalue())
+        self.assertIn('Reclaimed 5 row(s).', out.getvalue())
+
+    def test_viewing_the_cart_does_not_create_one(self):
+        User.objects.create_user(username='browser', password='pass123', role='customer')
+        self.client.login(username='browser', password='pass123')
+        response = self.client.get(reverse('cart'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Cart.objects.filter(user__username='browser').exists())
+        self.client.post(reverse('clear_cart'))
+        self.client.post(reverse('remove_from_cart', args=[self.active.id]))
+        self.assertEqual(self.client.get(reverse('cart')).context['item_count'], 0)
@@ -0,0 +1,103 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from cart.models import Cart, CartItem
+from cart.summary import get_cart_summary
+from products.models import Product
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class CartSummaryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='badger', password='pass123', role='customer')
+        artisan = ArtisanProfile.objects.create(
+            user=User.objects.create_user(username='potter', password='pass123', role='artisan'),
+            craft_type='pottery', description='d', workshop_location='x'
+        )
+        self.products = [
+            Product.objects.create(
+                artisan=artisan, name=f'Pot {i}', description='d', price=Decimal('10.00') * (i + 1),
+                quantity_in_stock=10, image='products/placeholder.jpg'
+            )
+            for i in range(3)
+        ]
+        self.cart = Cart.objects.create(user=self.user)
+        for i, product in enumerate(self.products):
+            CartItem.objects.create(cart=self.cart, product=product, quantity=i + 1)
+
+    def test_summary_is_one_query_then_cached(self):
+        with CaptureQueriesContext(connection) as queries:
+            summary = get_cart_summary(self.user)
+        self.assertEqual(len(queries), 1)
+        # 1 x 10 + 2 x 20 + 3 x 30
+        self.assertEqual(summary, (6, 3, Decimal('140.00')))
+        with self.assertNumQueries(0):
+            self.assertEqual(get_cart_summary(self.user), summary)
+
+    def test_cart_item_changes_invalidate(self):
+        get_cart_summary(self.user)
+        item = self.cart.items.get(product=self.products[0])
+        item.quantity = 4
+        item.save()
+        self.assertEqual(get_cart_summary(self.user).item_count, 9)
+        # A fixed SELECT + DELETE, whatever the number of items
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as queries:
+            self.cart.clear()
+        self.assertEqual([query['sql'].split()[0] for query in queries], ['SELECT', 'DELETE'])
+        self.assertEqual(get_cart_summary(self.user), (0, 0, Decimal('0.00')))
+
+    def test_navbar_badge_from_context_processor(self):
+        self.client.login(username='badger', password='pass123')
+        self.client.get(reverse('about'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('about'))
+        self.assertContains(response, '<span class="badge rounded-pill bg-danger">6</span>', html=True)
+        self.assertFalse(any('cart_cartitem' in query['sql'] for query in queries))
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class CartLoadingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='loader', password='pass123', role='customer')
+        self.artisan = ArtisanProfile.objects.create(
+            user=User.objects.create_user(username='weaver', password='pass123', role='artisan'),
+            craft_type='textiles', description='d', workshop_location='x'
+        )
+        self.cart = Cart.objects.create(user=self.user)
+        self.client.login(username='loader', password='pass123')
+
+    def _fill(self, count):
+        for i in range(count):
+            product = Product.objects.create(
+                artisan=self.artisan, name=f'Rug {count}-{i}', description='d', price=Decimal('15.00'),
+                quantity_in_stock=10, image='products/placeholder.jpg'
+            )
+            CartItem.objects.create(cart=self.cart, product=product, quantity=2)
+
+    def _cart_page_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('cart'))
+        self.assertEqual(response.context['item_count'], 2 * self.cart.items.count())
+        return len(queries)
+
+    def test_load_lines_is_one_query_with_totals(self):
+        self._fill(3)
+        with self.assertNumQueries(1):
+            lines = self.cart.load_lines()
+            names = [item.product.artisan.user.username for item in lines]
+        self.assertEqual(names, ['weaver'] * 3)
+        self.assertEqual((lines.total, lines.item_count, lines.unique_count), (Decimal('90.00'), 6, 3))
+
+    def test_cart_page_query_count_does_not_grow_with_items(self):
+        self._fill(2)
+        small = self._cart_page_queries()
+        self._fill(10)
+        self.assertEqual(self._cart_page_queries(), small)
@@ -6,5 +6,6 @@ urlpatterns = [
     path('add/<int:product_id>/', views.add_to_cart_view, name='add_to_cart'),
     path('remove/<int:product_id>/', views.remove_from_cart_view, name='remove_from_cart'),
     path('update/<int:product_id>/', views.update_cart_item_view, name='update_cart_item'),
+    path('bulk-update/', views.bulk_update_cart_view, name='bulk_update_cart'),
     path('clear/', views.clear_cart_view, name='clear_cart'),
 ]
@@ -1,31 +1,50 @@
+from django.http import JsonResponse
 from django.shortcuts import render, redirect
 from django.views.decorators.http import require_http_methods
 from django.contrib import messages
-from accounts.decorators import login_required
 from products.models import Product
-from .models import Cart, CartItem
+from .bulk import CartChangesError, apply_anonymous_changes, apply_cart_changes, cart_payload, parse_changes
+from .anonymous import anonymous_cart_lines, forget_anonymous_cart, read_anonymous_cart, save_anonymous_cart
+from .models import Cart, CartItem, CartLines
+from .summary import invalidate_cart_summary, store_cart_summary
 
 
-@login_required
 @require_http_methods(["GET"])
 def cart_view(request):
     """
-    View shopping cart
+    View shopping cart (anonymous visitors see their cookie cart)
     """
-    cart, created = Cart.objects.get_or_create(user=request.user)
-    cart_items = cart.items.all()
+    if not request.user.is_authenticated:
+        lines = read_anonymous_cart(request)
+        stored = len(lines)
+        cart_items = anonymous_cart_lines(request, lines)
+        response = render(request, 'cart/cart.html', {
+            'cart': None,
+            'cart_items': cart_items,
+            'total_price': cart_items.total,
+            'item_count': cart_items.item_count,
+        })
+        if len(lines) < stored:
+            # Products no longer for sale drop out of the cookie too
+            save_anonymous_cart(response, lines)
+        return response
+    
+    # Viewing never creates a cart; the first add to cart does
+    cart = Cart.objects.filter(user=request.user).first()
+    cart_items = cart.load_lines() if cart else CartLines([])
+    # The navbar badge on this page can use the totals just computed
+    store_cart_summary(request.user.pk, cart_items)
     
     context = {
         'cart': cart,
         'cart_items': cart_items,
-        'total_price': cart.get_total_price(),
-        'item_count': cart.get_item_count(),
+        'total_price': cart_items.total,
+        'item_count': cart_items.item_count,
     }
     
     return render(request, 'cart/cart.html', context)
 
 
-@login_required
 @require_http_methods(["POST"])
 def add_to_cart_view(request, product_id):
     """
@@ -51,6 +70,15 @@ def add_to_cart_view(request, product_id):
         messages.error(request, f'Only {product.quantity_in_stock} items available.')
         return redirect('product_detail', product_id=product.id)
     
+    next_page = request.POST.get('next', 'cart')
+    
+    if not request.user.is_authenticated:
+        # Kept in a signed cookie until sign-in (no database writes)
+        lines = read_anonymous_cart(request)
+        lines[product.id] = lines.pop(product.id, 0) + quantity
+        messages.success(request, f'{product.name} added to cart!')
+        return save_anonymous_cart(redirect(next_page), lines)
+    
     cart, created = Cart.objects.get_or_create(user=request.user)
     cart_item, item_created = CartItem.objects.get_or_create(
         cart=cart,
@@ -68,17 +96,24 @@ def add_to_cart_view(request, product_id):
     messages.success(request, f'{product.name} added to cart!')
     
     # Redirect to next page or cart
-    next_page = request.POST.get('next', 'cart')
     return redirect(next_page)
 
 
-@login_required
 @require_http_methods(["POST"])
 def remove_from_cart_view(request, product_id):
     """
     Remove product from cart
     """
-    cart = Cart.objects.get(user=request.user)
+    if not request.user.is_authenticated:
+        lines = read_anonymous_cart(request)
+        lines.pop(product_id, None)
+        messages.success(request, 'Item removed from cart.')
+        return save_anonymous_cart(redirect('cart'), lines)
+    
+    cart = Cart.objects.filter(user=request.user).first()
+    if cart is None:
+        messages.error(request, 'Product not found.')
+        return redirect('cart')
     
     try:
         product = Product.objects.get(id=product_id)
@@ -90,15 +125,21 @@ def remove_from_cart_view(request, product_id):
     return redirect('cart')
 
 
-@login_required
 @require_http_methods(["POST"])
 def update_cart_item_view(request, product_id):
     """
     Update quantity of product in cart
     """
-    cart = Cart.objects.get(user=request.user)
     quantity = int(request.POST.get('quantity', 1))
     
+    if not request.user.is_authenticated:
+        return _update_anonymous_cart_item(request, product_id, quantity)
+    
+    cart = Cart.objects.filter(user=request.user).first()
+    if cart is None:
+        messages.error(request, 'Product not found.')
+        return redirect('cart')
+    
     try:
         product = Product.objects.get(id=product_id)
         
@@ -118,13 +159,68 @@ def update_cart_item_view(request, product_id):
     return redirect('cart')
 
 
-@login_required
+def _update_anonymous_cart_item(request, product_id, quantity):
+    """update_cart_item_view for the cookie cart."""
+    lines = read_anonymous_cart(request)
+    if product_id not in lines:
+        messages.error(request, 'Product not found.')
+        return redirect('cart')
+    if quantity <= 0:
+        del lines[product_id]
+        messages.success(request, 'Item removed from cart.')
+    else:
+        stock = Product.objects.filter(id=product_id).values_list('quantity_in_stock', flat=True).first() or 0
+        if quantity > stock:
+            messages.error(request, f'Only {stock} items available.')
+            return redirect('cart')
+        lines[product_id] = quantity
+        messages.success(request, 'Cart updated.')
+    return save_anonymous_cart(redirect('cart'), lines)
+
+
+@require_http_methods(["POST"])
+def bulk_update_cart_view(request):
+    """
+    Change several cart lines in one request (JSON; see cart.bulk) and
+    return the new line totals and cart summary
+    """
+    try:
+        changes = parse_changes(request.body)
+    except CartChangesError as e:
+        return JsonResponse({'errors': [{'product_id': None, 'error': str(e)}]}, status=400)
+
+    if not request.user.is_authenticated:
+        lines = read_anonymous_cart(request)
+        errors = apply_anonymous_changes(lines, changes)
+        if errors:
+            return JsonResponse({'errors': errors}, status=400)
+        response = JsonResponse(cart_payload(anonymous_cart_lines(request, lines)))
+        return save_anonymous_cart(response, lines)
+
+    cart = Cart.objects.filter(user=request.user).first()
+    if cart is None:
+        return JsonResponse({'errors': [{'product_id': pk, 'error': 'Product not in cart.'} for pk in changes]}, status=400)
+    errors = apply_cart_changes(cart, changes)
+    if errors:
+        return JsonResponse({'errors': errors}, status=400)
+    # bulk_update skips the CartItem signals, so refresh the summary here
+    invalidate_cart_summary(request.user.pk)
+    cart_items = cart.load_lines()
+    store_cart_summary(request.user.pk, cart_items)
+    return JsonResponse(cart_payload(cart_items))
+
+
 @require_http_methods(["POST"])
 def clear_cart_view(request):
     """
     Clear entire cart
     """
-    cart = Cart.objects.get(user=request.user)
-    cart.items.all().delete()
+    if not request.user.is_authenticated:
+        messages.success(request, 'Cart cleared.')
+        return forget_anonymous_cart(redirect('cart'))
+    
+    cart = Cart.objects.filter(user=request.user).first()
+    if cart:
+        cart.clear()
     messages.success(request, 'Cart cleared.')
     return redirect('cart')
@@ -15,12 +15,12 @@ def collaborations_list_view(request):
     """
     if request.user.is_influencer():
         # Show influencer's collaboration requests and active collaborations
-        requests = CollaborationRequest.objects.filter(influencer__user=request.user)
-        active = ActiveCollaboration.objects.filter(influencer__user=request.user)
+        requests = CollaborationRequest.objects.filter(influencer__user=request.user).select_related('artisan__user', 'influencer__user')
+        active = ActiveCollaboration.objects.filter(influencer__user=request.user).select_related('artisan__user', 'influencer__user')
     elif request.user.is_artisan():
         # Show artisan's collaboration requests and active collaborations
-        requests = CollaborationRequest.objects.filter(artisan__user=request.user)
-        active = ActiveCollaboration.objects.filter(artisan__user=request.user)
+        requests = CollaborationRequest.objects.filter(artisan__user=request.user).select_related('artisan__user', 'influencer__user')
+        active = ActiveCollaboration.objects.filter(artisan__user=request.user).select_related('artisan__user', 'influencer__user')
     else:
         messages.error(request, 'Only artisans and influencers can view collaborations.')
         return redirect('dashboard')
@@ -0,0 +1,121 @@
+"""
+Aggregate SQL profiling log lines into a per-view report.
+
+Reads "[SQLPROFILE] {json}" lines written by
+core.middleware.QueryProfilingMiddleware from log files (or stdin) and
+prints, for each view, how often it ran, its query counts and database
+time, and its most frequent repeated statements (likely N+1 loops).
+
+Usage:
+    SQL_PROFILING=1 python manage.py runserver 2> profile.log
+    python manage.py sql_profile_report profile.log --sort db_ms --limit 20
+"""
+
+import json
+import sys
+from collections import Counter, defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.middleware import LOG_PREFIX
+
+
+SORT_KEYS = ('total_db_ms', 'avg_db_ms', 'p95_db_ms', 'avg_queries', 'requests')
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def parse_profile_lines(lines):
+    """Yield the JSON records found in log lines, skipping anything else."""
+    for line in lines:
+        position = line.find(LOG_PREFIX)
+        if position < 0:
+            continue
+        try:
+            yield json.loads(line[position + len(LOG_PREFIX):])
+        except ValueError:
+            continue
+
+
+def aggregate_profiles(records):
+    """Per-view statistics, keyed by view name (or path for unresolved URLs)."""
+    by_view = defaultdict(list)
+    for record in records:
+        by_view[record.get('view') or record.get('path') or '?'].append(record)
+
+    report = []
+    for view, rows in by_view.items():
+        queries = [row['queries'] for row in rows]
+        db_ms = [row['db_ms'] for row in rows]
+        duplicates = Counter()
+        examples = {}
+        for row in rows:
+            for duplicate in row.get('duplicates', []):
+                duplicates[duplicate['fingerprint']] += duplicate['count']
+                examples.setdefault(duplicate['fingerprint'], duplicate['sql'])
+        report.append({
+            'view': view,
+            'requests': len(rows),
+            'avg_queries': round(sum(queries) / len(rows), 1),
+            'max_queries': max(queries),
+            'avg_db_ms': round(sum(db_ms) / len(rows), 2),
+            'p95_db_ms': round(_percentile(db_ms, 0.95), 2),
+            'total_db_ms': round(sum(db_ms), 2),
+            'requests_with_duplicates': sum(1 for row in rows if row.get('duplicates')),
+            'top_duplicates': [
+                {'fingerprint': key, 'count': count, 'sql': examples[key]}
+                for key, count in duplicates.most_common(3)
+            ],
+        })
+    return report
+
+
+class Command(BaseCommand):
+    help = 'Summarize SQL profiling logs (QueryProfilingMiddleware) per view.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('logfiles', nargs='*', help='Log files to read (default: stdin).')
+        parser.add_argument('--sort', choices=SORT_KEYS, default='total_db_ms',
+                            help='Column to rank views by (default total_db_ms).')
+        parser.add_argument('--limit', type=int, default=20, help='Number of views to show.')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON.')
+
+    def handle(self, *args, **options):
+        records = []
+        if options['logfiles']:
+            for path in options['logfiles']:
+                try:
+                    with open(path, encoding='utf-8', errors='replace') as handle:
+                        records.extend(parse_profile_lines(handle))
+                except OSError as exc:
+                    raise CommandError(f'Cannot read {path}: {exc}')
+        else:
+            records.extend(parse_profile_lines(sys.stdin))
+
+        if not records:
+            self.stdout.write('No [SQLPROFILE] lines found.')
+            return
+
+        report = aggregate_profiles(records)
+        report.sort(key=lambda row: row[options['sort']], reverse=True)
+        report = report[:options['limit']]
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f'{len(records)} request(s) profiled\n')
+        header = f'{"view":<40} {"reqs":>6} {"avg q":>7} {"max q":>6} {"avg ms":>8} {"p95 ms":>8} {"total ms":>10} {"dup reqs":>8}'
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for row in report:
+            self.stdout.write(
+                f'{row["view"][:40]:<40} {row["requests"]:>6} {row["avg_queries"]:>7} {row["max_queries"]:>6} '
+                f'{row["avg_db_ms"]:>8} {row["p95_db_ms"]:>8} {row["total_db_ms"]:>10} '
+                f'{row["requests_with_duplicates"]:>8}'
+            )
+            for duplicate in row['top_duplicates']:
+                self.stdout.write(f'    {duplicate["count"]:>5}x {duplicate["sql"][:100]}')
@@ -0,0 +1,174 @@
+"""
+Per-request SQL profiling.
+
+When SQL_PROFILING is on, every request records the queries it runs:
+count, total database time, statements repeated with the same shape
+(usually an N+1 loop) and the slowest statements. The summary is logged as
+one "[SQLPROFILE] {json}" line on the `django.sqlprofile` logger and
+returned in an X-SQL-Profile response header. Individual statements slower
+than SQL_SLOW_QUERY_MS are also logged as warnings.
+
+Streaming responses (e.g. order exports) run most of their queries while
+the body is sent, after the view returns. Their body is wrapped so those
+queries are recorded too; the log line is written once the stream is
+exhausted or closed, and their header only covers the queries run before
+streaming started (it ends in "; streaming").
+
+`manage.py sql_profile_report` aggregates the log lines per view.
+
+With SQL_PROFILING off the middleware removes itself at startup, so it
+costs nothing in production.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger('django.sqlprofile')
+
+LOG_PREFIX = '[SQLPROFILE] '
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)', re.IGNORECASE)
+_SPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql):
+    """
+    Reduce a statement to its shape: literals become ?, IN lists collapse
+    and whitespace is normalized, so the queries of an N+1 loop share one
+    fingerprint.
+    """
+    shape = _STRING.sub('?', sql)
+    shape = _NUMBER.sub('?', shape)
+    shape = shape.replace('%s', '?')
+    shape = _IN_LIST.sub('IN (...)', shape)
+    return _SPACE.sub(' ', shape).strip()
+
+
+def fingerprint_id(shape):
+    return hashlib.sha1(shape.encode()).hexdigest()[:12]
+
+
+class QueryRecorder:
+    """execute_wrapper that times every statement run through a connection."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            alias = context['connection'].alias
+            self.queries.append((sql, (time.perf_counter() - started) * 1000, alias))
+
+    def summary(self, duplicate_threshold, top):
+        shapes = Counter()
+        examples = {}
+        for sql, _, _ in self.queries:
+            shape = fingerprint(sql)
+            shapes[shape] += 1
+            examples.setdefault(shape, sql)
+        duplicates = [
+            {'fingerprint': fingerprint_id(shape), 'count': count, 'sql': examples[shape][:500]}
+            for shape, count in shapes.most_common()
+            if count >= duplicate_threshold
+        ]
+        slowest = sorted(self.queries, key=lambda query: query[1], reverse=True)[:top]
+        return {
+            'queries': len(self.queries),
+            'db_ms': round(sum(duration for _, duration, _ in self.queries), 3),
+            'duplicates': duplicates,
+            'slowest': [
+                {'ms': round(duration, 3), 'alias': alias, 'sql': sql[:500]}
+                for sql, duration, alias in slowest
+            ],
+        }
+
+
+def _header(summary):
+    return (
+        f'queries={summary["queries"]}; db_ms={summary["db_ms"]:.1f}; '
+        f'duplicates={len(summary["duplicates"])}'
+    )
+
+
+class QueryProfilingMiddleware:
+    """
+    Opt-in SQL profiler (settings.SQL_PROFILING, or the SQL_PROFILING
+    environment variable via settings).
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'SQL_PROFILING', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.duplicate_threshold = getattr(settings, 'SQL_PROFILE_DUPLICATE_THRESHOLD', 3)
+        self.top = getattr(settings, 'SQL_PROFILE_SLOWEST', 5)
+        self.slow_ms = getattr(settings, 'SQL_SLOW_QUERY_MS', 100)
+
+    def _recording(self, recorder):
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        return stack
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with self._recording(recorder):
+            response = self.get_response(request)
+
+        if response.streaming and not getattr(response, 'is_async', False):
+            # Headers go out before the body, so they only cover the view itself
+            summary = recorder.summary(self.duplicate_threshold, self.top)
+            response.streaming_content = self._stream(response.streaming_content, recorder, request, response, started)
+            response['X-SQL-Profile'] = _header(summary) + '; streaming'
+        else:
+            response['X-SQL-Profile'] = _header(self._report(recorder, request, response, started))
+        return response
+
+    def _stream(self, content, recorder, request, response, started):
+        """Pass `content` through, recording the queries each chunk runs."""
+        iterator = iter(content)
+        try:
+            while True:
+                with self._recording(recorder):
+                    chunk = next(iterator, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            self._report(recorder, request, response, started, streamed=True)
+
+    def _report(self, recorder, request, response, started, streamed=False):
+        elapsed = (time.perf_counter() - started) * 1000
+        summary = recorder.summary(self.duplicate_threshold, self.top)
+        match = getattr(request, 'resolver_match', None)
+        record = {
+            'view': match.view_name if match else None,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round(elapsed, 3),
+            **summary,
+        }
+        if streamed:
+            record['streamed'] = True
+        logger.info(LOG_PREFIX + json.dumps(record, sort_keys=True))
+        for sql, duration, alias in recorder.queries:
+            if duration >= self.slow_ms:
+                logger.warning(f'[SLOWSQL] {duration:.1f}ms on {alias} in {record["view"]}: {sql[:1000]}')
+        return summary
@@ -0,0 +1,178 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Listings page through an index-ordered queryset by remembering the sort-key
+values of the last row shown instead of using OFFSET, so the cost of a page
+stays the same no matter how deep the shopper scrolls.
+
+Cursors are signed so clients cannot hand-craft arbitrary filter values.
+"""
+
+from django.core import signing
+from django.db.models import Q
+
+
+CURSOR_SALT = 'core.pagination.cursor'
+
+
+def get_page_size(request, default, maximum, param='per_page'):
+    """
+    Read the requested page size from the querystring, clamped to [1, maximum].
+    """
+    try:
+        size = int(request.GET.get(param, default))
+    except (TypeError, ValueError):
+        size = default
+    return max(1, min(size, maximum))
+
+
+def encode_cursor(values):
+    """Sign a list of sort-key values for use in a querystring."""
+    return signing.dumps(values, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(cursor, length):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Returns None for missing, tampered or malformed cursors so callers fall
+    back to the first page.
+    """
+    if not cursor:
+        return None
+    try:
+        values = signing.loads(cursor, salt=CURSOR_SALT)
+    except signing.BadSignature:
+        return None
+    if not isinstance(values, list) or len(values) != length:
+        return None
+    return values
+
+
+def _serialize(value):
+    """Convert a sort-key value into something JSON can carry."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+class KeysetPage:
+    """
+    A single page of results produced by `KeysetPaginator`.
+    """
+
+    def __init__(self, object_list, has_next, has_previous, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by a fixed ordering using keyset cursors.
+
+    `ordering` is a sequence of field names (optionally prefixed with '-')
+    whose last entry must be unique, e.g. ('-created_at', '-id'). The
+    ordering fields must be non-nullable so comparisons are well defined.
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.fields = [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+
+    def page(self, after=None, before=None):
+        """
+        Return the page following the `after` cursor, or preceding the
+        `before` cursor. With neither (or an invalid cursor) the first page
+        is returned.
+        """
+        after_values = decode_cursor(after, len(self.fields))
+        before_values = decode_cursor(before, len(self.fields)) if after_values is None else None
+
+        if before_values is not None:
+            rows = self._fetch(self._seek(before_values, backwards=True), self._reversed_ordering())
+            has_previous = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            rows.reverse()
+            has_next = True
+        else:
+            condition = self._seek(after_values) if after_values is not None else Q()
+            rows = self._fetch(condition, self.ordering)
+            has_next = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            has_previous = after_values is not None
+
+        next_cursor = self.cursor_for(rows[-1]) if rows and has_next else None
+        previous_cursor = self.cursor_for(rows[0]) if rows and has_previous else None
+        return KeysetPage(rows, has_next, has_previous, next_cursor, previous_cursor)
+
+    def _fetch(self, condition, ordering):
+        """Up to per_page + 1 rows matching `condition`, in `ordering`."""
+        return list(self.queryset.filter(condition).order_by(*ordering)[:self.per_page + 1])
+
+    def cursor_for(self, obj):
+        """Build the cursor pointing just past `obj`."""
+        return encode_cursor([_serialize(self._value(obj, name)) for name, _ in self.fields])
+
+    def _value(self, obj, name):
+        if isinstance(obj, dict):
+            return obj[name]
+        for part in name.split('__'):
+            obj = getattr(obj, part)
+        return obj
+
+    def _reversed_ordering(self):
+        return [name if descending else f'-{name}' for name, descending in self.fields]
+
+    def _seek(self, values, backwards=False):
+        """
+        Build the lexicographic "strictly after these values" condition:
+        (a > x) OR (a = x AND b > y) OR ...
+        """
+        condition = Q()
+        equal = {}
+        for (name, descending), value in zip(self.fields, values):
+            op = 'lt' if descending != backwards else 'gt'
+            condition |= Q(**equal, **{f'{name}__{op}': value})
+            equal[name] = value
+        return condition
+
+
+class MergedKeysetPaginator(KeysetPaginator):
+    """
+    Keyset pages over several querysets with the same ordering, read as if
+    they were one table (e.g. live and archived orders). Each page costs one
+    query per queryset; the last field of `ordering` must be unique across
+    all of them.
+    """
+
+    def __init__(self, querysets, ordering, per_page):
+        super().__init__(querysets[0], ordering, per_page)
+        self.querysets = list(querysets)
+
+    def _fetch(self, condition, ordering):
+        rows = [
+            row
+            for queryset in self.querysets
+            for row in queryset.filter(condition).order_by(*ordering)[:self.per_page + 1]
+        ]
+        # Stable sorts from the last field to the first give the full ordering
+        for name in reversed(ordering):
+            field = name.lstrip('-')
+            rows.sort(key=lambda row: self._value(row, field), reverse=name.startswith('-'))
+        return rows[:self.per_page + 1]
@@ -0,0 +1,35 @@
+"""
+Whitelisted sort modes for public listings.
+
+Models declare their supported sorts the same way they declare choices:
+
+    SORT_CHOICES = (
+        ('newest', 'Newest', ('-created_at', '-id')),
+        ...
+    )
+
+Each mode's ordering ends with a unique tie-breaker and is backed by a
+matching index, so no client-supplied value ever reaches `order_by()`.
+"""
+
+
+def resolve_sort(sort_choices, value, default=None):
+    """
+    Return the (key, label, ordering) entry for a requested sort.
+
+    `value` may be a mode key ('price_asc') or, for links created before
+    the registry existed, a raw ordering field that leads a mode
+    ('-price'). Anything else resolves to `default`, or the first mode.
+    """
+    by_key = {mode[0]: mode for mode in sort_choices}
+    if value in by_key:
+        return by_key[value]
+    for mode in sort_choices:
+        if mode[2][0] == value:
+            return mode
+    return by_key.get(default, sort_choices[0])
+
+
+def sort_options(sort_choices):
+    """(key, label) pairs for rendering a sort <select>."""
+    return [(key, label) for key, label, _ in sort_choices]
@@ -0,0 +1,44 @@
+"""
+Query and latency budgets for public views.
+
+One row per URL checked by core.tests.test_view_budgets:
+
+    (label, url name, url argument, signed-in role, max queries, max ms)
+
+`url argument` names a fixture seeded by the suite ('product', 'artisan',
+...) or is None. `signed-in role` is None for anonymous requests.
+
+Query budgets are exact ceilings against the seeded volumes, so a new N+1
+anywhere fails immediately. Millisecond budgets are deliberately loose
+(they catch order-of-magnitude regressions, not noise) and can be scaled
+for slow machines with the PERF_BUDGET_TIME_SCALE environment variable.
+"""
+
+VIEW_BUDGETS = (
+    ('home', 'home', None, None, 4, 250),
+    ('about', 'about', None, None, 1, 250),
+    ('contact', 'contact', None, None, 0, 250),
+    ('catalog', 'products_list', None, None, 3, 400),
+    ('catalog search', 'products_list', 'search', None, 3, 400),
+    ('product detail', 'product_detail', 'product', None, 2, 250),
+    ('product reviews', 'product_reviews', 'product', None, 2, 250),
+    ('marketplace', 'artisanapp:marketplace', None, None, 2, 400),
+    ('artisan list', 'artisans_list', None, None, 1, 400),
+    ('artisan detail', 'artisan_detail', 'artisan', None, 2, 250),
+    ('artisan products', 'artisan_products', 'artisan', None, 2, 400),
+    ('influencer list', 'influencers:list', None, None, 1, 250),
+    ('influencer detail', 'influencers:detail', 'influencer', None, 2, 250),
+    # Signed-in budgets include the session and user lookups (2 queries) and,
+    # with the cache cleared, the navbar cart summary (1 query; see cart.summary)
+    ('cart', 'cart', None, 'customer', 6, 250),
+    ('shipping', 'shipping', None, 'customer', 3, 250),
+    ('checkout', 'checkout', None, 'customer', 6, 250),
+    # Live and archived orders are paged together (one query each; see orders.archive)
+    ('orders', 'orders_list', None, 'customer', 5, 400),
+    ('customer dashboard', 'dashboard', None, 'customer', 3, 250),
+    # Sales headline and daily series from the rollup (2 queries; see orders.rollups)
+    ('artisan dashboard', 'dashboard', None, 'artisan', 8, 250),
+    ('influencer dashboard', 'dashboard', None, 'influencer', 4, 250),
+    ('my products', 'my_products', None, 'artisan', 6, 400),
+    ('collaborations', 'collaborations_list', None, 'artisan', 5, 400),
+)
@@ -0,0 +1,76 @@
+import json
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from core.middleware import fingerprint
+from products.models import Product
+
+
+class QueryProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='prof', password='pass123', role='artisan')
+        self.artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='pottery', description='d', workshop_location='x'
+        )
+        Product.objects.create(
+            artisan=self.artisan, name='Mug', description='Glazed',
+            price=Decimal('9.00'), image='products/placeholder.jpg'
+        )
+
+    def test_fingerprint_groups_statements_by_shape(self):
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id = 7 AND name = \'x\''),
+            fingerprint('SELECT *  FROM t WHERE id = 12 AND name = \'y\''),
+        )
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s)'),
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s)'),
+        )
+
+    def test_disabled_by_default(self):
+        response = self.client.get(reverse('products_list'))
+        self.assertNotIn('X-SQL-Profile', response)
+
+    @override_settings(SQL_PROFILING=True, SQL_PROFILE_DUPLICATE_THRESHOLD=2, SQL_SLOW_QUERY_MS=0)
+    def test_header_log_line_and_report(self):
+        with self.assertLogs('django.sqlprofile', level='INFO') as logs:
+            response = self.client.get(reverse('artisan_detail', args=[self.artisan.id]))
+        self.assertRegex(response['X-SQL-Profile'], r'^queries=\d+; db_ms=[\d.]+; duplicates=\d+$')
+
+        lines = [line for line in logs.output if '[SQLPROFILE]' in line]
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0].split('[SQLPROFILE] ', 1)[1])
+        self.assertEqual(record['view'], 'artisan_detail')
+        self.assertGreater(record['queries'], 0)
+        self.assertTrue(record['slowest'])
+        self.assertTrue(any('[SLOWSQL]' in line for line in logs.output))
+
+        with tempfile.NamedTemporaryFile('w', suffix='.log') as logfile:
+            logfile.write('\n'.join(logs.output * 3) + '\nunrelated line\n')
+            logfile.flush()
+            out = StringIO()
+            call_command('sql_profile_report', logfile.name, '--json', stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report[0]['view'], 'artisan_detail')
+        self.assertEqual(report[0]['requests'], 3)
+
+    @override_settings(SQL_PROFILING=True)
+    def test_streaming_responses_are_profiled_once_the_body_is_sent(self):
+        self.client.login(username='prof', password='pass123')
+        with self.assertLogs('django.sqlprofile', level='INFO') as logs:
+            response = self.client.get(reverse('export_artisan_orders'))
+            self.assertTrue(response['X-SQL-Profile'].endswith('; streaming'))
+            self.assertFalse(logs.output)
+            b''.join(response.streaming_content)
+
+        lines = [line for line in logs.output if '[SQLPROFILE]' in line]
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0].split('[SQLPROFILE] ', 1)[1])
+        self.assertEqual(record['view'], 'export_artisan_orders')
+        self.assertTrue(record['streamed'])
+        self.assertTrue(any('orders_orderitem' in query['sql'] for query in record['slowest']))
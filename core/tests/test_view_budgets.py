@@ -0,0 +1,186 @@
+import os
+import time
+from datetime import date
+from decimal import Decimal
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from cart.models import Cart, CartItem
+from collaborations.models import ActiveCollaboration, CollaborationRequest
+from core.models import StatisticBlock, Testimonial
+from influencers.models import InfluencerProfile
+from orders.models import Order, OrderItem
+from products.models import Category, Product, Review
+from .budgets import VIEW_BUDGETS
+
+
+# Seeded volumes (per test class, rolled back afterwards)
+ARTISANS = 40
+PRODUCTS = 2000
+CUSTOMERS = 60
+REVIEWS_PER_CUSTOMER = 50
+ORDERS = 1000
+ITEMS_PER_ORDER = 3
+INFLUENCERS = 25
+CART_ITEMS = 8
+
+
+def _bulk_users(prefix, count, role):
+    User.objects.bulk_create([
+        User(username=f'{prefix}{i}', first_name=prefix.title(), last_name=str(i), role=role, password='!')
+        for i in range(count)
+    ])
+    return list(User.objects.filter(username__startswith=prefix, role=role).order_by('id'))
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class ViewBudgetTests(TestCase):
+    """
+    Every public view stays within the query/latency budget declared in
+    core.tests.budgets against a catalog of realistic size.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        categories = Category.objects.bulk_create([Category(name=f'Category {i}') for i in range(8)])
+
+        artisan_users = _bulk_users('maker', ARTISANS, 'artisan')
+        ArtisanProfile.objects.bulk_create([
+            ArtisanProfile(user=user, craft_type='pottery', description='Craft', workshop_location='Jaipur')
+            for user in artisan_users
+        ])
+        artisans = list(ArtisanProfile.objects.order_by('id'))
+
+        Product.objects.bulk_create([
+            Product(
+                artisan=artisans[i % ARTISANS], category=categories[i % len(categories)],
+                name=f'Handmade item {i}', description='Hand thrown stoneware with natural glaze',
+                price=Decimal('10.00') + i % 40, selling_price=Decimal('10.00') + i % 40,
+                quantity_in_stock=i % 7, image='products/placeholder.jpg',
+            )
+            for i in range(PRODUCTS)
+        ], batch_size=500)
+        products = list(Product.objects.order_by('id'))
+
+        customers = _bulk_users('buyer', CUSTOMERS, 'customer')
+        Review.objects.bulk_create([
+            Review(product=products[j], customer=customer, rating=j % 5 + 1, title='Lovely', comment='Well made')
+            for customer in customers
+            for j in range(REVIEWS_PER_CUSTOMER)
+        ], batch_size=500)
+
+        cls.customer = User.objects.create_user(username='shopper', password='pass123', role='customer')
+        Order.objects.bulk_create([
+            Order(
+                order_id=f'ORD-{i:08d}', customer=cls.customer if i % 10 == 0 else customers[i % CUSTOMERS],
+                shipping_name='Shopper', shipping_email='s@example.com', shipping_phone='9999999999',
+                shipping_address='1 Road', shipping_city='Pune', shipping_state='MH',
+                shipping_postal_code='411001', shipping_country='India', total_amount=Decimal('120.00'),
+            )
+            for i in range(ORDERS)
+        ], batch_size=500)
+        orders = list(Order.objects.order_by('id'))
+        OrderItem.objects.bulk_create([
+            OrderItem(
+                order=order, product=products[(i * ITEMS_PER_ORDER + k) % PRODUCTS],
+                artisan=artisan_users[(i + k) % ARTISANS], product_name='Handmade item',
+                product_price=Decimal('40.00'), quantity=1, subtotal=Decimal('40.00'),
+            )
+            for i, order in enumerate(orders)
+            for k in range(ITEMS_PER_ORDER)
+        ], batch_size=500)
+
+        influencer_users = _bulk_users('creator', INFLUENCERS, 'influencer')
+        InfluencerProfile.objects.bulk_create([
+            InfluencerProfile(user=user, niche='fashion', bio='Slow fashion', follower_count=1000 * i)
+            for i, user in enumerate(influencer_users)
+        ])
+        influencers = list(InfluencerProfile.objects.order_by('id'))
+        CollaborationRequest.objects.bulk_create([
+            CollaborationRequest(
+                influencer=influencer, artisan=artisan, title='Collab', description='d', proposed_terms='t'
+            )
+            for influencer in influencers
+            for artisan in artisans
+        ], batch_size=500)
+        ActiveCollaboration.objects.bulk_create([
+            ActiveCollaboration(
+                influencer=influencers[i % INFLUENCERS], artisan=artisans[i % ARTISANS],
+                title='Campaign', description='d', start_date=date(2026, 1, 1),
+            )
+            for i in range(200)
+        ])
+
+        Testimonial.objects.bulk_create([
+            Testimonial(name=f'T{i}', role='customer', text='Great', is_featured=True) for i in range(5)
+        ])
+        StatisticBlock.objects.bulk_create([StatisticBlock(label=f'S{i}', value='500+') for i in range(4)])
+
+        cart = Cart.objects.create(user=cls.customer)
+        CartItem.objects.bulk_create([
+            CartItem(cart=cart, product=products[i], quantity=1) for i in range(1, CART_ITEMS * 7, 7)
+        ])
+
+        cls.artisan_user = artisan_users[0]
+        cls.artisan_user.set_password('pass123')
+        cls.artisan_user.save()
+        cls.influencer_user = influencer_users[0]
+        cls.influencer_user.set_password('pass123')
+        cls.influencer_user.save()
+
+        cls.fixtures = {
+            'product': products[0].id,
+            'artisan': artisans[0].id,
+            'influencer': influencers[0].id,
+        }
+        cls.users = {
+            'customer': cls.customer,
+            'artisan': cls.artisan_user,
+            'influencer': cls.influencer_user,
+        }
+
+    def setUp(self):
+        cache.clear()
+
+    def _request(self, url_name, argument, role):
+        query = {}
+        if argument == 'search':
+            url, query = reverse(url_name), {'search': 'stoneware'}
+        elif argument:
+            url = reverse(url_name, args=[self.fixtures[argument]])
+        else:
+            url = reverse(url_name)
+        if role:
+            self.client.force_login(self.users[role])
+            if url_name == 'checkout':
+                session = self.client.session
+                session['shipping'] = {'full_name': 'Shopper', 'email': 's@example.com', 'phone': '9999999999',
+                                       'address': '1 Road', 'city': 'Pune', 'state': 'MH', 'pincode': '411001'}
+                session.save()
+        else:
+            self.client.logout()
+        # Warm-up request so one-off work (template loading, session, caches) is not measured
+        self.client.get(url, query)
+        cache.clear()
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, query)
+        return response, queries, (time.perf_counter() - started) * 1000
+
+    def test_views_stay_within_budget(self):
+        scale = float(os.environ.get('PERF_BUDGET_TIME_SCALE', '1'))
+        for label, url_name, argument, role, max_queries, max_ms in VIEW_BUDGETS:
+            with self.subTest(view=label):
+                response, queries, elapsed = self._request(url_name, argument, role)
+                self.assertEqual(response.status_code, 200)
+                count = len(queries)
+                self.assertLessEqual(
+                    count, max_queries,
+                    f'{label}: {count} queries (budget {max_queries})\n' +
+                    '\n'.join(q['sql'] for q in queries)
+                )
+                self.assertLessEqual(elapsed, max_ms * scale, f'{label}: {elapsed:.0f}ms (budget {max_ms}ms)')
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('influencers', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='influencerprofile',
+            index=models.Index(fields=['rating', 'id'], name='influencers_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='influencerprofile',
+            index=models.Index(fields=['created_at', 'id'], name='influencers_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='influencerprofile',
+            index=models.Index(fields=['total_collaborations', 'id'], name='influencers_collabs_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='influencerprofile',
+            index=models.Index(fields=['follower_count', 'id'], name='influencers_followers_idx'),
+        ),
+    ]
@@ -14,6 +14,14 @@ class InfluencerProfile(models.Model):
         ('other', 'Other'),
     )
     
+    # Supported listing sorts: (key, label, ordering); see core.sorting
+    SORT_CHOICES = (
+        ('rating', 'Highest Rated', ('-rating', '-id')),
+        ('newest', 'Newest', ('-created_at', '-id')),
+        ('collaborations', 'Most Collaborations', ('-total_collaborations', '-id')),
+        ('followers', 'Most Followers', ('-follower_count', '-id')),
+    )
+    
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='influencer_profile')
     niche = models.CharField(max_length=50, choices=NICHE_CHOICES)
     bio = models.TextField(max_length=1000, help_text='Your professional bio')
@@ -42,6 +50,12 @@ class InfluencerProfile(models.Model):
         db_table = 'influencers_profile'
         verbose_name = 'Influencer Profile'
         verbose_name_plural = 'Influencer Profiles'
+        indexes = [
+            models.Index(fields=['rating', 'id'], name='influencers_rating_idx'),
+            models.Index(fields=['created_at', 'id'], name='influencers_created_idx'),
+            models.Index(fields=['total_collaborations', 'id'], name='influencers_collabs_idx'),
+            models.Index(fields=['follower_count', 'id'], name='influencers_followers_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.get_niche_display()}"
@@ -5,6 +5,7 @@ from .models import InfluencerProfile
 from accounts.decorators import influencer_required, login_required
 from collaborations.models import CollaborationRequest
 from artisans.models import ArtisanProfile
+from core.sorting import resolve_sort, sort_options
 
 
 @require_http_methods(["GET"])
@@ -12,7 +13,7 @@ def influencers_list_view(request):
     """
     List all influencers with search and filter
     """
-    influencers = InfluencerProfile.objects.all()
+    influencers = InfluencerProfile.objects.select_related('user')
     
     # Search by niche or name
     search = request.GET.get('search', '')
@@ -34,15 +35,17 @@ def influencers_list_view(request):
     if featured_only:
         influencers = influencers.filter(is_featured=True)
     
-    # Sort options
-    sort = request.GET.get('sort', '-rating')
-    influencers = influencers.order_by(sort)
+    # Sort options (whitelisted, index-backed)
+    sort, _, ordering = resolve_sort(InfluencerProfile.SORT_CHOICES, request.GET.get('sort'))
+    influencers = influencers.order_by(*ordering)
     
     context = {
         'influencers': influencers,
         'search': search,
         'verified_only': verified_only,
         'featured_only': featured_only,
+        'sort': sort,
+        'sort_options': sort_options(InfluencerProfile.SORT_CHOICES),
     }
     
     return render(request, 'influencers/influencers_list.html', context)
@@ -0,0 +1,45 @@
+"""
+Show background job queue depth and latency (see jobs.queue.queue_stats).
+
+Usage:
+    python manage.py queue_stats [--json] [--purge-done-days 7]
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from jobs.queue import purge_finished_jobs, queue_stats
+
+
+class Command(BaseCommand):
+    help = 'Report job queue depth, oldest due job and recent wait/run times.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help='Print the stats as JSON.')
+        parser.add_argument('--purge-done-days', type=int,
+                            help='First delete done jobs finished more than this many days ago.')
+
+    def handle(self, *args, **options):
+        if options['purge_done_days'] is not None:
+            deleted = purge_finished_jobs(options['purge_done_days'])
+            self.stdout.write(f'Purged {deleted} finished job(s).')
+
+        stats = queue_stats()
+        if options['json']:
+            self.stdout.write(json.dumps(stats, indent=2))
+            return
+
+        depth = stats['depth']
+        self.stdout.write(
+            f"queued={depth['queued']} (due {stats['ready']}) running={depth['running']} "
+            f"done={depth['done']} failed={depth['failed']}"
+        )
+        self.stdout.write(f"oldest due job waiting: {stats['oldest_ready_seconds']}s")
+        recent = stats['recent']
+        self.stdout.write(
+            f"last {recent['jobs']} job(s): wait avg {recent['avg_wait_seconds']}s "
+            f"p95 {recent['p95_wait_seconds']}s, run avg {recent['avg_run_seconds']}s"
+        )
+        for name, count in sorted(stats['ready_by_task'].items(), key=lambda item: -item[1]):
+            self.stdout.write(f'  {count:>6}  {name}')
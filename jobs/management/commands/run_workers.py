@@ -0,0 +1,87 @@
+"""
+Run background job workers (see jobs.queue).
+
+Starts N worker processes that poll the jobs table and run due jobs, with
+retries and backoff. Stop with Ctrl+C / SIGTERM; workers finish the job
+they are running first.
+
+Usage:
+    python manage.py run_workers --workers 4
+    python manage.py run_workers --burst          # drain due jobs, then exit
+"""
+
+import multiprocessing
+import signal
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from jobs.queue import logger, work, worker_name
+
+
+def _run_worker(options, stop):
+    import django
+    from django.apps import apps
+    if not apps.ready:  # spawned (not forked) processes start without Django
+        django.setup()
+    name = worker_name()
+    logger.info(f"[JOBS] Worker {name} started")
+    processed = work(
+        name, burst=options['burst'], poll_interval=options['poll_interval'],
+        batch_size=options['batch_size'], should_stop=stop.is_set,
+    )
+    logger.info(f"[JOBS] Worker {name} stopped after {processed} job(s)")
+    connections.close_all()
+    return processed
+
+
+def _run_child_worker(options, stop):
+    """Entry point of a spawned worker process."""
+    # Ctrl+C reaches the whole process group; the parent handles it by setting `stop`
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    return _run_worker(options, stop)
+
+
+class Command(BaseCommand):
+    help = 'Run background job workers against the database queue.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, help='Worker processes (default JOBS_WORKERS).')
+        parser.add_argument('--burst', action='store_true', help='Exit once no job is due.')
+        parser.add_argument('--poll-interval', type=float, help='Seconds between polls of an idle queue.')
+        parser.add_argument('--batch-size', type=int, default=10, help='Jobs claimed per poll (default 10).')
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+        workers = options['workers'] or settings.JOBS_WORKERS
+        stop = multiprocessing.Event()
+
+        def request_stop(signum, frame):
+            self.stdout.write('Stopping workers after their current job...')
+            stop.set()
+
+        previous = {signum: signal.signal(signum, request_stop) for signum in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            self._run(workers, options, stop)
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def _run(self, workers, options, stop):
+        if workers == 1:
+            processed = _run_worker(options, stop)
+            self.stdout.write(self.style.SUCCESS(f'Processed {processed} job(s).'))
+            return
+
+        # Children must not share the parent's database connections
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(target=_run_child_worker, args=(options, stop), name=f'jobs-worker-{i}')
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(f'Started {workers} worker(s).')
+        for process in processes:
+            process.join()
+        self.stdout.write(self.style.SUCCESS('All workers stopped.'))
@@ -0,0 +1,232 @@
+"""
+Database-backed background job queue
+
+Work that does not have to finish inside a request (sales counters,
+notifications, ...) is written to the `jobs_job` table with `enqueue()`,
+in the same transaction as the change that caused it, so a job exists if
+and only if that change committed. `manage.py run_workers` starts worker
+processes that poll the table; no broker is needed.
+
+Tasks are plain functions registered with `@task('app.name')` in an app's
+`tasks.py` (discovered when the jobs app loads). A task receives the job
+payload as keyword arguments and runs in a transaction. When it raises,
+the job is retried after an exponential backoff
+(JOBS_RETRY_BACKOFF_SECONDS * 2^(attempt-1), capped at
+JOBS_RETRY_BACKOFF_MAX_SECONDS) until `max_attempts`, then marked failed.
+Tasks may run more than once (a worker can die after the work but before
+recording it), so they should be idempotent.
+
+Claiming a job is one conditional UPDATE (status queued -> running), so two
+workers never run the same job; on Postgres candidates are picked with
+SELECT ... FOR UPDATE SKIP LOCKED so workers do not contend for the same
+rows. Jobs left running by a dead worker are requeued after
+JOBS_LOCK_TIMEOUT_SECONDS.
+"""
+
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+from .models import Job
+
+
+logger = logging.getLogger("django.jobs")
+
+TASKS = {}
+
+
+def task(name):
+    """Register a function as the task `name`."""
+    def register(func):
+        if name in TASKS and TASKS[name] is not func:
+            raise ValueError(f'Task "{name}" is already registered')
+        TASKS[name] = func
+        func.task_name = name
+        return func
+    return register
+
+
+def _job(name, payload=None, delay=0, max_attempts=None):
+    if name not in TASKS:
+        raise KeyError(f'Unknown task "{name}"')
+    return Job(
+        task=name,
+        payload=payload or {},
+        run_at=timezone.now() + timedelta(seconds=delay),
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+    )
+
+
+def enqueue(name, payload=None, delay=0, max_attempts=None):
+    """Queue one run of task `name` with `payload` as its keyword arguments."""
+    job = _job(name, payload, delay, max_attempts)
+    job.save()
+    return job
+
+
+def enqueue_many(jobs):
+    """Queue several (name, payload) jobs with one INSERT."""
+    return Job.objects.bulk_create([_job(name, payload) for name, payload in jobs])
+
+
+def worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def backoff_seconds(attempts):
+    """Delay before retry number `attempts` (1 = first retry)."""
+    delay = settings.JOBS_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+    return min(delay, settings.JOBS_RETRY_BACKOFF_MAX_SECONDS)
+
+
+def claim_jobs(worker, limit=1):
+    """Mark up to `limit` due jobs as running by `worker` and return them."""
+    now = timezone.now()
+    ready = Job.objects.filter(status=Job.QUEUED, run_at__lte=now).order_by('run_at', 'id')
+    claim = dict(status=Job.RUNNING, locked_by=worker, started_at=now, attempts=F('attempts') + 1)
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(ready.select_for_update(skip_locked=True).values_list('pk', flat=True)[:limit])
+            Job.objects.filter(pk__in=ids).update(**claim)
+    else:
+        # One writer at a time (SQLite): the conditional UPDATE decides who wins
+        ids = [
+            pk for pk in ready.values_list('pk', flat=True)[:limit]
+            if Job.objects.filter(pk=pk, status=Job.QUEUED).update(**claim)
+        ]
+    return list(Job.objects.filter(pk__in=ids).order_by('run_at', 'id'))
+
+
+def _record(job, outcome, **fields):
+    """
+    Write the outcome of `job` if it is still the run this worker claimed.
+    A slow job may have been requeued as stale and claimed by another
+    worker meanwhile; that claim is left alone. Returns whether it was written.
+    """
+    written = Job.objects.filter(pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by).update(
+        locked_by=None, **fields
+    )
+    if not written:
+        logger.warning(f"[JOBS] {job} is no longer held by {job.locked_by}; not marking it {outcome}")
+    return bool(written)
+
+
+def run_job(job):
+    """
+    Run a claimed job and record the outcome. Returns the new status, or
+    None if the job was requeued while it ran (see requeue_stale_jobs).
+    """
+    func = TASKS.get(job.task)
+    try:
+        if func is None:
+            raise LookupError(f'No task registered as "{job.task}"')
+        with transaction.atomic():
+            func(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if func is None or job.attempts >= job.max_attempts:
+            if not _record(job, Job.FAILED, status=Job.FAILED, finished_at=now, last_error=error):
+                return None
+            logger.error(f"[JOBS] {job} failed after {job.attempts} attempt(s): {error.strip().splitlines()[-1]}")
+            return Job.FAILED
+        delay = backoff_seconds(job.attempts)
+        if not _record(job, Job.QUEUED, status=Job.QUEUED, run_at=now + timedelta(seconds=delay), last_error=error):
+            return None
+        logger.warning(f"[JOBS] {job} attempt {job.attempts} failed, retrying in {delay}s")
+        return Job.QUEUED
+
+    if not _record(job, Job.DONE, status=Job.DONE, finished_at=timezone.now(), last_error=None):
+        return None
+    return Job.DONE
+
+
+def requeue_stale_jobs(timeout=None):
+    """Return jobs stuck in `running` (their worker died) to the queue."""
+    timeout = timeout if timeout is not None else settings.JOBS_LOCK_TIMEOUT_SECONDS
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    stale = Job.objects.filter(status=Job.RUNNING, started_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.FAILED, finished_at=timezone.now(), last_error='Worker lock timed out', locked_by=None
+    )
+    requeued = stale.update(status=Job.QUEUED, locked_by=None)
+    if failed or requeued:
+        logger.warning(f"[JOBS] Requeued {requeued} and failed {failed} job(s) left running by dead workers")
+    return requeued
+
+
+def work(worker=None, burst=False, poll_interval=None, batch_size=10, should_stop=lambda: False):
+    """
+    Worker loop: claim and run due jobs until `should_stop()` (or, with
+    `burst`, until the queue has nothing due). Returns the number of jobs run.
+    """
+    worker = worker or worker_name()
+    poll_interval = poll_interval if poll_interval is not None else settings.JOBS_POLL_INTERVAL
+    processed = 0
+    last_stale_check = 0
+    while not should_stop():
+        if time.monotonic() - last_stale_check > settings.JOBS_LOCK_TIMEOUT_SECONDS / 2:
+            requeue_stale_jobs()
+            last_stale_check = time.monotonic()
+        jobs = claim_jobs(worker, batch_size)
+        for job in jobs:
+            run_job(job)
+            processed += 1
+        if not jobs:
+            if burst:
+                break
+            time.sleep(poll_interval)
+    return processed
+
+
+def _seconds(delta):
+    return round(delta.total_seconds(), 3)
+
+
+def queue_stats(sample=1000):
+    """
+    Queue depth per status and task, the age of the oldest due job, and
+    wait/run times over the most recently finished `sample` jobs.
+    """
+    now = timezone.now()
+    depth = dict(Job.objects.values_list('status').annotate(total=Count('id')).order_by())
+    ready = Job.objects.filter(status=Job.QUEUED, run_at__lte=now)
+    oldest = ready.aggregate(oldest=Min('run_at'))['oldest']
+    by_task = dict(ready.values_list('task').annotate(total=Count('id')).order_by())
+
+    finished = list(
+        Job.objects.filter(status=Job.DONE, finished_at__isnull=False)
+        .order_by('-finished_at')
+        .values_list('run_at', 'started_at', 'finished_at')[:sample]
+    )
+    waits = sorted(_seconds(started - run_at) for run_at, started, _ in finished if started)
+    runs = [_seconds(done - started) for _, started, done in finished if started]
+
+    return {
+        'depth': {status: depth.get(status, 0) for status, _ in Job.STATUS_CHOICES},
+        'ready': sum(by_task.values()),
+        'ready_by_task': by_task,
+        'oldest_ready_seconds': _seconds(now - oldest) if oldest else 0,
+        'recent': {
+            'jobs': len(finished),
+            'avg_wait_seconds': round(sum(waits) / len(waits), 3) if waits else 0,
+            'p95_wait_seconds': waits[min(len(waits) - 1, int(0.95 * len(waits)))] if waits else 0,
+            'avg_run_seconds': round(sum(runs) / len(runs), 3) if runs else 0,
+        },
+    }
+
+
+def purge_finished_jobs(older_than_days):
+    """Delete done jobs finished more than `older_than_days` ago."""
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    deleted, _ = Job.objects.filter(status=Job.DONE, finished_at__lt=cutoff).delete()
+    return deleted
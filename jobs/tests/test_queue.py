@@ -0,0 +1,128 @@
+import signal
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from jobs.models import Job
+from jobs.queue import claim_jobs, enqueue, enqueue_many, queue_stats, requeue_stale_jobs, run_job, task, work
+
+
+CALLS = []
+
+
+@task('tests.record')
+def record(value):
+    CALLS.append(value)
+
+
+@task('tests.flaky')
+def flaky(fail_times):
+    CALLS.append('try')
+    if CALLS.count('try') <= fail_times:
+        raise RuntimeError('temporary outage')
+
+
+@task('tests.sigint_handler')
+def sigint_handler():
+    CALLS.append(signal.getsignal(signal.SIGINT))
+
+
+@override_settings(JOBS_RETRY_BACKOFF_SECONDS=10, JOBS_RETRY_BACKOFF_MAX_SECONDS=25)
+class JobQueueTests(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_worker_runs_due_jobs_in_order(self):
+        enqueue_many([('tests.record', {'value': 1}), ('tests.record', {'value': 2})])
+        enqueue('tests.record', {'value': 'later'}, delay=60)
+        self.assertEqual(work(burst=True), 2)
+        self.assertEqual(CALLS, [1, 2])
+        self.assertEqual(Job.objects.filter(status=Job.DONE).count(), 2)
+        self.assertEqual(Job.objects.get(status=Job.QUEUED).payload, {'value': 'later'})
+
+    def test_unknown_task_cannot_be_queued(self):
+        with self.assertRaises(KeyError):
+            enqueue('tests.missing')
+
+    def test_a_claimed_job_is_not_claimed_again(self):
+        enqueue('tests.record', {'value': 1})
+        first = claim_jobs('worker-a', 5)
+        self.assertEqual([job.attempts for job in first], [1])
+        self.assertEqual(claim_jobs('worker-b', 5), [])
+
+    def test_failures_back_off_then_fail(self):
+        job = enqueue('tests.flaky', {'fail_times': 5}, max_attempts=3)
+        backoffs = []
+        for _ in range(3):
+            Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+            before = timezone.now()
+            status = run_job(claim_jobs('w')[0])
+            job.refresh_from_db()
+            if status == Job.QUEUED:
+                backoffs.append(round((job.run_at - before).total_seconds()))
+        self.assertEqual(backoffs, [10, 20])
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 3))
+        self.assertIn('temporary outage', job.last_error)
+
+    def test_retry_succeeds(self):
+        job = enqueue('tests.flaky', {'fail_times': 1})
+        run_job(claim_jobs('w')[0])
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        self.assertEqual(run_job(claim_jobs('w')[0]), Job.DONE)
+
+    def test_jobs_of_dead_workers_are_requeued(self):
+        job = enqueue('tests.record', {'value': 1})
+        claim_jobs('dead-worker')
+        Job.objects.filter(pk=job.pk).update(started_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(requeue_stale_jobs(timeout=60), 1)
+        self.assertEqual(work(burst=True), 1)
+
+    def test_a_requeued_job_keeps_its_new_claim(self):
+        job = enqueue('tests.record', {'value': 1})
+        slow = claim_jobs('slow-worker')[0]
+        Job.objects.filter(pk=job.pk).update(started_at=timezone.now() - timedelta(hours=1))
+        requeue_stale_jobs(timeout=60)
+        claim_jobs('second-worker')
+
+        with self.assertLogs('django.jobs', level='WARNING'):
+            self.assertIsNone(run_job(slow))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by), (Job.RUNNING, 'second-worker'))
+
+    def test_stats_report_depth_and_latency(self):
+        enqueue('tests.record', {'value': 1})
+        Job.objects.update(run_at=timezone.now() - timedelta(seconds=30))
+        enqueue('tests.record', {'value': 2}, delay=60)
+        stats = queue_stats()
+        self.assertEqual(stats['depth']['queued'], 2)
+        self.assertEqual(stats['ready_by_task'], {'tests.record': 1})
+        self.assertGreaterEqual(stats['oldest_ready_seconds'], 30)
+
+        work(burst=True)
+        stats = queue_stats()
+        self.assertEqual((stats['depth']['done'], stats['recent']['jobs']), (1, 1))
+        self.assertGreaterEqual(stats['recent']['avg_wait_seconds'], 30)
+
+        out = StringIO()
+        call_command('queue_stats', stdout=out)
+        self.assertIn('done=1', out.getvalue())
+
+        staff = User.objects.create_user(username='ops', password='pass123', is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get(reverse('job_queue_stats')).json()['depth']['done'], 1)
+
+    def test_run_workers_burst(self):
+        enqueue('tests.record', {'value': 'cmd'})
+        out = StringIO()
+        call_command('run_workers', '--workers', '1', '--burst', stdout=out)
+        self.assertEqual(CALLS, ['cmd'])
+        self.assertIn('Processed 1 job(s).', out.getvalue())
+
+    def test_single_worker_still_stops_on_ctrl_c(self):
+        enqueue('tests.sigint_handler')
+        call_command('run_workers', '--workers', '1', '--burst', stdout=StringIO())
+        # The command's stop handler, not SIG_IGN, while the in-process worker runs
+        self.assertEqual(CALLS[0].__name__, 'request_stop')
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import queue_stats_view
+
+urlpatterns = [
+    path('stats/', queue_stats_view, name='job_queue_stats'),
+]
@@ -0,0 +1,14 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_http_methods
+
+from accounts.decorators import admin_required
+from .queue import queue_stats
+
+
+@admin_required
+@require_http_methods(["GET"])
+def queue_stats_view(request):
+    """
+    Job queue depth and latency (staff only)
+    """
+    return JsonResponse(queue_stats())
@@ -1,5 +1,23 @@
-from django.contrib import admin
-from .models import Order, OrderItem, Shipment
+from django.contrib import admin, messages
+from .models import (
+    ArchivedOrder, ArchivedOrderItem, ArchivedShipment, ArtisanDailySales, Order, OrderItem, Shipment,
+    StatusTransition,
+)
+from .transitions import InvalidTransition, transition_orders, transition_shipments
+
+
+def status_action(transition, status, label):
+    """Admin action moving the selected rows to `status` through orders.transitions."""
+    def action(modeladmin, request, queryset):
+        try:
+            moved = transition(queryset, status, actor=request.user)
+        except InvalidTransition as e:
+            modeladmin.message_user(request, f'Nothing changed: {e}', messages.ERROR)
+            return
+        modeladmin.message_user(request, f'{moved} marked as {label.lower()}.', messages.SUCCESS)
+    action.__name__ = f'mark_{status}'
+    action.short_description = f'Mark selected as {label.lower()}'
+    return action
 
 
 class OrderItemInline(admin.TabularInline):
@@ -15,6 +33,10 @@ class OrderAdmin(admin.ModelAdmin):
     search_fields = ('order_id', 'customer__email')
     readonly_fields = ('order_id', 'subtotal', 'shipping_cost', 'tax', 'total_amount', 'created_at', 'updated_at')
     inlines = [OrderItemInline]
+    actions = [
+        status_action(transition_orders, status, label)
+        for status, label in Order.STATUS_CHOICES if status != 'pending'
+    ]
     
     fieldsets = (
         ('Order Info', {
@@ -46,3 +68,46 @@ class ShipmentAdmin(admin.ModelAdmin):
     list_filter = ('status', 'shipped_date', 'delivered_date')
     search_fields = ('tracking_number', 'order__order_id')
     readonly_fields = ('created_at', 'updated_at')
+    actions = [
+        status_action(transition_shipments, status, label)
+        for status, label in Shipment._meta.get_field('status').choices if status != 'pending'
+    ]
+
+
+@admin.register(ArtisanDailySales)
+class ArtisanDailySalesAdmin(admin.ModelAdmin):
+    list_display = ('artisan', 'day', 'units', 'revenue', 'order_count')
+    list_filter = ('day',)
+    search_fields = ('artisan__email', 'artisan__username')
+    readonly_fields = ('artisan', 'day', 'units', 'revenue', 'order_count', 'updated_at')
+
+
+@admin.register(StatusTransition)
+class StatusTransitionAdmin(admin.ModelAdmin):
+    list_display = ('order', 'kind', 'object_id', 'from_status', 'to_status', 'actor', 'created_at')
+    list_filter = ('kind', 'to_status')
+    search_fields = ('order__order_id',)
+    readonly_fields = ('order', 'kind', 'object_id', 'from_status', 'to_status', 'actor', 'created_at')
+
+
+class ArchivedOrderItemInline(admin.TabularInline):
+    model = ArchivedOrderItem
+    extra = 0
+    can_delete = False
+    readonly_fields = [field.name for field in ArchivedOrderItem._meta.fields]
+
+
+class ArchivedShipmentInline(admin.StackedInline):
+    model = ArchivedShipment
+    extra = 0
+    can_delete = False
+    readonly_fields = [field.name for field in ArchivedShipment._meta.fields]
+
+
+@admin.register(ArchivedOrder)
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    list_display = ('order_id', 'customer', 'total_amount', 'order_status', 'created_at', 'archived_at')
+    list_filter = ('order_status', 'created_at')
+    search_fields = ('order_id', 'customer__email')
+    readonly_fields = [field.name for field in ArchivedOrder._meta.fields]
+    inlines = [ArchivedOrderItemInline, ArchivedShipmentInline]
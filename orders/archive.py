@@ -0,0 +1,126 @@
+"""
+Order archival
+
+Orders that are finished (delivered, cancelled or refunded) and older than
+ORDER_ARCHIVE_AFTER_DAYS are moved out of the hot tables into
+orders_order_archive, orders_orderitem_archive and orders_shipment_archive.
+Archived rows keep their original ids and columns, so order history and
+order detail read both places and links keep working (see orders.views).
+Each order's StatusTransition log moves into ArchivedOrder.history.
+
+`archive_orders` moves one batch per transaction: copy with bulk_create,
+then delete the originals (items, shipment and log cascade). A run that is
+interrupted loses at most the batch in flight, which rolls back, so rerunning
+`manage.py archive_orders` simply carries on with what is still left.
+
+Declarative Postgres partitions would need raw DDL and a partition-aware
+primary key on orders_order; separate archive tables give the same
+small hot table on every supported database.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import (
+    ArchivedOrder, ArchivedOrderItem, ArchivedShipment, Order, OrderItem, Shipment, StatusTransition,
+)
+
+
+logger = logging.getLogger("django.orders")
+
+# Orders in these states will not change again
+ARCHIVE_STATUSES = ('delivered', 'cancelled', 'refunded')
+
+
+def archive_cutoff(older_than_days=None):
+    days = older_than_days if older_than_days is not None else settings.ORDER_ARCHIVE_AFTER_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable_orders(cutoff):
+    """Finished orders placed before `cutoff`, oldest first."""
+    return Order.objects.filter(order_status__in=ARCHIVE_STATUSES, created_at__lt=cutoff).order_by('created_at', 'id')
+
+
+def _copy(rows, model):
+    """Archive-model instances from value dicts, keeping the columns both share."""
+    columns = {field.attname for field in model._meta.concrete_fields}
+    return [model(**{name: value for name, value in row.items() if name in columns}) for row in rows]
+
+
+def archive_orders(order_ids):
+    """
+    Move these orders with their items, shipments and status logs to the
+    archive tables in one transaction. Returns the number of orders moved.
+    """
+    with transaction.atomic():
+        orders = list(
+            Order.objects.filter(pk__in=order_ids, order_status__in=ARCHIVE_STATUSES)
+            .select_for_update().values()
+        )
+        if not orders:
+            return 0
+        ids = [order['id'] for order in orders]
+
+        history = {}
+        for entry in StatusTransition.objects.filter(order_id__in=ids).order_by('id').values():
+            history.setdefault(entry['order_id'], []).append([
+                entry['kind'], entry['object_id'], entry['from_status'], entry['to_status'],
+                entry['actor_id'], entry['created_at'].isoformat(),
+            ])
+        archived = _copy(orders, ArchivedOrder)
+        for order in archived:
+            order.history = history.get(order.id, [])
+
+        # An id already in the archive raises IntegrityError and the batch rolls
+        # back, rather than skipping the copy and deleting the original
+        ArchivedOrder.objects.bulk_create(archived)
+        ArchivedOrderItem.objects.bulk_create(
+            _copy(OrderItem.objects.filter(order_id__in=ids).values(), ArchivedOrderItem)
+        )
+        ArchivedShipment.objects.bulk_create(
+            _copy(Shipment.objects.filter(order_id__in=ids).values(), ArchivedShipment)
+        )
+        Order.objects.filter(pk__in=ids).delete()
+    return len(ids)
+
+
+def archive_old_orders(cutoff, batch_size=None, max_batches=None, pause=0):
+    """
+    Archive finished orders placed before `cutoff`, one batch per
+    transaction, until none are left (or `max_batches` ran). Returns the
+    number of orders moved.
+    """
+    batch_size = batch_size or settings.ORDER_ARCHIVE_BATCH_SIZE
+    moved = batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(archivable_orders(cutoff).values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        moved += archive_orders(ids)
+        batches += 1
+        logger.info(f"[ARCHIVE] Batch {batches}: {moved} order(s) archived so far")
+        time.sleep(pause)
+    return moved
+
+
+def find_order(customer, order_id):
+    """
+    An order of `customer` by id with its shipment and items (two queries),
+    from the live tables or, failing that, the archive. None if neither has it.
+    """
+    for model in (Order, ArchivedOrder):
+        order = (
+            model.objects.filter(id=order_id, customer=customer)
+            .select_related('shipment')
+            .prefetch_related('items')
+            .first()
+        )
+        if order is not None:
+            return order
+    return None
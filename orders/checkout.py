@@ -0,0 +1,142 @@
+"""
+Checkout pipeline
+
+Turns a cart into an order with a fixed number of queries, however many
+lines the cart has:
+
+1. the cart lines are loaded once with their products and artisans, and
+   totals are computed in memory from those rows (Cart.load_lines);
+2. each line's price is taken from the product row already loaded;
+3. stock for every line is taken with one batched UPDATE (products.stock);
+4. the order is inserted, then all of its items with one `bulk_create`;
+5. the cart is emptied with one DELETE;
+6. follow-up work (artisan sales totals, notifications) is queued as
+   background jobs with one INSERT (see orders.tasks and jobs.queue).
+
+Steps 3-6 run in one transaction, so an OutOfStock from step 3 leaves no
+order behind, and the jobs exist exactly when the order does.
+
+Checkout is idempotent per token: the checkout page carries a fresh
+`idempotency_key`, the order placed with it records the key (unique per
+customer), and a repeated POST with the same key - a double click or a
+retry by the load balancer - gets the existing order back without taking
+stock or creating anything. Two copies racing each other both run the
+transaction, but the second fails on the unique key, rolls back its stock
+update and returns the first one's order.
+"""
+
+import logging
+import uuid
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from jobs.queue import enqueue_many
+from products.stock import OutOfStock, reserve_stock
+from .models import Order, OrderItem
+
+
+logger = logging.getLogger("django.checkout")
+
+SHIPPING_FIELDS = {
+    'full_name': 'shipping_name',
+    'email': 'shipping_email',
+    'phone': 'shipping_phone',
+    'address': 'shipping_address',
+    'city': 'shipping_city',
+    'state': 'shipping_state',
+    'pincode': 'shipping_postal_code',
+}
+
+# Background tasks queued for every new order (registered in orders.tasks)
+ORDER_PLACED_TASKS = ('orders.record_artisan_sales', 'orders.notify_order_placed')
+
+
+def unit_price(product):
+    """Price charged per unit: the selling price, or the legacy price."""
+    return product.selling_price if product.selling_price is not None else product.price
+
+
+def shipping_cost_usd():
+    """Flat shipping fee: SHIPPING_COST_INR converted at USD_TO_INR_RATE."""
+    rate = Decimal(getattr(settings, 'USD_TO_INR_RATE', 83))
+    shipping_inr = Decimal(getattr(settings, 'SHIPPING_COST_INR', 50))
+    return (shipping_inr / rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def new_checkout_token():
+    """Idempotency key for one rendering of the checkout page."""
+    return uuid.uuid4().hex
+
+
+def clean_idempotency_key(value):
+    """A usable key from the form or the Idempotency-Key header, else None."""
+    value = (value or '').strip()
+    if not value or len(value) > Order._meta.get_field('idempotency_key').max_length:
+        return None
+    return value
+
+
+def replayed_order(customer, idempotency_key):
+    """The order `customer` already placed with this key, if any."""
+    if not idempotency_key:
+        return None
+    return Order.objects.filter(customer=customer, idempotency_key=idempotency_key).first()
+
+
+def place_order(customer, cart, lines, shipping, shipping_cost, idempotency_key=None):
+    """
+    Create the order for `lines` (from Cart.load_lines), take their stock and
+    empty the cart. Raises products.stock.OutOfStock if any line is short.
+
+    With an `idempotency_key` that already placed an order (including one
+    committed by a concurrent request), that order is returned instead.
+    """
+    try:
+        return _place_order(customer, cart, lines, shipping, shipping_cost, idempotency_key or None)
+    except (IntegrityError, OutOfStock):
+        # A concurrent copy of this request may have won; its order is the answer
+        order = replayed_order(customer, idempotency_key)
+        if order is None:
+            raise
+        logger.info(f"[CHECKOUT] Replayed order {order.order_id} for user {customer}")
+        return order
+
+
+def _place_order(customer, cart, lines, shipping, shipping_cost, idempotency_key):
+    subtotal = lines.total
+    with transaction.atomic():
+        reserve_stock((line.product_id, line.quantity) for line in lines)
+        order = Order.objects.create(
+            customer=customer,
+            idempotency_key=idempotency_key,
+            shipping_country="India",
+            subtotal=subtotal,
+            shipping_cost=shipping_cost,
+            total_amount=subtotal + shipping_cost,
+            **{field: shipping.get(key, '').strip() for key, field in SHIPPING_FIELDS.items()},
+        )
+        items = []
+        for line in lines:
+            product = line.product
+            price = unit_price(product)
+            # bulk_create skips OrderItem.save(), so subtotal is set here
+            items.append(OrderItem(
+                order=order,
+                product=product,
+                artisan=product.artisan.user if product.artisan else None,
+                product_name=product.name,
+                product_price=price,
+                quantity=line.quantity,
+                subtotal=price * line.quantity,
+            ))
+        OrderItem.objects.bulk_create(items)
+        cart.clear()
+        enqueue_many((name, {'order_id': order.pk}) for name in ORDER_PLACED_TASKS)
+
+    logger.info(
+        f"[ORDER] Created order {order.order_id} for user {customer}: "
+        f"{len(items)} item(s), {sum(line.quantity for line in lines)} unit(s), total {order.total_amount}"
+    )
+    return order
@@ -0,0 +1,137 @@
+"""
+Streaming order export (CSV or JSON Lines)
+
+Orders, or order items joined to their order, are read as plain value rows
+through `.iterator(chunk_size=...)` (a server-side cursor on Postgres) and
+written out in ~64 KB chunks, so memory stays flat however many rows match.
+Live and archived orders (orders.archive) are exported one after the
+other, each in id order.
+
+Used by the artisan "Export" download (their own order items) and by
+`manage.py export_orders` for admins.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, time, timedelta
+from itertools import chain
+
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from products.bulk_io import FORMATS
+from .models import ArchivedOrder, ArchivedOrderItem, Order, OrderItem
+
+
+ORDER_COLUMNS = (
+    'order_id', 'created_at', 'order_status', 'payment_status', 'customer_email',
+    'shipping_name', 'shipping_city', 'shipping_state', 'shipping_postal_code', 'shipping_country',
+    'subtotal', 'shipping_cost', 'tax', 'discount', 'total_amount', 'delivered_at',
+)
+
+ITEM_COLUMNS = (
+    'order_id', 'order_created_at', 'order_status', 'item_id', 'status', 'product_id', 'product_name',
+    'artisan', 'product_price', 'quantity', 'subtotal',
+    'shipping_name', 'shipping_city', 'shipping_state', 'shipping_postal_code',
+)
+
+# Export column -> ORM lookup, for each kind of row
+_ORDER_FIELDS = {'customer_email': 'customer__email'}
+_ITEM_FIELDS = {
+    'order_id': 'order__order_id',
+    'order_created_at': 'order__created_at',
+    'order_status': 'order__order_status',
+    'item_id': 'id',
+    'artisan': 'artisan__username',
+    'shipping_name': 'order__shipping_name',
+    'shipping_city': 'order__shipping_city',
+    'shipping_state': 'order__shipping_state',
+    'shipping_postal_code': 'order__shipping_postal_code',
+}
+
+KINDS = {
+    'orders': ((Order, ArchivedOrder), ORDER_COLUMNS, _ORDER_FIELDS, 'created_at', 'order_status'),
+    'items': ((OrderItem, ArchivedOrderItem), ITEM_COLUMNS, _ITEM_FIELDS, 'order__created_at', 'status'),
+}
+
+
+def parse_date(value, name):
+    """A date from YYYY-MM-DD text (None when blank)."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValidationError(f'{name} must be a date like 2024-01-31, got "{value}"')
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def export_querysets(kind='items', artisan=None, since=None, until=None, statuses=None, include_archive=True):
+    """
+    The value-row querysets (live first, then archive) for an export.
+    `since` / `until` are inclusive order dates; `statuses` match the
+    row's own status (order status for orders, item status for items).
+    """
+    if kind not in KINDS:
+        raise ValidationError(f'Unknown export "{kind}" (expected one of: {", ".join(KINDS)})')
+    models, columns, fields, date_field, status_field = KINDS[kind]
+    filters = {}
+    if artisan is not None:
+        filters['artisan' if kind == 'items' else 'items__artisan'] = artisan
+    # Whole-day bounds as datetimes, so the created_at indexes still apply
+    if since:
+        filters[f'{date_field}__gte'] = _day_start(since)
+    if until:
+        filters[f'{date_field}__lt'] = _day_start(until + timedelta(days=1))
+    if statuses:
+        filters[f'{status_field}__in'] = list(statuses)
+
+    lookups = [fields.get(column, column) for column in columns]
+    querysets = []
+    for model in models[:2 if include_archive else 1]:
+        queryset = model.objects.filter(**filters)
+        if kind == 'orders' and artisan is not None:
+            queryset = queryset.distinct()
+        querysets.append(queryset.order_by('id').values_list(*lookups))
+    return querysets
+
+
+def _cell(value):
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return '' if value is None else value
+
+
+def iter_export(querysets, columns, fmt='csv', chunk_size=2000):
+    """Yield the export file as text chunks (header first for CSV)."""
+    if fmt not in FORMATS:
+        raise ValidationError(f'Unsupported format "{fmt}" (expected one of: {", ".join(FORMATS)})')
+    rows = chain.from_iterable(queryset.iterator(chunk_size=chunk_size) for queryset in querysets)
+    buffer = io.StringIO()
+    if fmt == 'csv':
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+
+        def write(row):
+            writer.writerow([_cell(value) for value in row])
+    else:
+        def write(row):
+            buffer.write(json.dumps({column: _cell(value) for column, value in zip(columns, row)}, default=str))
+            buffer.write('\n')
+
+    for row in rows:
+        write(row)
+        if buffer.tell() > 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_orders(kind='items', fmt='csv', chunk_size=2000, **filters):
+    """export_querysets + iter_export: text chunks for an export of `kind`."""
+    return iter_export(export_querysets(kind, **filters), KINDS[kind][1], fmt, chunk_size)
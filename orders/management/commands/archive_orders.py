@@ -0,0 +1,45 @@
+"""
+Move finished orders older than the archive horizon into the archive tables
+(see orders.archive). Safe to interrupt and rerun: each batch commits on
+its own and the next run picks up what is left.
+
+Usage:
+    python manage.py archive_orders [--days 365] [--batch-size 500] [--max-batches N] [--pause 0.1] [--dry-run]
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from orders.archive import archivable_orders, archive_cutoff, archive_old_orders
+
+
+class Command(BaseCommand):
+    help = 'Archive delivered, cancelled and refunded orders older than the horizon, in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ORDER_ARCHIVE_AFTER_DAYS,
+                            help=f'Archive orders placed more than this many days ago '
+                                 f'(default {settings.ORDER_ARCHIVE_AFTER_DAYS}).')
+        parser.add_argument('--batch-size', type=int, default=settings.ORDER_ARCHIVE_BATCH_SIZE,
+                            help=f'Orders moved per transaction (default {settings.ORDER_ARCHIVE_BATCH_SIZE}).')
+        parser.add_argument('--max-batches', type=int, help='Stop after this many batches.')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to sleep between batches, to spread the load.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the orders that would move.')
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['days'])
+        if options['dry_run']:
+            count = archivable_orders(cutoff).count()
+            self.stdout.write(f'Would archive {count} order(s) placed before {cutoff:%Y-%m-%d}.')
+            return
+        moved = archive_old_orders(
+            cutoff,
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+            pause=options['pause'],
+        )
+        left = archivable_orders(cutoff).count()
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {moved} order(s) placed before {cutoff:%Y-%m-%d}; {left} left to archive.'
+        ))
@@ -0,0 +1,135 @@
+"""
+Benchmark hot order-table queries before and after archiving.
+
+Seeds synthetic order history inside a transaction that is rolled back at
+the end: a share of the orders are finished and older than the archive
+horizon. Times the customer order-history page, an order detail lookup
+and the artisan orders-received page, archives the old orders with
+orders.archive, and times them again.
+
+Usage:
+    python manage.py benchmark_order_archive --orders 100000 --old-share 0.8
+"""
+
+import random
+import statistics
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from accounts.models import User
+from core.pagination import KeysetPaginator, MergedKeysetPaginator
+from orders.archive import archive_cutoff, archive_old_orders, find_order
+from orders.models import ArchivedOrder, Order, OrderItem
+
+
+class Command(BaseCommand):
+    help = 'Time order history queries against the hot tables before and after archiving old orders.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=100000)
+        parser.add_argument('--customers', type=int, default=1000)
+        parser.add_argument('--old-share', type=float, default=0.8,
+                            help='Share of orders that are finished and past the horizon.')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs per query')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        with transaction.atomic():
+            customers, artisan = self._seed(rng, options)
+            probes = rng.sample(customers, min(20, len(customers)))
+            recent_ids = list(
+                Order.objects.filter(customer__in=probes).order_by('-created_at').values_list('id', flat=True)[:20]
+            )
+
+            self.stdout.write(f"{'query':<26}  {'before ms':>10}  {'after ms':>10}")
+            before = self._time_all(probes, recent_ids, artisan, options['repeat'])
+            started = time.perf_counter()
+            moved = archive_old_orders(archive_cutoff(), batch_size=options['batch_size'])
+            elapsed = time.perf_counter() - started
+            after = self._time_all(probes, recent_ids, artisan, options['repeat'])
+            for name in before:
+                self.stdout.write(f'{name:<26}  {before[name]:>10.2f}  {after[name]:>10.2f}')
+            self.stdout.write(
+                f'Archived {moved} of {options["orders"]} order(s) in {elapsed:.1f}s; '
+                f'{Order.objects.count()} left in orders_order.'
+            )
+            transaction.set_rollback(True)
+
+    def _time_all(self, customers, order_ids, artisan, repeat):
+        def history(customer):
+            querysets = [
+                model.objects.filter(customer=customer).annotate(item_count=Coalesce(Sum('items__quantity'), 0))
+                for model in (Order, ArchivedOrder)
+            ]
+            return MergedKeysetPaginator(querysets, ('-created_at', '-id'), 20).page()
+
+        def received():
+            items = OrderItem.objects.filter(artisan=artisan).select_related('order')
+            return KeysetPaginator(items, ('-created_at', '-id'), 20).page()
+
+        def detail(order_id):
+            order = Order.objects.filter(pk=order_id).values_list('customer_id', flat=True).first()
+            return find_order(order, order_id) if order else None
+
+        runs = {
+            'order history page': lambda i: history(customers[i % len(customers)]),
+            'recent order detail': lambda i: detail(order_ids[i % len(order_ids)]),
+            'artisan received page': lambda i: received(),
+        }
+        medians = {}
+        for name, run in runs.items():
+            timings = []
+            for i in range(repeat):
+                start = time.perf_counter()
+                run(i)
+                timings.append((time.perf_counter() - start) * 1000)
+            medians[name] = statistics.median(timings)
+        return medians
+
+    def _seed(self, rng, options):
+        artisan = User.objects.create_user(username='bench_archive_artisan', password=None, role='artisan')
+        customers = [
+            User(username=f'bench_archive_{i}', email=f'bench_archive_{i}@example.com', role='customer')
+            for i in range(options['customers'])
+        ]
+        customers = User.objects.bulk_create(customers)
+        now = timezone.now()
+        horizon = (now - archive_cutoff()).days
+        size, batch_size = options['orders'], options['batch_size']
+        for start in range(0, size, batch_size):
+            orders = []
+            for i in range(start, min(start + batch_size, size)):
+                old = rng.random() < options['old_share']
+                orders.append(Order(
+                    order_id=f'BENCH-{i:09d}',
+                    customer=rng.choice(customers),
+                    shipping_name='Bench', shipping_email='bench@example.com', shipping_phone='1',
+                    shipping_address='a', shipping_city='c', shipping_state='s', shipping_postal_code='1',
+                    shipping_country='India', subtotal=Decimal('20.00'), total_amount=Decimal('20.60'),
+                    order_status=rng.choice(('delivered', 'cancelled')) if old else 'pending',
+                ))
+            orders = Order.objects.bulk_create(orders)
+            # auto_now_add ignores explicit values; spread the dates afterwards
+            for order in orders:
+                old = order.order_status != 'pending'
+                order.created_at = now - timedelta(
+                    days=rng.randint(horizon + 1, horizon * 3) if old else rng.randint(0, horizon - 1)
+                )
+            Order.objects.bulk_update(orders, ['created_at'])
+            OrderItem.objects.bulk_create([
+                OrderItem(
+                    order=order, artisan=artisan, product_name='Bench item', product_price=Decimal('10.00'),
+                    quantity=2, subtotal=Decimal('20.00'), status='delivered' if order.order_status != 'pending' else 'pending',
+                )
+                for order in orders
+            ])
+        return customers, artisan
@@ -0,0 +1,58 @@
+"""
+Export orders or order items as CSV or JSON Lines, archived orders included.
+
+Usage:
+    python manage.py export_orders --since 2024-01-01 --output orders.csv
+    python manage.py export_orders --kind items --artisan priya --format jsonl > items.jsonl
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from orders.export import KINDS, export_orders, parse_date
+from products.bulk_io import FORMATS, detect_format
+from products.management.commands.import_products import get_artisan
+
+
+class Command(BaseCommand):
+    help = 'Stream orders (or order items) to a CSV / JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=list(KINDS), default='orders',
+                            help='One row per order, or per order item (default: orders).')
+        parser.add_argument('--artisan', help="Only orders with this artisan's items (profile id or username).")
+        parser.add_argument('--since', help='First order date to include (YYYY-MM-DD).')
+        parser.add_argument('--until', help='Last order date to include (YYYY-MM-DD).')
+        parser.add_argument('--status', nargs='+', help='Only rows in these statuses.')
+        parser.add_argument('--live-only', action='store_true', help='Leave archived orders out.')
+        parser.add_argument('--format', choices=FORMATS, help='Output format (default: from --output, else csv).')
+        parser.add_argument('--output', help='File to write (default: stdout).')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched per round trip.')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or detect_format(options['output'])
+        try:
+            filters = {
+                'artisan': get_artisan(options['artisan']).user if options['artisan'] else None,
+                'since': parse_date(options['since'], '--since'),
+                'until': parse_date(options['until'], '--until'),
+                'statuses': options['status'],
+                'include_archive': not options['live_only'],
+            }
+        except ValidationError as exc:
+            raise CommandError(exc.messages[0])
+
+        def chunks():
+            return export_orders(options['kind'], fmt, options['chunk_size'], **filters)
+
+        if not options['output']:
+            for chunk in chunks():
+                self.stdout.write(chunk, ending='')
+            return
+        try:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as handle:
+                for chunk in chunks():
+                    handle.write(chunk)
+        except OSError as exc:
+            raise CommandError(f'Cannot write {options["output"]}: {exc}')
+        self.stdout.write(self.style.SUCCESS(f'Exported {options["kind"]} to {options["output"]}.'))
@@ -0,0 +1,38 @@
+"""
+Rebuild the per-artisan daily sales rollup and the ArtisanProfile
+total_sales / total_products counters from order items and products.
+
+Checkout keeps these current through background jobs; run this after bulk
+imports, raw SQL changes or anything else that bypasses them.
+
+Usage:
+    python manage.py rebuild_sales_rollups [--artisan USER_ID ...] [--batch-size 1000]
+"""
+
+from django.core.management.base import BaseCommand
+
+from artisans.models import ArtisanProfile
+from orders.rollups import rebuild_daily_sales, refresh_artisan_product_counts, refresh_artisan_sales
+
+
+class Command(BaseCommand):
+    help = 'Rebuild artisan daily sales rollups and sales/product counters.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--artisan', type=int, nargs='+', dest='artisans',
+                            help='Only rebuild these artisan user ids.')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Rollup rows inserted per statement (default 1000).')
+
+    def handle(self, *args, **options):
+        artisan_ids = options['artisans']
+        profiles = ArtisanProfile.objects.all()
+        if artisan_ids:
+            profiles = profiles.filter(user_id__in=artisan_ids)
+
+        rows = rebuild_daily_sales(artisan_ids, batch_size=options['batch_size'])
+        refresh_artisan_sales(profiles.values('user_id'))
+        counted = refresh_artisan_product_counts(profiles)
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {rows} daily rollup row(s); refreshed counters for {counted} artisan(s).'
+        ))
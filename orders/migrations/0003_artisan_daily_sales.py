@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_sales(apps, schema_editor):
+    """
+    Seed the rollup from existing orders, then ArtisanProfile.total_sales
+    from the rollup (the same rules as orders.rollups, on the models as of
+    this migration).
+    """
+    OrderItem = apps.get_model('orders', 'OrderItem')
+    ArtisanDailySales = apps.get_model('orders', 'ArtisanDailySales')
+    ArtisanProfile = apps.get_model('artisans', 'ArtisanProfile')
+
+    rows = (
+        OrderItem.objects.filter(artisan__isnull=False)
+        .exclude(order__order_status__in=('cancelled', 'refunded'))
+        .exclude(status='cancelled')
+        .annotate(day=TruncDate('order__created_at'))
+        .values('artisan_id', 'day')
+        .annotate(units=Sum('quantity'), revenue=Sum('subtotal'), order_count=Count('order_id', distinct=True))
+        .order_by('artisan_id', 'day')
+    )
+    batch = []
+    for row in rows.iterator(chunk_size=1000):
+        batch.append(ArtisanDailySales(**row))
+        if len(batch) >= 1000:
+            ArtisanDailySales.objects.bulk_create(batch)
+            batch = []
+    ArtisanDailySales.objects.bulk_create(batch)
+
+    units = ArtisanDailySales.objects.values('artisan_id').annotate(total=Sum('units')).order_by()
+    for row in units:
+        ArtisanProfile.objects.filter(user_id=row['artisan_id']).update(total_sales=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_order_idempotency_key'),
+        ('artisans', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArtisanDailySales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('units', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('order_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('artisan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Artisan Daily Sales',
+                'verbose_name_plural': 'Artisan Daily Sales',
+                'db_table': 'orders_artisan_daily_sales',
+                'constraints': [models.UniqueConstraint(fields=('artisan', 'day'), name='orders_artisan_day_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_sales, migrations.RunPython.noop),
+    ]
@@ -49,6 +49,9 @@ class Order(models.Model):
     order_status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     payment_status = models.CharField(max_length=20, choices=PAYMENT_STATUS, default='pending')
     
+    # Checkout token the order was placed with; a replayed POST finds this order
+    idempotency_key = models.CharField(max_length=64, blank=True, null=True)
+    
     # Notes
     notes = models.TextField(blank=True, null=True)
     tracking_number = models.CharField(max_length=100, blank=True, null=True)
@@ -68,6 +71,13 @@ class Order(models.Model):
             models.Index(fields=['customer', 'order_status']),
             models.Index(fields=['order_id']),
             models.Index(fields=['-created_at']),
+            # A customer's order history, newest first (keyset pages)
+            models.Index(fields=['customer', '-created_at', '-id'], name='orders_customer_created_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['customer', 'idempotency_key'], name='orders_order_idempotency_key_uniq'
+            ),
         ]
     
     def __str__(self):
@@ -112,6 +122,10 @@ class OrderItem(models.Model):
         db_table = 'orders_orderitem'
         verbose_name = 'Order Item'
         verbose_name_plural = 'Order Items'
+        indexes = [
+            # An artisan's received items, newest first (keyset pages, dashboard)
+            models.Index(fields=['artisan', '-created_at', '-id'], name='orders_item_artisan_idx'),
+        ]
     
     def __str__(self):
         return f"{self.product_name} (x{self.quantity}) in Order {self.order.order_id}"
@@ -154,3 +168,162 @@ class Shipment(models.Model):
     
     def __str__(self):
         return f"Shipment {self.tracking_number}"
+
+
+class ArtisanDailySales(models.Model):
+    """
+    Sales per artisan per day (order date, UTC), rolled up from order items
+    so dashboards read O(days) rows instead of order history. Maintained by
+    orders.rollups; cancelled and refunded orders are not counted.
+    """
+    artisan = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_sales')
+    day = models.DateField()
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    order_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'orders_artisan_daily_sales'
+        verbose_name = 'Artisan Daily Sales'
+        verbose_name_plural = 'Artisan Daily Sales'
+        constraints = [
+            models.UniqueConstraint(fields=['artisan', 'day'], name='orders_artisan_day_uniq'),
+        ]
+    
+    def __str__(self):
+        return f"{self.artisan} on {self.day}: {self.units} unit(s), {self.revenue}"
+
+
+class StatusTransition(models.Model):
+    """
+    Log of status changes made through orders.transitions: one compact row
+    per order, item or shipment moved, keyed by the order it belongs to.
+    """
+    KIND_CHOICES = (
+        ('order', 'Order'),
+        ('item', 'Order Item'),
+        ('shipment', 'Shipment'),
+    )
+    
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='transitions')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    from_status = models.CharField(max_length=20)
+    to_status = models.CharField(max_length=20)
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'orders_status_transition'
+        verbose_name = 'Status Transition'
+        verbose_name_plural = 'Status Transitions'
+        indexes = [
+            models.Index(fields=['order', 'created_at'], name='orders_transition_order_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.object_id}: {self.from_status} -> {self.to_status}"
+
+
+class ArchivedOrder(models.Model):
+    """
+    A delivered, cancelled or refunded order moved out of orders_order by
+    orders.archive. Keeps the original id and columns, so pages and links
+    built for Order work unchanged; `history` holds its StatusTransition log.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    order_id = models.CharField(max_length=50, unique=True)
+    customer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_orders')
+    
+    shipping_name = models.CharField(max_length=255)
+    shipping_email = models.EmailField()
+    shipping_phone = models.CharField(max_length=15)
+    shipping_address = models.TextField()
+    shipping_city = models.CharField(max_length=100)
+    shipping_state = models.CharField(max_length=100)
+    shipping_postal_code = models.CharField(max_length=20)
+    shipping_country = models.CharField(max_length=100)
+    
+    subtotal = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    shipping_cost = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    tax = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    discount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2)
+    
+    order_status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    payment_status = models.CharField(max_length=20, choices=Order.PAYMENT_STATUS)
+    idempotency_key = models.CharField(max_length=64, blank=True, null=True)
+    notes = models.TextField(blank=True, null=True)
+    tracking_number = models.CharField(max_length=100, blank=True, null=True)
+    
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    estimated_delivery = models.DateField(null=True, blank=True)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+    
+    history = models.JSONField(default=list, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'orders_order_archive'
+        verbose_name = 'Archived Order'
+        verbose_name_plural = 'Archived Orders'
+        indexes = [
+            models.Index(fields=['customer', '-created_at', '-id'], name='orders_archive_customer_idx'),
+        ]
+    
+    def __str__(self):
+        return f"Archived order {self.order_id}"
+
+
+class ArchivedOrderItem(models.Model):
+    """An OrderItem of an ArchivedOrder, with its original id and columns."""
+    id = models.BigIntegerField(primary_key=True)
+    order = models.ForeignKey(ArchivedOrder, on_delete=models.CASCADE, related_name='items')
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True, related_name='+')
+    artisan = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='archived_sold_items')
+    
+    product_name = models.CharField(max_length=255)
+    product_price = models.DecimalField(max_digits=10, decimal_places=2)
+    quantity = models.IntegerField()
+    subtotal = models.DecimalField(max_digits=12, decimal_places=2)
+    status = models.CharField(max_length=20, choices=OrderItem._meta.get_field('status').choices)
+    
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'orders_orderitem_archive'
+        verbose_name = 'Archived Order Item'
+        verbose_name_plural = 'Archived Order Items'
+        indexes = [
+            models.Index(fields=['artisan', '-created_at', '-id'], name='orders_archive_artisan_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.product_name} (x{self.quantity}) in archived order {self.order_id}"
+
+
+class ArchivedShipment(models.Model):
+    """The Shipment of an ArchivedOrder, with its original id and columns."""
+    id = models.BigIntegerField(primary_key=True)
+    order = models.OneToOneField(ArchivedOrder, on_delete=models.CASCADE, related_name='shipment')
+    tracking_number = models.CharField(max_length=100)
+    carrier = models.CharField(max_length=100)
+    
+    shipped_date = models.DateTimeField(null=True, blank=True)
+    estimated_delivery = models.DateField(null=True, blank=True)
+    delivered_date = models.DateTimeField(null=True, blank=True)
+    status = models.CharField(max_length=20, choices=Shipment._meta.get_field('status').choices)
+    
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'orders_shipment_archive'
+        verbose_name = 'Archived Shipment'
+        verbose_name_plural = 'Archived Shipments'
+    
+    def __str__(self):
+        return f"Archived shipment {self.tracking_number}"
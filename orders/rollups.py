@@ -0,0 +1,231 @@
+"""
+Per-artisan daily sales rollups
+
+`orders_artisan_daily_sales` holds one row per artisan per order day:
+units, revenue (sum of item subtotals) and number of orders, leaving out
+cancelled items and cancelled or refunded orders. Rows are
+maintained incrementally: after an order is placed (or changes status) the
+background job recomputes just the (artisan, day) pairs it touches from
+`orders_orderitem` and its archive (orders.archive), so rerunning it is
+harmless. Refreshes lock the artisans' profile rows first and read and write
+in the same transaction, so two jobs for the same artisan run one after
+the other and the later one always counts what the earlier one wrote. `manage.py rebuild_sales_rollups` rebuilds the table (and the
+ArtisanProfile counters) from scratch after imports or manual fixes.
+
+Dashboards read headline numbers and a daily series from the rollup with
+two small queries whatever the size of the order history.
+"""
+
+import heapq
+from datetime import timedelta
+from decimal import Decimal
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from artisans.models import ArtisanProfile
+from .models import ArchivedOrderItem, ArtisanDailySales, OrderItem
+
+
+# Orders in these states do not count towards an artisan's sales
+UNSOLD_STATUSES = ('cancelled', 'refunded')
+
+
+def sold_items(model=OrderItem):
+    """Items that count as sold, from the live tables or (ArchivedOrderItem) the archive."""
+    return (
+        model.objects.filter(artisan__isnull=False)
+        .exclude(order__order_status__in=UNSOLD_STATUSES)
+        .exclude(status='cancelled')
+    )
+
+
+def _daily_totals(items):
+    """(artisan, order day) groups of `items` with units, revenue and order count."""
+    return (
+        items.annotate(day=TruncDate('order__created_at'))
+        .values('artisan_id', 'day')
+        .annotate(units=Sum('quantity'), revenue=Sum('subtotal'), order_count=Count('order_id', distinct=True))
+        .order_by('artisan_id', 'day')
+    )
+
+
+def _merged_daily_totals(batch_size=1000, **filters):
+    """
+    _daily_totals over live and archived sold items matching `filters`, as
+    one stream sorted by (artisan, day). Both sides arrive sorted, so they
+    are merged without holding either in memory; an order is only ever on
+    one side, so the counts add up.
+    """
+    def key(row):
+        return row['artisan_id'], row['day']
+
+    streams = [
+        _daily_totals(sold_items(model).filter(**filters)).iterator(chunk_size=batch_size)
+        for model in (OrderItem, ArchivedOrderItem)
+    ]
+    for _, group in groupby(heapq.merge(*streams, key=key), key=key):
+        rows = list(group)
+        row = rows[0]
+        for other in rows[1:]:
+            row = {
+                **row,
+                'units': row['units'] + other['units'],
+                'revenue': row['revenue'] + other['revenue'],
+                'order_count': row['order_count'] + other['order_count'],
+            }
+        yield row
+
+
+def _rollup_row(row):
+    return ArtisanDailySales(
+        artisan_id=row['artisan_id'],
+        day=row['day'],
+        units=row['units'],
+        revenue=row['revenue'],
+        order_count=row['order_count'],
+    )
+
+
+def refresh_daily_sales(pairs):
+    """Recompute the rollup rows for these (artisan user id, day) pairs."""
+    pairs = set(pairs)
+    if not pairs:
+        return 0
+    artisan_ids = {artisan_id for artisan_id, _ in pairs}
+    days = {day for _, day in pairs}
+    with transaction.atomic():
+        # Serialize refreshes per artisan on their profile row (in id order, so
+        # they cannot deadlock) rather than the auth table logins write to; the
+        # totals are read after the lock, so a later job never writes older numbers
+        list(
+            ArtisanProfile.objects.select_for_update()
+            .filter(user_id__in=artisan_ids).order_by('pk').values_list('pk')
+        )
+        rows = [
+            _rollup_row(row)
+            for row in _merged_daily_totals(artisan_id__in=artisan_ids, order__created_at__date__in=days)
+            if (row['artisan_id'], row['day']) in pairs
+        ]
+        ArtisanDailySales.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['artisan', 'day'],
+            update_fields=['units', 'revenue', 'order_count', 'updated_at'],
+        )
+        # Pairs with nothing left to count (e.g. the only order was cancelled)
+        emptied = pairs - {(row.artisan_id, row.day) for row in rows}
+        if emptied:
+            ArtisanDailySales.objects.filter(
+                Q(*[Q(artisan_id=artisan_id, day=day) for artisan_id, day in emptied], _connector=Q.OR)
+            ).delete()
+    return len(rows)
+
+
+def order_sales_pairs(order_id):
+    """The (artisan user id, day) rollup rows an order contributes to, live or archived."""
+    pairs = set()
+    for model in (OrderItem, ArchivedOrderItem):
+        pairs.update(
+            model.objects.filter(order_id=order_id, artisan__isnull=False)
+            .annotate(day=TruncDate('order__created_at'))
+            .values_list('artisan_id', 'day')
+        )
+    return pairs
+
+
+def refresh_artisan_sales(user_ids):
+    """
+    Recompute ArtisanProfile.total_sales (units sold) for these artisan
+    users from their rollup rows, so archived orders still count.
+    """
+    sold = (
+        ArtisanDailySales.objects.filter(artisan=OuterRef('user'))
+        .order_by()
+        .values('artisan')
+        .annotate(units=Sum('units'))
+        .values('units')
+    )
+    return ArtisanProfile.objects.filter(user_id__in=user_ids).update(
+        total_sales=Coalesce(Subquery(sold, output_field=IntegerField()), Value(0))
+    )
+
+
+def refresh_artisan_product_counts(profiles):
+    """Recompute ArtisanProfile.total_products (active listings) for a profile queryset."""
+    from products.models import Product
+
+    listed = (
+        Product.objects.filter(artisan=OuterRef('pk'), status='active')
+        .order_by()
+        .values('artisan')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return profiles.update(total_products=Coalesce(Subquery(listed, output_field=IntegerField()), Value(0)))
+
+
+def rebuild_daily_sales(artisan_ids=None, batch_size=1000):
+    """
+    Rebuild the rollup from order items (for all artisans, or these user
+    ids) in one transaction. Returns the number of rows written.
+    """
+    filters = {}
+    existing = ArtisanDailySales.objects.all()
+    if artisan_ids is not None:
+        filters['artisan_id__in'] = artisan_ids
+        existing = existing.filter(artisan_id__in=artisan_ids)
+    written = 0
+    with transaction.atomic():
+        existing.delete()
+        batch = []
+        for row in _merged_daily_totals(batch_size, **filters):
+            batch.append(_rollup_row(row))
+            if len(batch) >= batch_size:
+                written += len(ArtisanDailySales.objects.bulk_create(batch))
+                batch = []
+        written += len(ArtisanDailySales.objects.bulk_create(batch))
+    return written
+
+
+def artisan_sales_summary(user, days=90, windows=(30, 90)):
+    """
+    Dashboard numbers for an artisan user from the rollup: lifetime and
+    per-window totals (one aggregate) and a zero-filled daily series for the
+    last `days` days, oldest first (one query).
+    """
+    today = timezone.now().date()
+    rows = ArtisanDailySales.objects.filter(artisan=user)
+
+    totals = {}
+    for key, since in [('lifetime', None)] + [(f'last_{n}', today - timedelta(days=n - 1)) for n in windows]:
+        in_window = Q(day__gte=since) if since else Q()
+        totals[f'{key}_units'] = Coalesce(Sum('units', filter=in_window), 0)
+        totals[f'{key}_revenue'] = Coalesce(Sum('revenue', filter=in_window), Decimal('0'))
+        totals[f'{key}_orders'] = Coalesce(Sum('order_count', filter=in_window), 0)
+    aggregated = rows.aggregate(**totals)
+    headline = {
+        key: {
+            'units': aggregated[f'{key}_units'],
+            'revenue': aggregated[f'{key}_revenue'],
+            'orders': aggregated[f'{key}_orders'],
+        }
+        for key in ['lifetime'] + [f'last_{n}' for n in windows]
+    }
+
+    start = today - timedelta(days=days - 1)
+    by_day = {row.day: row for row in rows.filter(day__gte=start)}
+    series = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = by_day.get(day)
+        series.append({
+            'day': day,
+            'units': row.units if row else 0,
+            'revenue': row.revenue if row else Decimal('0'),
+            'orders': row.order_count if row else 0,
+        })
+    return {'totals': headline, 'series': series}
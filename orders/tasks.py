@@ -0,0 +1,36 @@
+"""
+Background work queued by checkout (run by `manage.py run_workers`)
+
+Tasks can run more than once, so each one recomputes or re-sends from the
+order rather than applying increments.
+"""
+
+import logging
+
+from jobs.queue import task
+from .models import Order
+from .rollups import order_sales_pairs, refresh_artisan_sales, refresh_daily_sales
+
+
+logger = logging.getLogger("django.notifications")
+
+
+@task('orders.record_artisan_sales')
+def record_artisan_sales(order_id):
+    """Refresh the order's artisans' total_sales and their daily rollup rows for its day."""
+    pairs = order_sales_pairs(order_id)
+    # total_sales is summed from the rollup, so refresh that first
+    refresh_daily_sales(pairs)
+    refresh_artisan_sales({artisan_id for artisan_id, _ in pairs})
+
+
+@task('orders.notify_order_placed')
+def notify_order_placed(order_id):
+    """Order confirmation to the customer and a new-order notice to each artisan (log-only stubs)."""
+    order = Order.objects.filter(pk=order_id).select_related('customer').first()
+    if order is None:
+        return
+    logger.info(f"[NOTIFY] Order {order.order_id} confirmation to {order.shipping_email}")
+    items = order.items.filter(artisan__isnull=False).select_related('artisan')
+    for artisan in {item.artisan for item in items}:
+        logger.info(f"[NOTIFY] New order {order.order_id} for artisan {artisan.email or artisan.username}")
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from orders.archive import _copy, archive_cutoff, archive_old_orders, archive_orders
+from orders.models import (
+    ArchivedOrder, ArchivedOrderItem, ArchivedShipment, ArtisanDailySales, Order, OrderItem, Shipment,
+    StatusTransition,
+)
+from orders.rollups import rebuild_daily_sales, refresh_artisan_sales
+
+
+@override_settings(ORDER_ARCHIVE_AFTER_DAYS=365, ORDERS_PAGE_SIZE=3)
+class OrderArchiveTests(TestCase):
+    def setUp(self):
+        self.maker = User.objects.create_user(username='maker', password='pass123', role='artisan')
+        self.artisan = ArtisanProfile.objects.create(
+            user=self.maker, craft_type='pottery', description='d', workshop_location='x'
+        )
+        self.customer = User.objects.create_user(username='buyer', password='pass123', role='customer')
+        # Newest first: recent ones stay live, old finished ones get archived, old pending stays
+        plan = [(10, 'delivered'), (20, 'pending'), (400, 'pending'), (500, 'delivered'),
+                (600, 'cancelled'), (700, 'delivered'), (800, 'refunded')]
+        self.orders = [self._order(days_ago, status) for days_ago, status in plan]
+
+    def _order(self, days_ago, status):
+        order = Order.objects.create(
+            customer=self.customer, shipping_name='B', shipping_email='b@example.com', shipping_phone='1',
+            shipping_address='a', shipping_city='c', shipping_state='s', shipping_postal_code='1',
+            shipping_country='India', subtotal=Decimal('20.00'), total_amount=Decimal('20.60'),
+            order_status=status,
+        )
+        OrderItem.objects.create(
+            order=order, artisan=self.maker, product_name='Cup', product_price=Decimal('10.00'), quantity=2,
+            status='delivered' if status == 'delivered' else 'pending',
+        )
+        Order.objects.filter(pk=order.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return order
+
+    def test_old_finished_orders_move_with_items_shipments_and_history(self):
+        old = self.orders[3]
+        Shipment.objects.create(order=old, tracking_number='TRK1', carrier='Local Courier', status='delivered')
+        StatusTransition.objects.create(order=old, kind='order', object_id=old.pk, from_status='shipped',
+                                        to_status='delivered')
+
+        self.assertEqual(archive_old_orders(archive_cutoff(), batch_size=2, max_batches=1), 2)
+        self.assertEqual(archive_old_orders(archive_cutoff(), batch_size=2), 2)
+        self.assertEqual(archive_old_orders(archive_cutoff()), 0)
+
+        self.assertEqual(
+            set(Order.objects.values_list('pk', flat=True)), {order.pk for order in self.orders[:3]}
+        )
+        archived = ArchivedOrder.objects.get(pk=old.pk)
+        self.assertEqual((archived.order_id, archived.order_status), (old.order_id, 'delivered'))
+        self.assertEqual(archived.history[0][2:4], ['shipped', 'delivered'])
+        self.assertEqual(ArchivedOrderItem.objects.count(), 4)
+        self.assertEqual(ArchivedShipment.objects.get().order_id, old.pk)
+        self.assertFalse(OrderItem.objects.filter(order_id=old.pk).exists())
+        self.assertFalse(StatusTransition.objects.exists())
+
+    def test_id_already_in_the_archive_rolls_the_batch_back(self):
+        old = self.orders[3]
+        # A row with the same id is already in the archive
+        ArchivedOrder.objects.bulk_create(_copy(Order.objects.filter(pk=old.pk).values(), ArchivedOrder))
+        ArchivedOrder.objects.filter(pk=old.pk).update(order_id='ORD-CLASH')
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                archive_orders([old.pk, self.orders[4].pk])
+        self.assertEqual(Order.objects.filter(pk__in=[old.pk, self.orders[4].pk]).count(), 2)
+        self.assertEqual(OrderItem.objects.filter(order_id=old.pk).count(), 1)
+        self.assertEqual(ArchivedOrder.objects.count(), 1)
+
+    def test_history_and_detail_read_through_to_the_archive(self):
+        call_command('archive_orders', stdout=StringIO())
+        self.client.login(username='buyer', password='pass123')
+
+        seen = []
+        page = self.client.get(reverse('orders_list')).context['page']
+        while True:
+            seen.extend((order.pk, order.item_count) for order in page)
+            if not page.has_next:
+                break
+            page = self.client.get(reverse('orders_list'), {'after': page.next_cursor}).context['page']
+        self.assertEqual(seen, [(order.pk, 2) for order in self.orders])
+
+        previous = self.client.get(reverse('orders_list'), {'before': page.previous_cursor}).context['page']
+        self.assertEqual([order.pk for order in previous], [order.pk for order in self.orders[3:6]])
+
+        response = self.client.get(reverse('order_detail', args=[self.orders[5].pk]))
+        self.assertContains(response, self.orders[5].order_id)
+        self.assertEqual(len(response.context['order_items']), 1)
+        self.assertIsNone(response.context['shipment'])
+
+    def test_sales_rollup_keeps_archived_orders(self):
+        rebuild_daily_sales()
+        refresh_artisan_sales([self.maker.pk])
+        self.artisan.refresh_from_db()
+        before = (self.artisan.total_sales, ArtisanDailySales.objects.count())
+
+        out = StringIO()
+        call_command('archive_orders', '--dry-run', stdout=out)
+        self.assertIn('Would archive 4 order(s)', out.getvalue())
+        call_command('archive_orders', stdout=StringIO())
+        rebuild_daily_sales()
+        refresh_artisan_sales([self.maker.pk])
+        self.artisan.refresh_from_db()
+        self.assertEqual((self.artisan.total_sales, ArtisanDailySales.objects.count()), before)
+        self.assertEqual(before, (10, 5))
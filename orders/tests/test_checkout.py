@@ -1,10 +1,13 @@
 from decimal import Decimal
+from django.db import connection
 from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from accounts.models import User
 from artisans.models import ArtisanProfile
 from products.models import Product
 from cart.models import Cart, CartItem
+from orders.checkout import place_order
 from orders.models import Order, OrderItem
 
 
@@ -70,3 +73,72 @@ class CheckoutTests(TestCase):
         shipping_usd = (shipping_inr / Decimal(83)).quantize(Decimal('0.01'))
         self.assertEqual(order.shipping_cost, shipping_usd)
         self.assertEqual(order.total_amount, p.selling_price + shipping_usd)
+
+    def _checkout_queries(self, lines):
+        CartItem.objects.filter(cart=self.cart).delete()
+        for i in range(lines):
+            product = Product.objects.create(
+                artisan=self.artisan, name=f'Line {lines}-{i}', description='desc',
+                price=Decimal('20.00'), quantity_in_stock=10, image='products/placeholder.jpg'
+            )
+            CartItem.objects.create(cart=self.cart, product=product, quantity=2)
+        session = self.client.session
+        session['shipping'] = {
+            'full_name': 'Buyer Name', 'email': 'buyer@example.com', 'phone': '9999999999',
+            'address': '123 Test St', 'city': 'City', 'state': 'State', 'pincode': '123456',
+        }
+        session.save()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('checkout'))
+        order = Order.objects.filter(customer=self.user).latest('id')
+        self.assertRedirects(response, reverse('order_success', args=[order.id]), fetch_redirect_response=False)
+        self.assertEqual(order.items.count(), lines)
+        self.assertEqual(order.subtotal, Decimal('40.00') * lines)
+        self.assertFalse(self.cart.items.exists())
+        return len(queries)
+
+    def test_checkout_query_count_does_not_grow_with_cart_size(self):
+        self.assertEqual(self._checkout_queries(2), self._checkout_queries(12))
+        item = OrderItem.objects.filter(product__name='Line 12-0').get()
+        self.assertEqual((item.product_price, item.subtotal), (Decimal('20.00'), Decimal('40.00')))
+        item.product.refresh_from_db()
+        self.assertEqual((item.product.quantity_in_stock, item.product.sold_count), (8, 2))
+
+    def test_replayed_checkout_token_returns_the_first_order(self):
+        product = Product.objects.create(
+            artisan=self.artisan, name='Once', description='desc',
+            price=Decimal('20.00'), quantity_in_stock=5, image='products/placeholder.jpg'
+        )
+        CartItem.objects.create(cart=self.cart, product=product, quantity=2)
+        self.client.post(reverse('shipping'), data={
+            'full_name': 'Buyer Name', 'email': 'buyer@example.com', 'phone': '9999999999',
+            'address': '123 Test St', 'city': 'City', 'state': 'State', 'pincode': '123456',
+        })
+        token = self.client.get(reverse('checkout')).context['checkout_token']
+
+        first = self.client.post(reverse('checkout'), {'idempotency_key': token})
+        # Double click / load balancer retry: the cart is empty and shipping is gone by now
+        second = self.client.post(reverse('checkout'), {'idempotency_key': token})
+        order = Order.objects.get(customer=self.user)
+        self.assertEqual(order.idempotency_key, token)
+        self.assertEqual(first['Location'], reverse('order_success', args=[order.id]))
+        self.assertEqual(second['Location'], first['Location'])
+        product.refresh_from_db()
+        self.assertEqual((product.quantity_in_stock, product.sold_count), (3, 2))
+
+    def test_concurrent_copy_rolls_back_and_returns_the_winner(self):
+        product = Product.objects.create(
+            artisan=self.artisan, name='Raced', description='desc',
+            price=Decimal('20.00'), quantity_in_stock=5, image='products/placeholder.jpg'
+        )
+        CartItem.objects.create(cart=self.cart, product=product, quantity=1)
+        shipping = {'full_name': 'B', 'email': 'b@example.com', 'phone': '1', 'address': 'a',
+                    'city': 'c', 'state': 's', 'pincode': '1'}
+        # Both copies loaded the cart before either committed
+        lines = self.cart.load_lines()
+        winner = place_order(self.user, self.cart, lines, shipping, Decimal('0.60'), idempotency_key='k1')
+        loser = place_order(self.user, self.cart, lines, shipping, Decimal('0.60'), idempotency_key='k1')
+        self.assertEqual(loser, winner)
+        self.assertEqual(Order.objects.filter(customer=self.user).count(), 1)
+        product.refresh_from_db()
+        self.assertEqual(product.quantity_in_stock, 4)
@@ -0,0 +1,111 @@
+import csv
+import json
+import os
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from orders.archive import archive_orders
+from orders.export import ITEM_COLUMNS, ORDER_COLUMNS, export_orders
+from orders.models import Order, OrderItem
+
+
+class OrderExportTests(TestCase):
+    def setUp(self):
+        self.maker = User.objects.create_user(username='maker', password='pass123', role='artisan')
+        ArtisanProfile.objects.create(user=self.maker, craft_type='pottery', description='d', workshop_location='x')
+        self.other = User.objects.create_user(username='other', password='pass123', role='artisan')
+        ArtisanProfile.objects.create(user=self.other, craft_type='weaving', description='d', workshop_location='y')
+        self.customer = User.objects.create_user(
+            username='buyer', email='buyer@example.com', password='pass123', role='customer'
+        )
+        self.recent = self._order(2, 'pending', [(self.maker, 'pending'), (self.other, 'pending')])
+        self.shipped = self._order(10, 'processing', [(self.maker, 'shipped')])
+        self.old = self._order(500, 'delivered', [(self.maker, 'delivered')])
+
+    def _order(self, days_ago, status, items):
+        order = Order.objects.create(
+            customer=self.customer, shipping_name='B', shipping_email='b@example.com', shipping_phone='1',
+            shipping_address='a', shipping_city='Pune', shipping_state='s', shipping_postal_code='1',
+            shipping_country='India', subtotal=Decimal('20.00'), total_amount=Decimal('20.60'),
+            order_status=status,
+        )
+        for artisan, item_status in items:
+            OrderItem.objects.create(
+                order=order, artisan=artisan, product_name=f'Cup, by {artisan.username}',
+                product_price=Decimal('10.00'), quantity=2, status=item_status,
+            )
+        Order.objects.filter(pk=order.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return order
+
+    def _download(self, **params):
+        response = self.client.get(reverse('export_artisan_orders'), params)
+        self.assertEqual(response.status_code, 200)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_artisan_download_streams_only_their_items(self):
+        archive_orders([self.old.pk])
+        self.client.login(username='maker', password='pass123')
+
+        response, body = self._download()
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('attachment; filename="orders.csv"', response['Content-Disposition'])
+        rows = list(csv.DictReader(StringIO(body)))
+        self.assertEqual(list(rows[0]), list(ITEM_COLUMNS))
+        self.assertEqual([row['order_id'] for row in rows],
+                         [self.recent.order_id, self.shipped.order_id, self.old.order_id])
+        self.assertEqual({row['artisan'] for row in rows}, {'maker'})
+        self.assertEqual(rows[0]['product_name'], 'Cup, by maker')
+        self.assertEqual(rows[0]['subtotal'], '20.00')
+
+        response, body = self._download(format='jsonl', status='shipped')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([line['order_id'] for line in lines], [self.shipped.order_id])
+        self.assertEqual(lines[0]['shipping_city'], 'Pune')
+
+        since = (timezone.now() - timedelta(days=5)).date().isoformat()
+        _, body = self._download(format='jsonl', since=since)
+        self.assertEqual([json.loads(line)['order_id'] for line in body.splitlines()], [self.recent.order_id])
+
+    def test_bad_date_redirects_with_message(self):
+        self.client.login(username='maker', password='pass123')
+        response = self.client.get(reverse('export_artisan_orders'), {'until': 'yesterday'})
+        self.assertRedirects(response, reverse('artisan_orders'))
+
+    def test_customers_cannot_download(self):
+        self.client.login(username='buyer', password='pass123')
+        response = self.client.get(reverse('export_artisan_orders'))
+        self.assertNotEqual(response.status_code, 200)
+
+    def test_export_reads_in_chunks_without_duplicating_orders(self):
+        chunks = list(export_orders('orders', 'csv', chunk_size=1, artisan=self.maker))
+        rows = list(csv.DictReader(StringIO(''.join(chunks))))
+        self.assertEqual([row['order_id'] for row in rows],
+                         [self.recent.order_id, self.shipped.order_id, self.old.order_id])
+        self.assertEqual(rows[0]['customer_email'], 'buyer@example.com')
+
+    def test_command_writes_live_and_archived_orders(self):
+        archive_orders([self.old.pk])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'orders.jsonl')
+            call_command('export_orders', '--output', path, '--status', 'delivered', 'processing', stdout=StringIO())
+            with open(path, encoding='utf-8') as handle:
+                lines = [json.loads(line) for line in handle]
+        self.assertEqual(list(lines[0]), list(ORDER_COLUMNS))
+        self.assertEqual([line['order_id'] for line in lines], [self.shipped.order_id, self.old.order_id])
+
+        out = StringIO()
+        call_command('export_orders', '--kind', 'items', '--artisan', 'other', '--live-only', stdout=out)
+        rows = list(csv.DictReader(StringIO(out.getvalue())))
+        self.assertEqual([(row['order_id'], row['artisan']) for row in rows], [(self.recent.order_id, 'other')])
+
+        with self.assertRaises(CommandError):
+            call_command('export_orders', '--since', '2024-13-01', stdout=StringIO())
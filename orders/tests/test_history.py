@@ -0,0 +1,74 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from orders.models import Order, OrderItem, Shipment
+
+
+@override_settings(ORDERS_PAGE_SIZE=3)
+class OrderHistoryTests(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username='buyer', password='pass123', role='customer')
+        other = User.objects.create_user(username='other', password='pass123', role='customer')
+        now = timezone.now()
+        self.orders = []
+        for i in range(7):
+            order = self._order(self.customer, quantities=[1, i + 1])
+            Order.objects.filter(pk=order.pk).update(created_at=now - timedelta(hours=i))
+            self.orders.append(order)
+        self._order(other, quantities=[1])
+        self.client.login(username='buyer', password='pass123')
+
+    def _order(self, customer, quantities):
+        order = Order.objects.create(
+            customer=customer, shipping_name='B', shipping_email='b@example.com', shipping_phone='1',
+            shipping_address='a', shipping_city='c', shipping_state='s', shipping_postal_code='1',
+            shipping_country='India', subtotal=0, total_amount=Decimal('10.00'),
+        )
+        for quantity in quantities:
+            OrderItem.objects.create(
+                order=order, product_name='Cup', product_price=Decimal('5.00'), quantity=quantity
+            )
+        return order
+
+    def test_orders_list_pages_newest_first_with_item_counts(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('orders_list'))
+        page = response.context['page']
+        self.assertEqual([order.pk for order in page], [order.pk for order in self.orders[:3]])
+        self.assertEqual([order.item_count for order in page], [2, 3, 4])
+        self.assertTrue(page.has_next)
+
+        seen = []
+        while True:
+            seen.extend(order.pk for order in page)
+            if not page.has_next:
+                break
+            page = self.client.get(reverse('orders_list'), {'after': page.next_cursor}).context['page']
+        self.assertEqual(seen, [order.pk for order in self.orders])
+        self.assertLessEqual(len(queries), 4)
+
+    def test_order_detail_loads_order_items_and_shipment_in_two_queries(self):
+        order = self.orders[0]
+        Shipment.objects.create(order=order, tracking_number='TRK1', carrier='Local Courier')
+        # Session and user lookups are not part of the plan
+        self.client.get(reverse('orders_list'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('order_detail', args=[order.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'TRK1')
+        self.assertEqual(len(response.context['order_items']), 2)
+        order_queries = [q for q in queries if 'orders_' in q['sql']]
+        self.assertEqual(len(order_queries), 2)
+
+        response = self.client.get(reverse('order_detail', args=[self.orders[1].pk]))
+        self.assertIsNone(response.context['shipment'])
+
+    def test_other_customers_orders_are_not_shown(self):
+        foreign = Order.objects.exclude(customer=self.customer).get()
+        response = self.client.get(reverse('order_detail', args=[foreign.pk]))
+        self.assertRedirects(response, reverse('orders_list'))
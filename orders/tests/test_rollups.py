@@ -0,0 +1,107 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from jobs.queue import work
+from orders.archive import archive_orders
+from orders.models import ArtisanDailySales, Order, OrderItem
+from orders.rollups import artisan_sales_summary, order_sales_pairs, refresh_daily_sales
+from products.models import Product
+
+
+class ArtisanSalesRollupTests(TestCase):
+    def setUp(self):
+        self.maker = User.objects.create_user(username='maker', password='pass123', role='artisan')
+        self.artisan = ArtisanProfile.objects.create(
+            user=self.maker, craft_type='pottery', description='d', workshop_location='x'
+        )
+        self.cup = Product.objects.create(
+            artisan=self.artisan, name='Cup', description='d', price=Decimal('20.00'),
+            quantity_in_stock=50, image='products/placeholder.jpg'
+        )
+        self.customer = User.objects.create_user(username='eater', password='pass123', role='customer')
+        self.today = timezone.now().date()
+
+    def _order(self, quantity, days_ago=0, status='pending'):
+        order = Order.objects.create(
+            customer=self.customer, shipping_name='E', shipping_email='e@example.com', shipping_phone='1',
+            shipping_address='a', shipping_city='c', shipping_state='s', shipping_postal_code='1',
+            shipping_country='India', subtotal=0, total_amount=0, order_status=status,
+        )
+        OrderItem.objects.create(
+            order=order, product=self.cup, artisan=self.maker, product_name='Cup',
+            product_price=Decimal('20.00'), quantity=quantity,
+        )
+        Order.objects.filter(pk=order.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return order
+
+    def test_refresh_recomputes_only_the_order_day(self):
+        self._order(2)
+        order = self._order(1)
+        self._order(5, days_ago=3)
+        refresh_daily_sales(order_sales_pairs(order.pk))
+
+        row = ArtisanDailySales.objects.get()
+        self.assertEqual((row.day, row.units, row.revenue, row.order_count), (self.today, 3, Decimal('60.00'), 2))
+
+        # Cancelling the only order of a day empties that day's row
+        Order.objects.exclude(pk=order.pk).update(order_status='cancelled')
+        refresh_daily_sales(order_sales_pairs(order.pk))
+        self.assertEqual(ArtisanDailySales.objects.get().units, 1)
+        Order.objects.filter(pk=order.pk).update(order_status='cancelled')
+        refresh_daily_sales(order_sales_pairs(order.pk))
+        self.assertFalse(ArtisanDailySales.objects.exists())
+
+    def test_refresh_finds_the_pairs_of_an_archived_order(self):
+        order = self._order(4, days_ago=3, status='delivered')
+        archive_orders([order.pk])
+        day = self.today - timedelta(days=3)
+        self.assertEqual(order_sales_pairs(order.pk), {(self.maker.pk, day)})
+        refresh_daily_sales(order_sales_pairs(order.pk))
+        self.assertEqual(ArtisanDailySales.objects.get(day=day).units, 4)
+
+    def test_rebuild_command_and_dashboard_summary(self):
+        self._order(2)
+        self._order(4, days_ago=10)
+        self._order(1, days_ago=60)
+        self._order(7, days_ago=200)
+        self._order(9, days_ago=5, status='refunded')
+
+        out = StringIO()
+        call_command('rebuild_sales_rollups', stdout=out)
+        self.assertIn('Wrote 4 daily rollup row(s)', out.getvalue())
+        self.artisan.refresh_from_db()
+        self.assertEqual((self.artisan.total_sales, self.artisan.total_products), (14, 1))
+
+        summary = artisan_sales_summary(self.maker, days=90)
+        totals = summary['totals']
+        self.assertEqual(totals['lifetime'], {'units': 14, 'revenue': Decimal('280.00'), 'orders': 4})
+        self.assertEqual(totals['last_30']['units'], 6)
+        self.assertEqual(totals['last_90']['units'], 7)
+        series = summary['series']
+        self.assertEqual(len(series), 90)
+        self.assertEqual(series[-1], {'day': self.today, 'units': 2, 'revenue': Decimal('40.00'), 'orders': 1})
+        self.assertEqual(series[-11]['units'], 4)
+
+        self.client.login(username='maker', password='pass123')
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.context['sales_totals']['lifetime']['units'], 14)
+
+    def test_order_placed_job_maintains_the_rollup(self):
+        from cart.models import Cart, CartItem
+        from orders.checkout import place_order
+
+        cart = Cart.objects.create(user=self.customer)
+        CartItem.objects.create(cart=cart, product=self.cup, quantity=3)
+        shipping = {'full_name': 'E', 'email': 'e@example.com', 'phone': '1', 'address': 'a',
+                    'city': 'c', 'state': 's', 'pincode': '1'}
+        place_order(self.customer, cart, cart.load_lines(), shipping, Decimal('0.60'))
+        with self.assertLogs('django.notifications', level='INFO'):
+            work(burst=True)
+        row = ArtisanDailySales.objects.get(artisan=self.maker)
+        self.assertEqual((row.units, row.revenue, row.order_count), (3, Decimal('60.00'), 1))
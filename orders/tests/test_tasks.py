@@ -0,0 +1,45 @@
+from decimal import Decimal
+from django.test import TestCase
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from cart.models import Cart, CartItem
+from jobs.models import Job
+from jobs.queue import work
+from orders.checkout import place_order
+from products.models import Product
+
+
+class OrderPlacedTasksTests(TestCase):
+    def test_checkout_queues_follow_ups_that_workers_apply(self):
+        artisan_user = User.objects.create_user(username='maker', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=artisan_user, craft_type='pottery', description='d', workshop_location='x'
+        )
+        product = Product.objects.create(
+            artisan=artisan, name='Cup', description='d', price=Decimal('20.00'),
+            quantity_in_stock=10, image='products/placeholder.jpg'
+        )
+        customer = User.objects.create_user(username='eater', password='pass123', role='customer')
+        cart = Cart.objects.create(user=customer)
+        CartItem.objects.create(cart=cart, product=product, quantity=3)
+        shipping = {'full_name': 'E', 'email': 'e@example.com', 'phone': '1', 'address': 'a',
+                    'city': 'c', 'state': 's', 'pincode': '1'}
+
+        order = place_order(customer, cart, cart.load_lines(), shipping, Decimal('0.60'))
+        self.assertEqual(
+            sorted(Job.objects.values_list('task', flat=True)),
+            ['orders.notify_order_placed', 'orders.record_artisan_sales'],
+        )
+        artisan.refresh_from_db()
+        self.assertEqual(artisan.total_sales, 0)
+
+        with self.assertLogs('django.notifications', level='INFO') as logs:
+            work(burst=True)
+        self.assertTrue(any(order.order_id in line for line in logs.output))
+        artisan.refresh_from_db()
+        self.assertEqual(artisan.total_sales, 3)
+        # Re-running a job (at-least-once delivery) does not double count
+        Job.objects.update(status=Job.QUEUED)
+        work(burst=True)
+        artisan.refresh_from_db()
+        self.assertEqual(artisan.total_sales, 3)
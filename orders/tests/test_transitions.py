@@ -0,0 +1,139 @@
+import json
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from jobs.models import Job
+from orders.models import Order, OrderItem, Shipment, StatusTransition
+from orders.transitions import (
+    InvalidTransition, sync_order_statuses, transition_items, transition_orders, transition_shipments,
+)
+from products.models import Product
+
+
+class StatusTransitionTests(TestCase):
+    def setUp(self):
+        self.maker = User.objects.create_user(username='maker', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=self.maker, craft_type='pottery', description='d', workshop_location='x'
+        )
+        self.cup = Product.objects.create(
+            artisan=artisan, name='Cup', description='d', price=Decimal('20.00'),
+            quantity_in_stock=10, sold_count=5, image='products/placeholder.jpg'
+        )
+        self.customer = User.objects.create_user(username='eater', password='pass123', role='customer')
+
+    def _order(self, lines=2):
+        order = Order.objects.create(
+            customer=self.customer, shipping_name='E', shipping_email='e@example.com', shipping_phone='1',
+            shipping_address='a', shipping_city='c', shipping_state='s', shipping_postal_code='1',
+            shipping_country='India', subtotal=0, total_amount=0,
+        )
+        for _ in range(lines):
+            OrderItem.objects.create(
+                order=order, product=self.cup, artisan=self.maker, product_name='Cup',
+                product_price=Decimal('20.00'), quantity=1,
+            )
+        return order
+
+    def _statuses(self, order):
+        order.refresh_from_db()
+        return order.order_status, sorted(order.items.values_list('status', flat=True))
+
+    def test_bulk_item_moves_roll_up_to_orders(self):
+        first, second = self._order(), self._order()
+        self.assertEqual(transition_items(OrderItem.objects.all(), 'processing'), 4)
+        self.assertEqual(self._statuses(first), ('processing', ['processing', 'processing']))
+
+        transition_items(first.items.all()[:1], 'shipped')
+        self.assertEqual(self._statuses(first)[0], 'processing')
+        transition_items(OrderItem.objects.all(), 'shipped')
+        self.assertEqual(self._statuses(second), ('shipped', ['shipped', 'shipped']))
+        self.assertEqual(StatusTransition.objects.filter(kind='item').count(), 8)
+        self.assertEqual(StatusTransition.objects.filter(kind='order').count(), 4)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        few = [self._order(1)]
+        many = [self._order(3) for _ in range(3)]
+        with CaptureQueriesContext(connection) as small:
+            transition_items(OrderItem.objects.filter(order__in=few), 'processing')
+        with CaptureQueriesContext(connection) as large:
+            transition_items(OrderItem.objects.filter(order__in=many), 'processing')
+        self.assertEqual(len(small), len(large))
+
+    def test_invalid_transition_changes_nothing(self):
+        order = self._order()
+        transition_items(order.items.all()[:1], 'cancelled')
+        with self.assertRaises(InvalidTransition) as raised:
+            transition_items(order.items.all(), 'processing')
+        self.assertEqual(len(raised.exception.failures), 1)
+        self.assertEqual(self._statuses(order), ('pending', ['cancelled', 'pending']))
+
+    def test_cancelling_releases_stock_and_queues_sales_refresh(self):
+        order = self._order()
+        transition_orders(Order.objects.filter(pk=order.pk), 'cancelled')
+        self.assertEqual(self._statuses(order), ('cancelled', ['cancelled', 'cancelled']))
+        self.cup.refresh_from_db()
+        self.assertEqual((self.cup.quantity_in_stock, self.cup.sold_count), (12, 3))
+        self.assertTrue(Job.objects.filter(task='orders.record_artisan_sales', payload={'order_id': order.pk}).exists())
+        with self.assertRaises(InvalidTransition):
+            transition_orders(Order.objects.filter(pk=order.pk), 'shipped')
+
+    def test_orders_with_shipped_items_cannot_be_cancelled(self):
+        order, open_order = self._order(), self._order()
+        transition_items(order.items.all()[:1], 'shipped')
+        self.assertEqual(self._statuses(order), ('processing', ['pending', 'shipped']))
+
+        with self.assertRaises(InvalidTransition) as raised:
+            transition_orders(Order.objects.all(), 'cancelled')
+        self.assertEqual(raised.exception.failures, [(order.pk, 'processing', 'cancelled')])
+        self.assertEqual(self._statuses(open_order), ('pending', ['pending', 'pending']))
+
+        self.assertEqual(transition_orders(Order.objects.all(), 'cancelled', strict=False), 1)
+        self.assertEqual(self._statuses(order), ('processing', ['pending', 'shipped']))
+        self.assertEqual(self._statuses(open_order), ('cancelled', ['cancelled', 'cancelled']))
+
+    def test_shipment_delivery_delivers_items_and_order(self):
+        order = self._order()
+        shipment = Shipment.objects.create(order=order, tracking_number='TRK1', carrier='Local Courier')
+        transition_shipments(Shipment.objects.all(), 'in_transit')
+        self.assertEqual(self._statuses(order), ('shipped', ['shipped', 'shipped']))
+        transition_shipments(Shipment.objects.all(), 'delivered')
+        self.assertEqual(self._statuses(order), ('delivered', ['delivered', 'delivered']))
+        shipment.refresh_from_db()
+        order.refresh_from_db()
+        self.assertIsNotNone(shipment.delivered_date)
+        self.assertIsNotNone(order.delivered_at)
+        self.assertEqual(sync_order_statuses([order.pk]), 0)
+
+    def test_artisan_bulk_endpoint(self):
+        order = self._order()
+        other_maker = User.objects.create_user(username='other', password='pass123', role='artisan')
+        foreign = OrderItem.objects.create(
+            order=order, product=self.cup, artisan=other_maker, product_name='Cup',
+            product_price=Decimal('20.00'), quantity=1,
+        )
+        self.client.login(username='maker', password='pass123')
+        ids = list(order.items.values_list('pk', flat=True))
+        response = self.client.post(
+            reverse('update_item_status'), json.dumps({'item_ids': ids, 'status': 'shipped'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.json(), {'updated': 2, 'orders': {order.order_id: 'processing'}})
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, 'pending')
+
+        response = self.client.post(
+            reverse('update_item_status'), json.dumps({'item_ids': ids, 'status': 'processing'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(len(response.json()['failures']), 2)
+
+        response = self.client.post(reverse('update_item_status'), {'item_ids': ids, 'status': 'delivered'})
+        self.assertRedirects(response, reverse('artisan_orders'))
+        page = self.client.get(reverse('artisan_orders'), {'status': 'delivered'})
+        self.assertEqual(len(page.context['items']), 2)
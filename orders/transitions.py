@@ -0,0 +1,264 @@
+"""
+Order status transitions
+
+Orders, order items and shipments move through the states in the
+*_TRANSITIONS tables below; anything else raises InvalidTransition. Each
+`transition_*` call handles any number of rows in one transaction:
+
+1. the rows are loaded (and locked where the database supports it) with one
+   query and every move is validated, all or nothing;
+2. the new statuses are written with one `bulk_update`, and one
+   StatusTransition row per change is written with one `bulk_create`;
+3. changes cascade down: a cancelled or shipped order moves its items, a
+   shipment in transit or delivered moves its order's items (an order with
+   items already shipped or delivered cannot be cancelled);
+4. changes roll up: the status of every order whose items moved is
+   recomputed from its items with one aggregate query (sync_order_statuses).
+
+Cancelling items puts their stock back (products.stock.release_stock).
+Cancellations and refunds change what counts as sold, so they queue the
+orders.record_artisan_sales job for the orders involved.
+"""
+
+import logging
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from jobs.queue import enqueue_many
+from products.stock import release_stock
+from .models import Order, OrderItem, Shipment, StatusTransition
+
+
+logger = logging.getLogger("django.orders")
+
+ORDER_TRANSITIONS = {
+    'pending': ('confirmed', 'processing', 'shipped', 'delivered', 'cancelled'),
+    'confirmed': ('processing', 'shipped', 'delivered', 'cancelled'),
+    'processing': ('shipped', 'delivered', 'cancelled'),
+    'shipped': ('delivered', 'refunded'),
+    'delivered': ('refunded',),
+    'cancelled': (),
+    'refunded': (),
+}
+
+ITEM_TRANSITIONS = {
+    'pending': ('processing', 'shipped', 'delivered', 'cancelled'),
+    'processing': ('shipped', 'delivered', 'cancelled'),
+    'shipped': ('delivered',),
+    'delivered': (),
+    'cancelled': (),
+}
+
+SHIPMENT_TRANSITIONS = {
+    'pending': ('in_transit', 'out_for_delivery', 'delivered'),
+    'in_transit': ('out_for_delivery', 'delivered'),
+    'out_for_delivery': ('delivered',),
+    'delivered': (),
+}
+
+# Item status that follows each shipment status
+SHIPMENT_ITEM_STATUS = {'in_transit': 'shipped', 'out_for_delivery': 'shipped', 'delivered': 'delivered'}
+
+# Order statuses that take an order out of (or back into) artisan sales
+SALES_STATUSES = ('cancelled', 'refunded')
+
+# Item statuses past the point where an order can still be cancelled
+DISPATCHED_ITEM_STATUSES = ('shipped', 'delivered')
+
+
+class InvalidTransition(Exception):
+    """One or more rows cannot move to the requested status."""
+
+    def __init__(self, kind, failures):
+        self.kind = kind
+        # (pk, current status, requested status) per row
+        self.failures = failures
+        super().__init__('; '.join(
+            f'{kind} {pk}: {current} -> {target} is not allowed' for pk, current, target in failures
+        ))
+
+
+def can_transition(transitions, current, target):
+    return target in transitions.get(current, ())
+
+
+def _validate(kind, transitions, rows, field, target, strict):
+    """The rows that move to `target`; rows already there are left alone."""
+    if target not in transitions:
+        raise ValueError(f'Unknown {kind} status "{target}"')
+    pending = [row for row in rows if getattr(row, field) != target]
+    failures = [
+        (row.pk, getattr(row, field), target)
+        for row in pending
+        if not can_transition(transitions, getattr(row, field), target)
+    ]
+    if failures and strict:
+        raise InvalidTransition(kind, failures)
+    return [row for row in pending if can_transition(transitions, getattr(row, field), target)]
+
+
+def _apply(model, kind, rows, field, target, actor, order_of, extra_fields=()):
+    """Write `target` to the rows with one bulk_update and log each change."""
+    if not rows:
+        return
+    now = timezone.now()
+    log = []
+    for row in rows:
+        log.append(StatusTransition(
+            order_id=order_of(row), kind=kind, object_id=row.pk,
+            from_status=getattr(row, field), to_status=target, actor=actor,
+        ))
+        setattr(row, field, target)
+        row.updated_at = now
+    model.objects.bulk_update(rows, [field, 'updated_at', *extra_fields])
+    StatusTransition.objects.bulk_create(log)
+
+
+def _refresh_sales(order_ids):
+    enqueue_many(('orders.record_artisan_sales', {'order_id': order_id}) for order_id in sorted(order_ids))
+
+
+def transition_items(items, target, actor=None, strict=True):
+    """
+    Move order items (a queryset) to `target`. With `strict`, any item that
+    cannot move raises InvalidTransition and nothing changes; otherwise such
+    items are skipped. Returns the number of items moved.
+    """
+    with transaction.atomic():
+        rows = list(
+            items.select_for_update().only('id', 'order_id', 'product_id', 'quantity', 'status')
+        )
+        moved = _validate('item', ITEM_TRANSITIONS, rows, 'status', target, strict)
+        _apply(OrderItem, 'item', moved, 'status', target, actor, lambda item: item.order_id)
+        if not moved:
+            return 0
+        order_ids = {item.order_id for item in moved}
+        if target == 'cancelled':
+            release_stock((item.product_id, item.quantity) for item in moved if item.product_id)
+            _refresh_sales(order_ids)
+        sync_order_statuses(order_ids, actor)
+    logger.info(f"[ORDERS] {len(moved)} item(s) in {len(order_ids)} order(s) -> {target} by {actor}")
+    return len(moved)
+
+
+def derived_order_status(total, cancelled, started, shipped, delivered):
+    """
+    The order status implied by its item counts (items in processing or
+    later, shipped or later, delivered), or None to leave it as it is.
+    """
+    live = total - cancelled
+    if not total:
+        return None
+    if not live:
+        return 'cancelled'
+    if delivered == live:
+        return 'delivered'
+    if shipped == live:
+        return 'shipped'
+    if started:
+        return 'processing'
+    return None
+
+
+def sync_order_statuses(order_ids, actor=None):
+    """
+    Recompute these orders' statuses from their items (one aggregate query)
+    and save the ones that change. Returns the number of orders changed.
+    """
+    orders = Order.objects.filter(pk__in=order_ids).only('id', 'order_status', 'delivered_at').annotate(
+        items_total=Count('items'),
+        items_cancelled=Count('items', filter=Q(items__status='cancelled')),
+        items_started=Count('items', filter=Q(items__status__in=('processing', 'shipped', 'delivered'))),
+        items_shipped=Count('items', filter=Q(items__status__in=('shipped', 'delivered'))),
+        items_delivered=Count('items', filter=Q(items__status='delivered')),
+    )
+    changes = {}
+    for order in orders:
+        status = derived_order_status(
+            order.items_total, order.items_cancelled, order.items_started,
+            order.items_shipped, order.items_delivered,
+        )
+        if status and status != order.order_status and can_transition(ORDER_TRANSITIONS, order.order_status, status):
+            changes.setdefault(status, []).append(order)
+    for status, moved in changes.items():
+        _set_order_status(moved, status, actor)
+    return sum(len(moved) for moved in changes.values())
+
+
+def _set_order_status(orders, target, actor):
+    if target == 'delivered':
+        now = timezone.now()
+        for order in orders:
+            order.delivered_at = order.delivered_at or now
+    _apply(Order, 'order', orders, 'order_status', target, actor, lambda order: order.pk, ('delivered_at',))
+    if target in SALES_STATUSES:
+        _refresh_sales(order.pk for order in orders)
+
+
+def transition_orders(orders, target, actor=None, strict=True):
+    """
+    Move orders (a queryset) to `target`, moving their items along where
+    the item states allow it. Returns the number of orders moved.
+    """
+    with transaction.atomic():
+        rows = list(orders.select_for_update().only('id', 'order_status', 'delivered_at'))
+        moved = _validate('order', ORDER_TRANSITIONS, rows, 'order_status', target, strict)
+        if target == 'cancelled':
+            moved = _without_dispatched_items(moved, strict)
+        if not moved:
+            return 0
+        _set_order_status(moved, target, actor)
+        if target in ITEM_TRANSITIONS:
+            transition_items(
+                OrderItem.objects.filter(order_id__in=[order.pk for order in moved]), target, actor, strict=False
+            )
+    logger.info(f"[ORDERS] {len(moved)} order(s) -> {target} by {actor}")
+    return len(moved)
+
+
+def _without_dispatched_items(orders, strict):
+    """
+    Orders with no item shipped or delivered yet (one query): those are
+    refunded, not cancelled. With `strict` any other order raises InvalidTransition.
+    """
+    dispatched = set(
+        OrderItem.objects.filter(order_id__in=[order.pk for order in orders], status__in=DISPATCHED_ITEM_STATUSES)
+        .values_list('order_id', flat=True)
+    )
+    if dispatched and strict:
+        raise InvalidTransition('order', [
+            (order.pk, order.order_status, 'cancelled')
+            for order in orders if order.pk in dispatched
+        ])
+    return [order for order in orders if order.pk not in dispatched]
+
+
+def transition_shipments(shipments, target, actor=None, strict=True):
+    """
+    Move shipments (a queryset) to `target`, stamping shipped/delivered
+    dates and moving their orders' items along. Returns the number moved.
+    """
+    with transaction.atomic():
+        rows = list(
+            shipments.select_for_update().only('id', 'order_id', 'status', 'shipped_date', 'delivered_date')
+        )
+        moved = _validate('shipment', SHIPMENT_TRANSITIONS, rows, 'status', target, strict)
+        if not moved:
+            return 0
+        now = timezone.now()
+        for shipment in moved:
+            shipment.shipped_date = shipment.shipped_date or now
+            if target == 'delivered':
+                shipment.delivered_date = now
+        _apply(
+            Shipment, 'shipment', moved, 'status', target, actor, lambda shipment: shipment.order_id,
+            ('shipped_date', 'delivered_date'),
+        )
+        transition_items(
+            OrderItem.objects.filter(order_id__in=[shipment.order_id for shipment in moved]),
+            SHIPMENT_ITEM_STATUS[target], actor, strict=False,
+        )
+    logger.info(f"[ORDERS] {len(moved)} shipment(s) -> {target} by {actor}")
+    return len(moved)
@@ -7,4 +7,7 @@ urlpatterns = [
     path('checkout/', views.checkout_view, name='checkout'),
     path('order-success/<int:order_id>/', views.order_success_view, name='order_success'),
     path('<int:order_id>/', views.order_detail_view, name='order_detail'),
+    path('received/', views.artisan_orders_view, name='artisan_orders'),
+    path('received/status/', views.update_item_status_view, name='update_item_status'),
+    path('received/export/', views.export_artisan_orders_view, name='export_artisan_orders'),
 ]
@@ -1,13 +1,32 @@
 from django.shortcuts import render, redirect
 from django.views.decorators.http import require_http_methods
 from django.contrib import messages
-from django.db import transaction
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse, StreamingHttpResponse
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
 from decimal import Decimal
+import json
+import logging
 
-from accounts.decorators import login_required
+from accounts.decorators import artisan_required, login_required
 from cart.models import Cart
+from core.pagination import KeysetPaginator, MergedKeysetPaginator, get_page_size
+from products.bulk_io import FORMATS
 from products.models import Product
-from .models import Order, OrderItem, Shipment
+from products.stock import OutOfStock
+from .checkout import (
+    SHIPPING_FIELDS, clean_idempotency_key, new_checkout_token,
+    place_order, replayed_order, shipping_cost_usd,
+)
+from .archive import find_order
+from .export import export_orders, parse_date
+from .models import ArchivedOrder, Order, OrderItem
+from .transitions import ITEM_TRANSITIONS, InvalidTransition, transition_items
+
+logger = logging.getLogger("django.checkout")
 
 
 # ----------------------------
@@ -17,10 +36,20 @@ from .models import Order, OrderItem, Shipment
 @login_required
 @require_http_methods(["GET"])
 def orders_list_view(request):
-    orders = Order.objects.filter(customer=request.user).order_by("-created_at")
+    """A customer's orders, newest first, one keyset page at a time (live and archived)."""
+    orders = [
+        model.objects.filter(customer=request.user).annotate(item_count=Coalesce(Sum("items__quantity"), 0))
+        for model in (Order, ArchivedOrder)
+    ]
+    per_page = get_page_size(request, settings.ORDERS_PAGE_SIZE, settings.ORDERS_MAX_PAGE_SIZE)
+    page = MergedKeysetPaginator(orders, ("-created_at", "-id"), per_page).page(
+        after=request.GET.get("after"),
+        before=request.GET.get("before"),
+    )
 
     return render(request, "orders/orders_list.html", {
-        "orders": orders
+        "orders": page.object_list,
+        "page": page,
     })
 
 
@@ -68,15 +97,25 @@ def shipping_view(request):
 @require_http_methods(["GET", "POST"])
 def checkout_view(request):
 
+    if request.method == "POST":
+        # A repeated submit of the same checkout page gets the order it already placed
+        idempotency_key = clean_idempotency_key(
+            request.POST.get('idempotency_key') or request.headers.get('Idempotency-Key')
+        )
+        order = replayed_order(request.user, idempotency_key)
+        if order:
+            logger.info(f"[CHECKOUT] Replayed order {order.order_id} for user {request.user}")
+            return redirect("order_success", order_id=order.id)
+
     try:
         cart = Cart.objects.get(user=request.user)
     except Cart.DoesNotExist:
         messages.error(request, "Your cart is empty.")
         return redirect("products_list")
 
-    cart_items = cart.items.all()
+    cart_items = cart.load_lines()
 
-    if not cart_items.exists():
+    if not cart_items:
         messages.error(request, "Your cart is empty.")
         return redirect("products_list")
 
@@ -87,97 +126,37 @@ def checkout_view(request):
         return redirect('shipping')
 
     if request.method == "POST":
-        import logging
-        from decimal import Decimal, ROUND_HALF_UP
-        logger = logging.getLogger("django.checkout")
-
         # Use shipping info from session
         shipping = request.session.get('shipping', {})
-        full_name = shipping.get('full_name', '').strip()
-        email = shipping.get('email', '').strip()
-        phone = shipping.get('phone', '').strip()
-        address = shipping.get('address', '').strip()
-        city = shipping.get('city', '').strip()
-        state = shipping.get('state', '').strip()
-        pincode = shipping.get('pincode', '').strip()
-
-        if not all([full_name, email, phone, address, city, state, pincode]):
+        if not all(shipping.get(field, '').strip() for field in SHIPPING_FIELDS):
             messages.error(request, "Please fill all shipping fields.")
             return redirect('shipping')
 
-        # Server-side stock validation
-        for item in cart_items:
-            if item.quantity > item.product.quantity_in_stock:
-                messages.error(request, f"Not enough stock for {item.product.name}. Only {item.product.quantity_in_stock} left.")
-                logger.warning(f"[CHECKOUT] Stock error for {item.product.name}: requested {item.quantity}, in stock {item.product.quantity_in_stock}")
-                return redirect('checkout')
-
-        # shipping cost in INR (configurable via settings)
-        from django.conf import settings
-        rate = Decimal(getattr(settings, 'USD_TO_INR_RATE', 83))
-        shipping_inr = Decimal(getattr(settings, 'SHIPPING_COST_INR', 50))
-        shipping_usd = (shipping_inr / rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-        with transaction.atomic():
-            order = Order.objects.create(
-                customer=request.user,
-                shipping_name=full_name,
-                shipping_email=email,
-                shipping_phone=phone,
-                shipping_address=address,
-                shipping_city=city,
-                shipping_state=state,
-                shipping_postal_code=pincode,
-                shipping_country="India",
-                subtotal=cart.get_total_price(),
-                shipping_cost=shipping_usd,
-                total_amount=(cart.get_total_price() + shipping_usd),
+        try:
+            # Stock is checked and taken by the database (products.stock);
+            # any shortage rolls back the whole order
+            order = place_order(
+                request.user, cart, cart_items, shipping, shipping_cost_usd(), idempotency_key=idempotency_key
             )
-            logger.info(f"[ORDER] Created order {order.order_id} for user {request.user}")
-
-            for item in cart_items:
-                artisan_user = None
-                if item.product.artisan:
-                    artisan_user = item.product.artisan.user
-
-                oi = OrderItem.objects.create(
-                    order=order,
-                    product=item.product,
-                    artisan=artisan_user,
-                    product_name=item.product.name,
-                    product_price=(item.product.selling_price if item.product.selling_price is not None else item.product.price),
-                    quantity=item.quantity,
-                    subtotal=item.get_total_price(),
-                )
-                logger.info(f"[ORDER] Created OrderItem {oi.id} for product {item.product.name} (artisan: {artisan_user})")
-
-                # Update product stock
-                item.product.quantity_in_stock -= item.quantity
-                if item.product.quantity_in_stock < 0:
-                    item.product.quantity_in_stock = 0
-                item.product.save()
-                logger.info(f"[CHECKOUT] Stock updated for {item.product.name}: now {item.product.quantity_in_stock}")
-
-            cart.clear()
-            # Clear shipping session after successful order
-            if 'shipping' in request.session:
-                del request.session['shipping']
-            logger.info(f"[CHECKOUT] Order {order.order_id} placed by {request.user}")
+        except OutOfStock as e:
+            messages.error(request, f"Not enough stock for {e.name}. Only {e.available} left.")
+            logger.warning(f"[CHECKOUT] Stock error for {e.name}: requested {e.requested}, in stock {e.available}")
+            return redirect('checkout')
+
+        # Clear shipping session after successful order
+        if 'shipping' in request.session:
+            del request.session['shipping']
+        logger.info(f"[CHECKOUT] Order {order.order_id} placed by {request.user}")
 
         return redirect("order_success", order_id=order.id)
 
     # GET: show summary with shipping from session
-    from decimal import Decimal
-    from django.conf import settings
-    rate = Decimal(getattr(settings, 'USD_TO_INR_RATE', 83))
-    shipping_inr = Decimal(getattr(settings, 'SHIPPING_COST_INR', 50))
-    shipping_usd = (shipping_inr / rate).quantize(Decimal('0.01'))
-
     return render(request, "orders/checkout.html", {
         "cart_items": cart_items,
-        "cart_total": cart.get_total_price(),
+        "cart_total": cart_items.total,
         "shipping": shipping,
-        "shipping_usd": shipping_usd
+        "shipping_usd": shipping_cost_usd(),
+        "checkout_token": new_checkout_token(),
     })
 
 
@@ -211,17 +190,129 @@ def order_success_view(request, order_id):
 @require_http_methods(["GET"])
 def order_detail_view(request, order_id):
 
-    try:
-        order = Order.objects.get(id=order_id, customer=request.user)
-    except Order.DoesNotExist:
+    # Two queries: the order joined to its shipment, then its items
+    # (archived orders are looked up when the live table has no match)
+    order = find_order(request.user, order_id)
+    if order is None:
         messages.error(request, "Order not found.")
         return redirect("orders_list")
 
-    order_items = order.orderitem_set.all()
-    shipment = Shipment.objects.filter(order=order).first()
+    try:
+        shipment = order.shipment
+    except ObjectDoesNotExist:
+        shipment = None
 
     return render(request, "orders/order_detail.html", {
         "order": order,
-        "order_items": order_items,
+        "order_items": order.items.all(),
         "shipment": shipment
     })
+
+
+# ----------------------------
+# Artisan: Orders Received
+# ----------------------------
+
+@artisan_required
+@require_http_methods(["GET"])
+def artisan_orders_view(request):
+    """Items of the artisan's products that were ordered, newest first, with bulk status controls."""
+    items = OrderItem.objects.filter(artisan=request.user).select_related("order")
+    status = request.GET.get("status", "")
+    if status in ITEM_TRANSITIONS:
+        items = items.filter(status=status)
+    per_page = get_page_size(request, settings.ORDERS_PAGE_SIZE, settings.ORDERS_MAX_PAGE_SIZE)
+    page = KeysetPaginator(items, ("-created_at", "-id"), per_page).page(
+        after=request.GET.get("after"),
+        before=request.GET.get("before"),
+    )
+
+    return render(request, "orders/artisan_orders.html", {
+        "items": page.object_list,
+        "page": page,
+        "status": status,
+        "status_choices": OrderItem._meta.get_field("status").choices,
+    })
+
+
+def _status_request(request):
+    """(item ids, status) from a JSON body or the bulk form."""
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+            return [int(pk) for pk in data.get("item_ids", [])], str(data.get("status", ""))
+        except (ValueError, TypeError, AttributeError):
+            return None, None
+    try:
+        return [int(pk) for pk in request.POST.getlist("item_ids")], request.POST.get("status", "")
+    except ValueError:
+        return None, None
+
+
+@artisan_required
+@require_http_methods(["POST"])
+def update_item_status_view(request):
+    """
+    Move many of the artisan's order items to one status in one transaction
+    (see orders.transitions). Answers JSON requests with JSON; the form on
+    the orders-received page is redirected back with a message.
+    """
+    wants_json = request.content_type == "application/json"
+    item_ids, status = _status_request(request)
+
+    def fail(error, failures=(), code=400):
+        if wants_json:
+            return JsonResponse({"error": error, "failures": list(failures)}, status=code)
+        messages.error(request, error)
+        return redirect("artisan_orders")
+
+    if not item_ids or status not in ITEM_TRANSITIONS:
+        return fail("Choose at least one item and a valid status.")
+    if len(item_ids) > settings.ORDER_STATUS_BULK_MAX:
+        return fail(f"At most {settings.ORDER_STATUS_BULK_MAX} items can be updated at once.")
+
+    items = OrderItem.objects.filter(artisan=request.user, pk__in=item_ids)
+    try:
+        moved = transition_items(items, status, actor=request.user)
+    except InvalidTransition as e:
+        failures = [{"item_id": pk, "status": current, "requested": target} for pk, current, target in e.failures]
+        return fail(f"{len(failures)} item(s) cannot be marked {status}; nothing was changed.", failures, 409)
+
+    if wants_json:
+        orders = dict(
+            Order.objects.filter(items__pk__in=item_ids, items__artisan=request.user)
+            .values_list("order_id", "order_status").distinct()
+        )
+        return JsonResponse({"updated": moved, "orders": orders})
+    messages.success(request, f"{moved} item(s) marked {status}.")
+    return redirect("artisan_orders")
+
+
+@artisan_required
+@require_http_methods(["GET"])
+def export_artisan_orders_view(request):
+    """
+    Download the artisan's order items as CSV or JSON Lines, streamed in
+    constant memory, optionally filtered by order date range and item status.
+    """
+    fmt = request.GET.get("format", "csv")
+    if fmt not in FORMATS:
+        fmt = "csv"
+    status = request.GET.get("status", "")
+    try:
+        chunks = export_orders(
+            "items",
+            fmt,
+            artisan=request.user,
+            since=parse_date(request.GET.get("since"), "since"),
+            until=parse_date(request.GET.get("until"), "until"),
+            statuses=[status] if status in ITEM_TRANSITIONS else None,
+        )
+    except ValidationError as e:
+        messages.error(request, e.messages[0])
+        return redirect("artisan_orders")
+
+    content_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="orders.{fmt}"'
+    return response
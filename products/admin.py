@@ -17,7 +17,7 @@ class ProductAdmin(admin.ModelAdmin):
     list_display = ('name', 'get_owner', 'artisan', 'team', 'category', 'price', 'quantity_in_stock', 'status', 'is_eco_friendly', 'rating', 'created_at')
     list_filter = ('status', 'is_eco_friendly', 'created_at', 'category', 'team')
     search_fields = ('name', 'artisan__user__email', 'team__name', 'description')
-    readonly_fields = ('rating', 'review_count', 'sold_count', 'created_at', 'updated_at')
+    readonly_fields = ('rating', 'rating_total', 'review_count', 'sold_count', 'created_at', 'updated_at')
     
     fieldsets = (
         ('Ownership', {
@@ -36,7 +36,7 @@ class ProductAdmin(admin.ModelAdmin):
             'fields': ('status',)
         }),
         ('Stats', {
-            'fields': ('rating', 'review_count', 'sold_count'),
+            'fields': ('rating', 'rating_total', 'review_count', 'sold_count'),
             'classes': ('collapse',)
         }),
         ('Timestamps', {
@@ -0,0 +1,305 @@
+"""
+Bulk product import and export (CSV or JSON Lines)
+
+Imports stream the file row by row and work in chunks of `batch_size`
+rows: each chunk is validated, price-normalized in one pass
+(products.pricing.normalize_prices) and written with one `bulk_create`
+and one `bulk_update`. A row that fails validation is reported with its
+line number and skipped; the rest of the file is still imported. An `id`
+may appear only once per file: later rows with the same id are reported
+and skipped, so the result never depends on chunk boundaries.
+
+Rows with an `id` update that product (it must belong to the importing
+artisan or their team); rows without one create a product. `image` must
+name a file already uploaded under products/ (rows without one get
+PRODUCT_IMPORT_DEFAULT_IMAGE). Exports write the same columns, so an
+export can be edited and imported back.
+"""
+
+import csv
+import io
+import json
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation, ValidationError
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Category, Product
+from .pricing import normalize_prices
+
+
+FORMATS = ('csv', 'jsonl')
+
+# Columns read on import and written on export, in order
+COLUMNS = (
+    'id', 'name', 'description', 'category', 'price', 'original_price', 'discount_percent',
+    'cost_price', 'quantity_in_stock', 'status', 'is_eco_friendly', 'material', 'dimensions',
+    'weight', 'sustainability_notes', 'image',
+)
+REQUIRED_COLUMNS = ('name', 'description', 'price')
+
+# Model fields set from the file (id and category are resolved separately)
+VALUE_FIELDS = (
+    'name', 'description', 'price', 'original_price', 'discount_percent', 'cost_price',
+    'quantity_in_stock', 'status', 'is_eco_friendly', 'material', 'dimensions', 'weight',
+    'sustainability_notes', 'image',
+)
+# Fields written for updated products (pricing may touch selling_price)
+UPDATE_FIELDS = VALUE_FIELDS + ('category', 'selling_price', 'updated_at')
+
+TRUE_VALUES = ('1', 'true', 'yes', 'y', 'on')
+FALSE_VALUES = ('0', 'false', 'no', 'n', 'off')
+
+
+class ImportReport:
+    """Outcome of an import: counts plus per-row errors as (line, [messages])."""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.errors = []
+
+    @property
+    def rows(self):
+        return self.created + self.updated + len(self.errors)
+
+    def __str__(self):
+        return f'{self.created} created, {self.updated} updated, {len(self.errors)} row(s) with errors'
+
+
+def detect_format(filename, default='csv'):
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def iter_rows(stream, fmt):
+    """
+    Yield (line number, row dict) from a text stream.
+
+    Malformed JSON lines are yielded as (line, None) so they are reported
+    as row errors rather than stopping the import.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or ())]
+        if missing:
+            raise ValidationError(f'Missing required column(s): {", ".join(missing)}')
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else None
+    else:
+        raise ValidationError(f'Unsupported format "{fmt}" (expected one of: {", ".join(FORMATS)})')
+
+
+def _blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _boolean(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValidationError(f'"{value}" is not a yes/no value.')
+
+
+class RowValidator:
+    """Turns raw rows into model field values, collecting readable errors."""
+
+    def __init__(self):
+        self.fields = {name: Product._meta.get_field(name) for name in VALUE_FIELDS}
+        self.categories = {}
+        for category in Category.objects.all():
+            self.categories[str(category.id)] = category
+            self.categories[category.name.strip().lower()] = category
+        self.default_image = getattr(settings, 'PRODUCT_IMPORT_DEFAULT_IMAGE', 'products/placeholder.jpg')
+        self.images = {}  # image name -> whether the file exists
+
+    def clean_image(self, raw):
+        """
+        An image name for a file already uploaded to products/ (a bare file
+        name means products/<name>); anything else raises ValidationError.
+        """
+        name = str(raw).strip().replace('\\', '/')
+        if '/' not in name:
+            name = f'products/{name}'
+        if name not in self.images:
+            try:
+                self.images[name] = name.startswith('products/') and default_storage.exists(name)
+            except SuspiciousFileOperation:
+                self.images[name] = False
+        if not self.images[name]:
+            raise ValidationError(f'"{raw}" is not an uploaded product image (expected products/<file name>).')
+        return name
+
+    def clean(self, row):
+        """Return (product id or None, {field: value}) or raise ValidationError."""
+        errors = []
+        values = {}
+        for name, field in self.fields.items():
+            raw = row.get(name)
+            if _blank(raw):
+                if name in REQUIRED_COLUMNS:
+                    errors.append(f'{name}: This field is required.')
+                elif name == 'image':
+                    values[name] = self.default_image
+                elif field.has_default():
+                    values[name] = field.get_default()
+                else:
+                    values[name] = None
+                continue
+            try:
+                if name == 'is_eco_friendly':
+                    values[name] = _boolean(raw)
+                elif name == 'image':
+                    values[name] = self.clean_image(raw)
+                else:
+                    values[name] = field.clean(str(raw).strip() if isinstance(raw, str) else raw, None)
+            except ValidationError as exc:
+                errors.extend(f'{name}: {message}' for message in exc.messages)
+
+        category = row.get('category')
+        if _blank(category):
+            values['category'] = None
+        else:
+            values['category'] = self.categories.get(str(category).strip().lower())
+            if values['category'] is None:
+                errors.append(f'category: Unknown category "{category}".')
+
+        product_id = row.get('id')
+        if _blank(product_id):
+            product_id = None
+        else:
+            try:
+                product_id = int(product_id)
+            except (TypeError, ValueError):
+                errors.append(f'id: "{product_id}" is not a product id.')
+
+        if errors:
+            raise ValidationError(errors)
+        return product_id, values
+
+
+def owned_products(artisan):
+    """Products an artisan may import over or export: their own and their team's."""
+    owned = Q(artisan=artisan)
+    if artisan.team_id:
+        owned |= Q(team_id=artisan.team_id)
+    return Product.objects.filter(owned)
+
+
+def _write_chunk(chunk, artisan, report, batch_size, dry_run):
+    """Create/update one chunk of validated rows: [(line, product id, values)]."""
+    ids = {product_id for _, product_id, _ in chunk if product_id is not None}
+    existing = owned_products(artisan).in_bulk(ids) if ids else {}
+
+    to_create, to_update = [], []
+    now = timezone.now()
+    for line, product_id, values in chunk:
+        if product_id is None:
+            to_create.append(Product(artisan=artisan, team_id=artisan.team_id, **values))
+            continue
+        product = existing.get(product_id)
+        if product is None:
+            report.errors.append((line, [f'id: No product {product_id} in your catalog.']))
+            continue
+        for name, value in values.items():
+            setattr(product, name, value)
+        # The file is the source of truth: re-derive selling price from its columns
+        product.selling_price = None
+        product.updated_at = now
+        to_update.append(product)
+
+    normalize_prices(to_create)
+    normalize_prices(to_update)
+    if not dry_run:
+        with transaction.atomic():
+            Product.objects.bulk_create(to_create, batch_size=batch_size)
+            Product.objects.bulk_update(to_update, UPDATE_FIELDS, batch_size=batch_size)
+    report.created += len(to_create)
+    report.updated += len(to_update)
+
+
+def import_products(stream, artisan, fmt='csv', batch_size=500, dry_run=False):
+    """
+    Import products for `artisan` from a text stream. Returns an ImportReport.
+
+    With `dry_run` every row is validated but nothing is written.
+    """
+    report = ImportReport()
+    validator = RowValidator()
+    seen = {}  # product id -> first line it appeared on
+    chunk = []
+    for line, row in iter_rows(stream, fmt):
+        if row is None:
+            report.errors.append((line, ['Not a JSON object.']))
+            continue
+        try:
+            product_id, values = validator.clean(row)
+        except ValidationError as exc:
+            report.errors.append((line, exc.messages))
+            continue
+        if product_id is not None:
+            first = seen.setdefault(product_id, line)
+            if first != line:
+                report.errors.append((line, [f'id: Product {product_id} already appears on line {first}.']))
+                continue
+        chunk.append((line, product_id, values))
+        if len(chunk) >= batch_size:
+            _write_chunk(chunk, artisan, report, batch_size, dry_run)
+            chunk = []
+    if chunk:
+        _write_chunk(chunk, artisan, report, batch_size, dry_run)
+    report.errors.sort()
+    return report
+
+
+def _export_value(product, column):
+    if column == 'category':
+        return product.category.name if product.category else ''
+    if column == 'image':
+        return product.image.name if product.image else ''
+    value = getattr(product, column)
+    return '' if value is None else value
+
+
+def iter_export(queryset, fmt='csv', chunk_size=2000):
+    """
+    Yield the export file as text chunks (header first for CSV), reading
+    the queryset with a server-side iterator so memory stays flat.
+    """
+    if fmt not in FORMATS:
+        raise ValidationError(f'Unsupported format "{fmt}" (expected one of: {", ".join(FORMATS)})')
+    products = queryset.select_related('category').order_by('id').iterator(chunk_size=chunk_size)
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(COLUMNS)
+        for product in products:
+            writer.writerow([_export_value(product, column) for column in COLUMNS])
+            if buffer.tell() > 64 * 1024:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+    else:
+        for product in products:
+            yield json.dumps({column: _export_value(product, column) for column in COLUMNS}, default=str) + '\n'
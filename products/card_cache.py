@@ -0,0 +1,93 @@
+"""
+Rendered product card cache
+
+Listing pages render the same product cards over and over (INR conversion,
+truncated description, star loop). Each card's HTML is cached under the
+product id together with the `updated_at` it was rendered from, so an entry
+is only served while the product row is unchanged. Saving or deleting a
+product or one of its reviews drops the entry (see products.signals).
+
+Cards are fetched with one `get_many` and stored with one `set_many` per
+page. Hit/miss totals are kept in the cache too, so they are shared by all
+processes using the same cache backend.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+
+CARD_TEMPLATE = 'products/_product_card.html'
+CARD_CACHE_PREFIX = 'product_card'
+STATS_KEYS = {
+    'hits': f'{CARD_CACHE_PREFIX}:stats:hits',
+    'misses': f'{CARD_CACHE_PREFIX}:stats:misses',
+}
+
+
+def card_key(product_id):
+    return f'{CARD_CACHE_PREFIX}:{product_id}'
+
+
+def _stamp(product):
+    return product.updated_at.isoformat() if product.updated_at else ''
+
+
+def _count(name, amount):
+    if not amount:
+        return
+    key = STATS_KEYS[name]
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        # First hit/miss since the cache was cleared
+        if not cache.add(key, amount, None):
+            cache.incr(key, amount)
+
+
+def render_product_cards(products):
+    """
+    Return rendered card HTML for each product, in order, and the number
+    of cache hits and misses for this call.
+    """
+    products = list(products)
+    cached = cache.get_many([card_key(product.pk) for product in products])
+    cards, fresh = [], {}
+    hits = 0
+    for product in products:
+        entry = cached.get(card_key(product.pk))
+        if entry and entry[0] == _stamp(product):
+            html = entry[1]
+            hits += 1
+        else:
+            html = render_to_string(CARD_TEMPLATE, {'product': product})
+            fresh[card_key(product.pk)] = (_stamp(product), html)
+        cards.append(mark_safe(html))
+
+    if fresh:
+        cache.set_many(fresh, getattr(settings, 'PRODUCT_CARD_CACHE_SECONDS', 3600))
+    _count('hits', hits)
+    _count('misses', len(fresh))
+    return cards, hits, len(fresh)
+
+
+def invalidate_product_card(product_id):
+    cache.delete(card_key(product_id))
+
+
+def card_cache_stats():
+    """Cumulative hit/miss counts and hit ratio since the cache was cleared."""
+    values = cache.get_many(list(STATS_KEYS.values()))
+    hits = values.get(STATS_KEYS['hits'], 0)
+    misses = values.get(STATS_KEYS['misses'], 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+    }
+
+
+def reset_card_cache_stats():
+    cache.delete_many(list(STATS_KEYS.values()))
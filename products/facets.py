@@ -0,0 +1,170 @@
+"""
+Catalog filters and facet counts
+
+Shared by the product catalog and the marketplace so both storefronts parse
+filters the same way and get facet counts (how many products each filter
+option would yield) without one COUNT query per option.
+
+Facet counts are computed in a single grouped query and cached per
+normalized filter signature, so the catalog and the marketplace share them.
+"""
+
+import hashlib
+import json
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .search import search_products
+
+
+# Price bands shown as facets, in INR (upper bound exclusive, None = open)
+PRICE_BANDS_INR = (
+    (500, 1000),
+    (1000, 2000),
+    (2000, 3500),
+    (3500, None),
+)
+
+FACET_CACHE_PREFIX = 'catalog:facets'
+
+
+def _decimal(value):
+    try:
+        number = Decimal(str(value).strip())
+    except (InvalidOperation, ValueError):
+        return None
+    return number if number.is_finite() and number >= 0 else None
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_catalog_filters(params):
+    """
+    Normalize catalog filter parameters from a QueryDict.
+
+    Invalid values are dropped rather than raising, so a malformed link
+    shows the unfiltered catalog instead of an error page.
+    """
+    band = _int(params.get('price_band'))
+    return {
+        'search': (params.get('search') or '').strip(),
+        'category': _int(params.get('category')),
+        'min_price': _decimal(params['min_price']) if params.get('min_price') else None,
+        'max_price': _decimal(params['max_price']) if params.get('max_price') else None,
+        'price_band': band if band is not None and 0 <= band < len(PRICE_BANDS_INR) else None,
+        'eco': bool(params.get('eco')),
+        'in_stock': bool(params.get('in_stock')),
+    }
+
+
+def price_band_bounds():
+    """USD (storage currency) bounds for each band in PRICE_BANDS_INR."""
+    rate = Decimal(getattr(settings, 'USD_TO_INR_RATE', 83))
+    to_usd = lambda inr: (Decimal(inr) / rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    return [(to_usd(low), to_usd(high) if high is not None else None) for low, high in PRICE_BANDS_INR]
+
+
+def _price_band_q(index, bounds=None):
+    low, high = (bounds or price_band_bounds())[index]
+    condition = Q(price__gte=low)
+    if high is not None:
+        condition &= Q(price__lt=high)
+    return condition
+
+
+def apply_catalog_filters(queryset, filters, bounds=None):
+    """
+    Apply normalized filters (see parse_catalog_filters) to a Product
+    queryset. `bounds` are the price_band_bounds() already computed for
+    this request, if any.
+    """
+    if filters['search']:
+        queryset = search_products(queryset, filters['search'])
+    if filters['category'] is not None:
+        queryset = queryset.filter(category__id=filters['category'])
+    if filters['min_price'] is not None:
+        queryset = queryset.filter(price__gte=filters['min_price'])
+    if filters['max_price'] is not None:
+        queryset = queryset.filter(price__lte=filters['max_price'])
+    if filters['price_band'] is not None:
+        queryset = queryset.filter(_price_band_q(filters['price_band'], bounds))
+    if filters['eco']:
+        queryset = queryset.filter(is_eco_friendly=True)
+    if filters['in_stock']:
+        queryset = queryset.filter(quantity_in_stock__gt=0)
+    return queryset
+
+
+def filter_signature(filters):
+    """Stable cache key fragment for a set of normalized filters."""
+    payload = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _band_label(low, high):
+    if high is None:
+        return f'₹{low:,}+'
+    return f'₹{low:,} – ₹{high:,}'
+
+
+def catalog_facets(queryset, filters, categories, bounds=None):
+    """
+    Facet counts for the products in `queryset` matching `filters`.
+
+    `queryset` is the unfiltered base (e.g. active products). Category
+    counts ignore the selected category so shoppers can see what switching
+    category would yield; every other count reflects all filters. The lot
+    comes from one query grouped by category and is cached per filter
+    signature for CATALOG_FACET_CACHE_SECONDS. Pass the request's
+    price_band_bounds() as `bounds` to avoid working them out again.
+    """
+    key = f'{FACET_CACHE_PREFIX}:{filter_signature(filters)}'
+    counts = cache.get(key)
+    if counts is None:
+        bounds = bounds or price_band_bounds()
+        aggregates = {
+            'total': Count('id'),
+            'eco': Count('id', filter=Q(is_eco_friendly=True)),
+            'in_stock': Count('id', filter=Q(quantity_in_stock__gt=0)),
+        }
+        for index in range(len(bounds)):
+            aggregates[f'band_{index}'] = Count('id', filter=_price_band_q(index, bounds))
+
+        rows = apply_catalog_filters(queryset, dict(filters, category=None), bounds)
+        rows = rows.order_by().values('category_id').annotate(**aggregates)
+
+        selected = filters['category']
+        counts = {'total': 0, 'eco': 0, 'in_stock': 0, 'bands': [0] * len(bounds), 'categories': {}}
+        for row in rows:
+            if row['category_id'] is not None:
+                counts['categories'][row['category_id']] = row['total']
+            if selected is not None and row['category_id'] != selected:
+                continue
+            counts['total'] += row['total']
+            counts['eco'] += row['eco']
+            counts['in_stock'] += row['in_stock']
+            for index in range(len(bounds)):
+                counts['bands'][index] += row[f'band_{index}']
+        cache.set(key, counts, getattr(settings, 'CATALOG_FACET_CACHE_SECONDS', 300))
+
+    return {
+        'total': counts['total'],
+        'eco': counts['eco'],
+        'in_stock': counts['in_stock'],
+        'categories': [
+            {'id': category.id, 'name': category.name, 'count': counts['categories'].get(category.id, 0)}
+            for category in categories
+        ],
+        'price_bands': [
+            {'index': index, 'label': _band_label(low, high), 'count': counts['bands'][index]}
+            for index, (low, high) in enumerate(PRICE_BANDS_INR)
+        ],
+    }
@@ -0,0 +1,91 @@
+"""
+Benchmark bulk product import against saving one product at a time.
+
+Generates a synthetic CSV, then imports it with products.bulk_io (chunked
+validation + bulk_create) and with a per-row `Product.save()` loop, each
+inside a transaction that is rolled back, and reports rows/second and the
+number of SQL statements each approach issued.
+
+Usage:
+    python manage.py benchmark_product_import --rows 10000 --batch-size 500
+"""
+
+import csv
+import io
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.bulk_io import COLUMNS, RowValidator, import_products, iter_rows
+from products.models import Product
+
+
+WORDS = (
+    'handwoven cotton silk khadi indigo terracotta clay vase brass copper bamboo '
+    'jute basket rug shawl stole scarf tote earrings necklace kantha madhubani '
+    'warli candle lamp wooden toy carved marble mirror cushion quilt'
+).split()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark bulk product import against per-row save().'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        data = self._csv(options['rows'], random.Random(options['seed']))
+        self.stdout.write(f"{'approach':<12}  {'rows':>8}  {'seconds':>8}  {'rows/s':>10}  {'queries':>8}")
+        for label, run in (('bulk', self._bulk), ('per-row', self._per_row)):
+            with transaction.atomic():
+                artisan = self._artisan()
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    rows = run(data, artisan, options['batch_size'])
+                    elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f'{label:<12}  {rows:>8}  {elapsed:>8.2f}  {rows / elapsed:>10.0f}  {len(queries):>8}'
+                )
+                transaction.set_rollback(True)
+
+    def _bulk(self, data, artisan, batch_size):
+        report = import_products(io.StringIO(data), artisan, batch_size=batch_size)
+        return report.created
+
+    def _per_row(self, data, artisan, batch_size):
+        validator = RowValidator()
+        rows = 0
+        for _, row in iter_rows(io.StringIO(data), 'csv'):
+            _, values = validator.clean(row)
+            Product(artisan=artisan, **values).save()
+            rows += 1
+        return rows
+
+    def _artisan(self):
+        user = User.objects.create_user(username='bench_import', password=None, role='artisan')
+        return ArtisanProfile.objects.create(
+            user=user, craft_type='other', description='benchmark', workshop_location='bench'
+        )
+
+    def _csv(self, rows, rng):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=COLUMNS)
+        writer.writeheader()
+        for _ in range(rows):
+            writer.writerow({
+                'name': ' '.join(rng.choices(WORDS, k=3)).title(),
+                'description': ' '.join(rng.choices(WORDS, k=30)),
+                'price': f'{rng.randint(700, 6000) / 100:.2f}',
+                'discount_percent': rng.choice(('', '0', '10', '25')),
+                'quantity_in_stock': rng.randint(0, 50),
+                'is_eco_friendly': rng.choice(('yes', 'no')),
+                'material': rng.choice(WORDS),
+            })
+        return buffer.getvalue()
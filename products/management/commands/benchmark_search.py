@@ -0,0 +1,115 @@
+"""
+Benchmark catalog search latency.
+
+Seeds synthetic products inside a transaction that is rolled back at the
+end, then times full-text search against the legacy icontains scan at each
+catalog size. Run once on SQLite and once with DATABASE_URL pointing at
+Postgres to compare the two index backends.
+
+Usage:
+    python manage.py benchmark_search --sizes 10000 100000 1000000
+"""
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.models import Product
+from products.search import search_backend, search_products
+
+
+WORDS = (
+    'handwoven cotton silk khadi block printed indigo terracotta clay pot vase '
+    'brass copper bell metal dokra bamboo cane jute basket mat rug shawl stole '
+    'saree scarf tote bag earrings necklace bangle beaded embroidered kantha '
+    'madhubani warli kalamkari pattachitra candle soy beeswax lamp diya wooden '
+    'toy carved sandalwood marble inlay mirror cushion cover quilt organic dyed'
+).split()
+
+# Zipf-distributed vocabulary: a few craft words are common, most are rare
+VOCABULARY_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = 'Benchmark full-text product search against icontains at several catalog sizes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10000, 100000, 1000000])
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per query')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        vocabulary = WORDS + [
+            ''.join(rng.choices('aeiouklmnprstvy', k=7)) for _ in range(VOCABULARY_SIZE)
+        ]
+        weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+        # Common, mid-frequency, rare, prefix, multi-term and no-match queries
+        queries = [
+            vocabulary[0], vocabulary[40], vocabulary[400], vocabulary[4000],
+            vocabulary[60][:4], f'{vocabulary[3]} {vocabulary[90]}', 'zzqxj',
+        ]
+        backend = search_backend() or 'icontains fallback'
+        self.stdout.write(f'Search backend: {backend}')
+        self.stdout.write(
+            f"{'products':>10}  {'query':<16}  {'matches':>8}  {'fts ms':>8}  {'icontains ms':>12}"
+        )
+
+        for size in sorted(options['sizes']):
+            with transaction.atomic():
+                self._seed(size, rng, options['batch_size'], vocabulary, weights)
+                totals = {'fts': [], 'icontains': []}
+                for query in queries:
+                    medians = {}
+                    for engine, run in (('fts', self._fts), ('icontains', self._icontains)):
+                        timings = []
+                        for _ in range(options['repeat']):
+                            start = time.perf_counter()
+                            run(query)
+                            timings.append((time.perf_counter() - start) * 1000)
+                        medians[engine] = statistics.median(timings)
+                        totals[engine].extend(timings)
+                    matches = search_products(Product.objects.all(), query).count()
+                    self.stdout.write(
+                        f"{size:>10}  {query:<16}  {matches:>8}  {medians['fts']:>8.2f}  {medians['icontains']:>12.2f}"
+                    )
+                self.stdout.write(
+                    f"{size:>10}  {'(median)':<16}  {'':>8}  {statistics.median(totals['fts']):>8.2f}  "
+                    f"{statistics.median(totals['icontains']):>12.2f}"
+                )
+                transaction.set_rollback(True)
+
+    def _fts(self, query):
+        queryset = search_products(Product.objects.filter(status='active'), query)
+        return list(queryset.order_by('-search_rank', '-id').values_list('id', flat=True)[:24])
+
+    def _icontains(self, query):
+        queryset = Product.objects.filter(status='active').filter(
+            Q(name__icontains=query) | Q(description__icontains=query)
+        )
+        return list(queryset.order_by('-created_at').values_list('id', flat=True)[:24])
+
+    def _seed(self, size, rng, batch_size, vocabulary, weights):
+        user = User.objects.create_user(username=f'bench_search_{size}', password=None, role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='other', description='benchmark', workshop_location='bench'
+        )
+        for start in range(0, size, batch_size):
+            Product.objects.bulk_create([
+                Product(
+                    artisan=artisan,
+                    name=' '.join(rng.choices(vocabulary, weights, k=3)).title(),
+                    description=' '.join(rng.choices(vocabulary, weights, k=40)),
+                    price=rng.randint(700, 6000) / 100,
+                    quantity_in_stock=rng.randint(0, 50),
+                    image='products/placeholder.jpg',
+                )
+                for _ in range(min(batch_size, size - start))
+            ])
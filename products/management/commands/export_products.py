@@ -0,0 +1,41 @@
+"""
+Export products as CSV or JSON Lines (the same columns import_products reads).
+
+Usage:
+    python manage.py export_products --artisan priya --output catalog.csv
+    python manage.py export_products --format jsonl > catalog.jsonl
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from products.bulk_io import FORMATS, detect_format, iter_export, owned_products
+from products.management.commands.import_products import get_artisan
+from products.models import Product
+
+
+class Command(BaseCommand):
+    help = 'Stream products to a CSV / JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--artisan', help="Only this artisan's (and their team's) products.")
+        parser.add_argument('--format', choices=FORMATS, help='Output format (default: from --output, else csv).')
+        parser.add_argument('--output', help='File to write (default: stdout).')
+
+    def handle(self, *args, **options):
+        if options['artisan']:
+            products = owned_products(get_artisan(options['artisan']))
+        else:
+            products = Product.objects.all()
+        fmt = options['format'] or detect_format(options['output'])
+
+        if not options['output']:
+            for chunk in iter_export(products, fmt):
+                self.stdout.write(chunk, ending='')
+            return
+        try:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as handle:
+                for chunk in iter_export(products, fmt):
+                    handle.write(chunk)
+        except OSError as exc:
+            raise CommandError(f'Cannot write {options["output"]}: {exc}')
+        self.stdout.write(self.style.SUCCESS(f'Exported products to {options["output"]}.'))
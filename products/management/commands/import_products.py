@@ -0,0 +1,57 @@
+"""
+Import products for an artisan from a CSV or JSON Lines file.
+
+Rows with an `id` update that product; rows without one create a new
+product. Invalid rows are reported and skipped.
+
+Usage:
+    python manage.py import_products catalog.csv --artisan priya [--dry-run]
+    python manage.py import_products catalog.jsonl --artisan 12 --batch-size 1000
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from artisans.models import ArtisanProfile
+from products.bulk_io import FORMATS, detect_format, import_products
+
+
+def get_artisan(value):
+    """Look an artisan up by profile id or by username."""
+    lookup = {'pk': int(value)} if str(value).isdigit() else {'user__username': value}
+    try:
+        return ArtisanProfile.objects.get(**lookup)
+    except ArtisanProfile.DoesNotExist:
+        raise CommandError(f'No artisan "{value}".')
+
+
+class Command(BaseCommand):
+    help = 'Bulk-create or update products from a CSV / JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='Path to the CSV or JSONL file.')
+        parser.add_argument('--artisan', required=True, help='Artisan profile id or username.')
+        parser.add_argument('--format', choices=FORMATS, help='File format (default: from the extension).')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Rows validated and written per chunk (default 500).')
+        parser.add_argument('--dry-run', action='store_true', help='Validate only; write nothing.')
+
+    def handle(self, *args, **options):
+        artisan = get_artisan(options['artisan'])
+        fmt = options['format'] or detect_format(options['file'])
+        try:
+            with open(options['file'], encoding='utf-8-sig', newline='') as handle:
+                report = import_products(
+                    handle, artisan, fmt=fmt,
+                    batch_size=options['batch_size'], dry_run=options['dry_run'],
+                )
+        except OSError as exc:
+            raise CommandError(f'Cannot read {options["file"]}: {exc}')
+        except ValidationError as exc:
+            raise CommandError('; '.join(exc.messages))
+
+        for line, problems in report.errors:
+            self.stderr.write(f'line {line}: {"; ".join(problems)}')
+        prefix = 'Dry run' if options['dry_run'] else 'Imported'
+        style = self.style.WARNING if report.errors else self.style.SUCCESS
+        self.stdout.write(style(f'{prefix}: {report}.'))
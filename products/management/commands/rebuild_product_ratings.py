@@ -0,0 +1,31 @@
+"""
+Recompute Product.rating, rating_total and review_count from the reviews table.
+
+Review writes keep these fields current incrementally; run this after bulk
+imports, raw SQL changes or anything else that bypasses model signals.
+
+Usage:
+    python manage.py rebuild_product_ratings [--product ID ...] [--batch-size 1000]
+"""
+
+from django.core.management.base import BaseCommand
+
+from products.models import Product
+from products.ratings import rebuild_product_ratings
+
+
+class Command(BaseCommand):
+    help = 'Rebuild denormalized product rating aggregates from reviews.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--product', type=int, nargs='+', dest='products',
+                            help='Only rebuild these product ids.')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Products updated per statement (default 1000).')
+
+    def handle(self, *args, **options):
+        products = Product.objects.all()
+        if options['products']:
+            products = products.filter(pk__in=options['products'])
+        updated = rebuild_product_ratings(products, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt ratings for {updated} product(s).'))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:41
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_ratings(apps, schema_editor):
+    """Seed rating_total/review_count/rating from existing reviews."""
+    Product = apps.get_model('products', 'Product')
+    Review = apps.get_model('products', 'Review')
+    totals = Review.objects.values('product_id').annotate(total=Sum('rating'), count=Count('id'))
+    for row in totals:
+        average = (Decimal(row['total']) / row['count']).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        Product.objects.filter(pk=row['product_id']).update(
+            rating_total=row['total'], review_count=row['count'], rating=average
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='rating_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_ratings, migrations.RunPython.noop),
+    ]
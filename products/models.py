@@ -2,6 +2,8 @@ from django.db import models
 from accounts.models import User
 from artisans.models import ArtisanProfile
 from django.core.validators import MinValueValidator
+from .pricing import normalize_product_prices
+from .search import FTS_TABLE, FTSDocumentField
 
 class Category(models.Model):
     """
@@ -31,6 +33,15 @@ class Product(models.Model):
         ('discontinued', 'Discontinued'),
     )
     
+    # Supported listing sorts: (key, label, ordering); see core.sorting
+    SORT_CHOICES = (
+        ('newest', 'Newest', ('-created_at', '-id')),
+        ('price_asc', 'Price: Low to High', ('price', 'id')),
+        ('price_desc', 'Price: High to Low', ('-price', '-id')),
+        ('rating', 'Highest Rated', ('-rating', '-id')),
+        ('best_selling', 'Best Selling', ('-sold_count', '-id')),
+    )
+    
     artisan = models.ForeignKey(ArtisanProfile, on_delete=models.CASCADE, related_name='products')
     team = models.ForeignKey('artisans.ArtisanTeam', on_delete=models.SET_NULL, null=True, blank=True, related_name='products')
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True)
@@ -59,8 +70,9 @@ class Product(models.Model):
     material = models.CharField(max_length=100, blank=True, null=True)
     weight = models.CharField(max_length=50, blank=True, null=True)  # e.g., "500g"
     
-    # Metrics
+    # Metrics (rating/review_count are maintained from Review writes, see products.ratings)
     rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.0)
+    rating_total = models.PositiveIntegerField(default=0)  # Sum of review ratings
     review_count = models.IntegerField(default=0)
     sold_count = models.IntegerField(default=0)
     
@@ -82,6 +94,12 @@ class Product(models.Model):
             models.Index(fields=['team', 'status']),
             models.Index(fields=['category']),
             models.Index(fields=['-created_at']),
+            # Composite indexes backing SORT_CHOICES on the active catalog
+            models.Index(fields=['status', 'created_at', 'id'], name='products_status_created_idx'),
+            models.Index(fields=['status', 'price', 'id'], name='products_status_price_idx'),
+            models.Index(fields=['status', 'rating', 'id'], name='products_status_rating_idx'),
+            models.Index(fields=['status', 'sold_count', 'id'], name='products_status_sold_idx'),
+            models.Index(fields=['artisan', 'status', 'created_at'], name='products_artisan_created_idx'),
         ]
     
     def __str__(self):
@@ -90,88 +108,8 @@ class Product(models.Model):
         return f"{self.name} by {self.artisan.user.get_full_name()}"
 
     def save(self, *args, **kwargs):
-        """Maintain INR range and compute selling price from original price + discount.
-
-        Behavior:
-        - Clamp original_price (in USD storage) to the INR range defined in settings.
-        - If discount_percent is set, compute selling_price = original_price * (1 - discount/100).
-        - Ensure original_price > selling_price; if equality occurs, ensure selling_price is slightly lower.
-        - Keep the legacy `price` field in sync with selling_price for backward compatibility.
-        """
-        from decimal import Decimal, ROUND_HALF_UP
-        from django.conf import settings
-
-        try:
-            rate = Decimal(getattr(settings, 'USD_TO_INR_RATE', 83))
-            min_inr = Decimal(getattr(settings, 'MIN_PRICE_INR', 500))
-            max_inr = Decimal(getattr(settings, 'MAX_PRICE_INR', 5000))
-
-            # Compute USD bounds
-            min_usd = (min_inr / rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-            max_usd = (max_inr / rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-            # If original_price provided, clamp it into USD bounds
-            if self.original_price is not None:
-                op = Decimal(self.original_price)
-                if op < min_usd:
-                    op = min_usd
-                elif op > max_usd:
-                    op = max_usd
-                self.original_price = op.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-            else:
-                # If original_price absent but legacy price exists, use that as original
-                if self.price is not None:
-                    self.original_price = Decimal(self.price)
-
-            # Normalize discount percent
-            if self.discount_percent is not None:
-                dp = Decimal(self.discount_percent)
-                if dp < Decimal('0'):
-                    dp = Decimal('0')
-                if dp > Decimal('100'):
-                    dp = Decimal('100')
-                self.discount_percent = dp.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-            # Compute selling_price
-            if self.original_price is not None and self.discount_percent is not None:
-                op = Decimal(self.original_price)
-                dp = Decimal(self.discount_percent)
-                sp = (op * (Decimal('100') - dp) / Decimal('100')).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-                # Ensure selling < original
-                if sp >= op:
-                    sp = (op - Decimal('0.01')).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-                self.selling_price = sp
-            else:
-                # Fallback: if selling_price absent, try to set from legacy price
-                if self.selling_price is None and self.price is not None:
-                    self.selling_price = Decimal(self.price)
-
-            # Ensure selling_price in USD clamped into bounds as well
-            if self.selling_price is not None:
-                spv = Decimal(self.selling_price)
-                if spv < min_usd:
-                    spv = min_usd
-                elif spv > max_usd:
-                    spv = max_usd
-                self.selling_price = spv.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-            # Keep legacy `price` field in sync
-            if self.selling_price is not None:
-                self.price = self.selling_price
-
-            # Ensure cost_price not greater than original if cost_price is provided
-            if self.cost_price:
-                cp = Decimal(self.cost_price)
-                if self.original_price is not None and cp > Decimal(self.original_price):
-                    self.cost_price = Decimal(self.original_price)
-                # clamp cost_price into bounds
-                if cp < min_usd:
-                    self.cost_price = min_usd
-                elif cp > max_usd:
-                    self.cost_price = max_usd
-        except Exception:
-            pass
-
+        """Normalize prices into the INR range before saving (see products.pricing)."""
+        normalize_product_prices(self)
         super().save(*args, **kwargs)
     
     def in_stock(self):
@@ -210,6 +148,26 @@ class Review(models.Model):
         verbose_name_plural = 'Reviews'
         unique_together = ['product', 'customer']  # One review per customer per product
         ordering = ['-created_at']
+        indexes = [
+            # Backs the keyset-paginated review list on the product page
+            models.Index(fields=['product', '-created_at', '-id'], name='products_review_recent_idx'),
+        ]
     
     def __str__(self):
         return f"Review for {self.product.name} by {self.customer.get_full_name()}"
+
+
+class ProductSearchEntry(models.Model):
+    """
+    Row of the SQLite FTS5 search index (see products.search).
+    The table is maintained by database triggers, never through the ORM.
+    """
+    product = models.OneToOneField(
+        Product, on_delete=models.DO_NOTHING, primary_key=True,
+        db_column='rowid', related_name='search_entry'
+    )
+    document = FTSDocumentField(db_column=FTS_TABLE)
+    
+    class Meta:
+        managed = False
+        db_table = FTS_TABLE
@@ -0,0 +1,133 @@
+"""
+Product price normalization
+
+Prices are stored in USD but bounded by an INR range from settings
+(MIN_PRICE_INR..MAX_PRICE_INR at USD_TO_INR_RATE). The USD bounds are
+computed once and reused until one of those settings changes, and
+`normalize_prices()` applies the rules to a whole batch in one pass so bulk
+imports can normalize before `bulk_create`/`bulk_update` without calling
+`save()` per row.
+
+The rules (unchanged from the original Product.save):
+- original_price is clamped into the bounds (or taken from the legacy
+  `price` when missing);
+- discount_percent is clamped to 0..100;
+- selling_price = original_price * (1 - discount/100), kept strictly below
+  original_price, then clamped into the bounds;
+- `price` mirrors selling_price for backward compatibility;
+- cost_price is capped at original_price and clamped into the bounds.
+"""
+
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+PRICE_SETTINGS = ('USD_TO_INR_RATE', 'MIN_PRICE_INR', 'MAX_PRICE_INR')
+
+CENT = Decimal('0.01')
+ZERO = Decimal('0')
+HUNDRED = Decimal('100')
+
+PriceBounds = namedtuple('PriceBounds', 'min_usd max_usd')
+
+_bounds = None
+
+
+def price_bounds():
+    """USD bounds for product prices, computed once per settings load."""
+    global _bounds
+    if _bounds is None:
+        rate = Decimal(getattr(settings, 'USD_TO_INR_RATE', 83))
+        min_inr = Decimal(getattr(settings, 'MIN_PRICE_INR', 500))
+        max_inr = Decimal(getattr(settings, 'MAX_PRICE_INR', 5000))
+        _bounds = PriceBounds(
+            (min_inr / rate).quantize(CENT, rounding=ROUND_HALF_UP),
+            (max_inr / rate).quantize(CENT, rounding=ROUND_HALF_UP),
+        )
+    return _bounds
+
+
+@receiver(setting_changed)
+def reset_price_bounds(setting, **kwargs):
+    global _bounds
+    if setting in PRICE_SETTINGS:
+        _bounds = None
+
+
+def _clamp(value, bounds):
+    if value < bounds.min_usd:
+        return bounds.min_usd
+    if value > bounds.max_usd:
+        return bounds.max_usd
+    return value
+
+
+def _normalize(product, bounds):
+    if product.original_price is not None:
+        product.original_price = _clamp(Decimal(product.original_price), bounds).quantize(
+            CENT, rounding=ROUND_HALF_UP
+        )
+    elif product.price is not None:
+        # No original price yet: the legacy price is the original
+        product.original_price = Decimal(product.price)
+
+    if product.discount_percent is not None:
+        discount = Decimal(product.discount_percent)
+        if discount < ZERO:
+            discount = ZERO
+        if discount > HUNDRED:
+            discount = HUNDRED
+        product.discount_percent = discount.quantize(CENT, rounding=ROUND_HALF_UP)
+
+    if product.original_price is not None and product.discount_percent is not None:
+        original = Decimal(product.original_price)
+        selling = (original * (HUNDRED - product.discount_percent) / HUNDRED).quantize(
+            CENT, rounding=ROUND_HALF_UP
+        )
+        if selling >= original:
+            selling = (original - CENT).quantize(CENT, rounding=ROUND_HALF_UP)
+        product.selling_price = selling
+    elif product.selling_price is None and product.price is not None:
+        product.selling_price = Decimal(product.price)
+
+    if product.selling_price is not None:
+        product.selling_price = _clamp(Decimal(product.selling_price), bounds).quantize(
+            CENT, rounding=ROUND_HALF_UP
+        )
+        product.price = product.selling_price
+
+    if product.cost_price:
+        cost = Decimal(product.cost_price)
+        if product.original_price is not None and cost > Decimal(product.original_price):
+            product.cost_price = Decimal(product.original_price)
+        # Bounds are checked against the cost as entered
+        if cost < bounds.min_usd:
+            product.cost_price = bounds.min_usd
+        elif cost > bounds.max_usd:
+            product.cost_price = bounds.max_usd
+
+
+def normalize_product_prices(product, bounds=None):
+    """
+    Apply the pricing rules to one product in place.
+
+    Values that cannot be read as decimals are left for field validation
+    to report; the rules applied before the bad value are kept.
+    """
+    try:
+        _normalize(product, bounds or price_bounds())
+    except (InvalidOperation, TypeError, ValueError):
+        pass
+    return product
+
+
+def normalize_prices(products):
+    """Apply the pricing rules to a batch of products in one pass."""
+    bounds = price_bounds()
+    for product in products:
+        normalize_product_prices(product, bounds)
+    return products
@@ -5,6 +5,11 @@ This module handles product creation, editing, and deletion.
 Only authenticated artisans can access these views.
 """
 
+import io
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.views.decorators.http import require_http_methods
 from django.contrib import messages
@@ -15,6 +20,7 @@ from accounts.decorators import artisan_required
 from artisans.models import ArtisanProfile
 from .models import Product, Category
 from .forms import ProductForm
+from .bulk_io import COLUMNS, FORMATS, detect_format, import_products, iter_export, owned_products
 
 
 def user_can_edit_product(user, product):
@@ -194,14 +200,11 @@ def my_products_view(request):
     """
     artisan = get_object_or_404(ArtisanProfile, user=request.user)
     
-    # Get products created by this artisan
-    products = Product.objects.filter(artisan=artisan).order_by('-created_at')
-    
-    # If artisan is part of a team, also get team products
+    # Products created by this artisan, plus their team's products if they are in one
+    owned = Q(artisan=artisan)
     if artisan.team:
-        team_products = Product.objects.filter(team=artisan.team).order_by('-created_at')
-        # Combine queries - union to avoid duplicates
-        products = products.union(team_products).order_by('-created_at')
+        owned |= Q(team=artisan.team)
+    products = Product.objects.filter(owned).select_related('category').order_by('-created_at')
     
     # Filter by status
     status_filter = request.GET.get('status', 'all')
@@ -224,3 +227,64 @@ def my_products_view(request):
     }
     
     return render(request, 'products/my_products.html', context)
+
+
+@login_required
+@artisan_required
+@require_http_methods(["GET", "POST"])
+def import_products_view(request):
+    """
+    Bulk-create or update products from a CSV / JSON Lines upload (Artisan-only).
+    
+    Rows with errors are listed and skipped; valid rows are still imported.
+    """
+    artisan = get_object_or_404(ArtisanProfile, user=request.user)
+    report = None
+    
+    if request.method == 'POST':
+        upload = request.FILES.get('file')
+        if not upload:
+            messages.error(request, 'Please choose a CSV or JSONL file to import.')
+        else:
+            fmt = request.POST.get('format') or detect_format(upload.name)
+            dry_run = bool(request.POST.get('dry_run'))
+            stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+            try:
+                report = import_products(
+                    stream, artisan, fmt=fmt, dry_run=dry_run,
+                    batch_size=settings.PRODUCT_IMPORT_BATCH_SIZE,
+                )
+            except (ValidationError, UnicodeDecodeError) as e:
+                messages.error(request, f'Could not read file: {e}')
+            else:
+                prefix = 'Checked (nothing saved)' if dry_run else 'Imported'
+                level = messages.warning if report.errors else messages.success
+                level(request, f'{prefix}: {report}.')
+    
+    context = {
+        'artisan': artisan,
+        'report': report,
+        'errors': report.errors[:200] if report else [],
+        'columns': COLUMNS,
+        'page_title': 'Import Products',
+    }
+    
+    return render(request, 'products/import_products.html', context)
+
+
+@login_required
+@artisan_required
+@require_http_methods(["GET"])
+def export_products_view(request):
+    """
+    Download the artisan's (and their team's) products as CSV or JSON Lines.
+    """
+    artisan = get_object_or_404(ArtisanProfile, user=request.user)
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in FORMATS:
+        fmt = 'csv'
+    
+    content_type = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+    response = StreamingHttpResponse(iter_export(owned_products(artisan), fmt), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="products.{fmt}"'
+    return response
@@ -0,0 +1,77 @@
+"""
+Denormalized product rating aggregates
+
+Product keeps `rating_total` (sum of review ratings), `review_count` and
+the derived average `rating`, so pages never aggregate reviews per hit.
+Review writes apply a delta with a single UPDATE built from F()
+expressions; the database reads and writes the row in one statement, so
+concurrent reviewers cannot overwrite each other's changes. Every write
+also bumps `updated_at`, which keys the product card cache
+(products.card_cache), so cards show the new rating straight away.
+"""
+
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, F, FloatField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce, Now, NullIf, Round
+
+
+def _average(total, count):
+    """total / count rounded to two places, or 0 when there are no reviews."""
+    # Divide as floating point (integer division on SQLite otherwise), then
+    # round as numeric, which is what Postgres' round(x, places) accepts.
+    average = Cast(
+        Cast(total, FloatField()) / NullIf(count, 0),
+        DecimalField(max_digits=12, decimal_places=4),
+    )
+    return Coalesce(
+        Round(average, 2),
+        Value(Decimal('0.00')),
+        output_field=DecimalField(max_digits=3, decimal_places=2),
+    )
+
+
+def apply_rating_delta(product_id, total_delta, count_delta):
+    """Add `total_delta` to the rating sum and `count_delta` to the review count."""
+    from .models import Product
+
+    if not total_delta and not count_delta:
+        return
+    # Right-hand sides see the row as it was before this UPDATE
+    total = F('rating_total') + total_delta
+    count = F('review_count') + count_delta
+    Product.objects.filter(pk=product_id).update(
+        rating_total=total,
+        review_count=count,
+        rating=_average(total, count),
+        updated_at=Now(),
+    )
+
+
+def rebuild_product_ratings(products=None, batch_size=1000):
+    """
+    Recompute the stored aggregates from the reviews table.
+
+    Runs one UPDATE per `batch_size` products so a rebuild of
+    a large catalog does not hold one long write lock. Returns the number
+    of products updated.
+    """
+    from .models import Product, Review
+
+    if products is None:
+        products = Product.objects.all()
+    reviews = Review.objects.filter(product=OuterRef('pk')).order_by().values('product')
+    total = Coalesce(Subquery(reviews.annotate(total=Sum('rating')).values('total')), 0)
+    count = Coalesce(Subquery(reviews.annotate(count=Count('id')).values('count')), 0)
+
+    ids = list(products.order_by('pk').values_list('pk', flat=True))
+    updated = 0
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        updated += Product.objects.filter(pk__in=batch).update(
+            rating_total=total,
+            review_count=count,
+            rating=_average(total, count),
+            updated_at=Now(),
+        )
+    return updated
@@ -0,0 +1,191 @@
+"""
+Full-text product search
+
+Replaces `icontains` scans over name/description with an inverted index:
+
+- PostgreSQL: a generated `search_vector` tsvector column on
+  `products_product` (name weighted above description) with a GIN index.
+- SQLite: an external-content FTS5 table, `products_product_fts`, kept in
+  sync with `products_product` by triggers.
+
+Both indexes are maintained by the database on every write, so
+`Product.save()`, `bulk_create()` and `bulk_update()` all keep search
+current. Backends without either index fall back to `icontains`.
+
+Matching rows are annotated with `search_rank` (higher is more relevant).
+"""
+
+import re
+
+from django.db import connections, models
+from django.db.models import BooleanField, FloatField, Func, Lookup, Q, Value
+from django.db.models.expressions import RawSQL
+
+
+FTS_TABLE = 'products_product_fts'
+MAX_TERMS = 8
+
+# Weights for (name, description) when ranking with bm25
+_SQLITE_WEIGHTS = '10.0, 1.0'
+
+_SQLITE_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON products_product BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, description) VALUES (new.id, new.name, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON products_product BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF name, description ON products_product BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, name, description) VALUES (new.id, new.name, new.description);
+    END
+    """,
+]
+
+_POSTGRES_INSTALL = [
+    """
+    ALTER TABLE products_product ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS products_product_search_idx ON products_product USING GIN (search_vector)",
+]
+
+_POSTGRES_UNINSTALL = [
+    "DROP INDEX IF EXISTS products_product_search_idx",
+    "ALTER TABLE products_product DROP COLUMN IF EXISTS search_vector",
+]
+
+# alias -> backend name, resolved once per process
+_backends = {}
+
+
+class FTSDocumentField(models.TextField):
+    """
+    The hidden FTS5 column named after its table; supports `__match`.
+    """
+
+
+@FTSDocumentField.register_lookup
+class Match(Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', lhs_params + rhs_params
+
+
+class BM25(Func):
+    """Negated FTS5 bm25() score, so that higher means more relevant."""
+    template = f'-bm25(%(expressions)s, {_SQLITE_WEIGHTS})'
+    output_field = FloatField()
+
+
+def install_search_index(connection):
+    """
+    Create the search index for `connection` if missing (idempotent).
+
+    On SQLite this also reinstalls the sync triggers, which are dropped
+    whenever a migration rebuilds `products_product`, and rebuilds the
+    FTS table from the product rows when that happens.
+    """
+    _backends.pop(connection.alias, None)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            for statement in _POSTGRES_INSTALL:
+                cursor.execute(statement)
+        elif connection.vendor == 'sqlite':
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                    "name, description, content='products_product', content_rowid='id')"
+                )
+            except Exception:
+                # SQLite compiled without FTS5: search falls back to icontains
+                return
+            cursor.execute(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s",
+                [f'{FTS_TABLE}_%'],
+            )
+            triggers_present = cursor.fetchone()[0] == len(_SQLITE_TRIGGERS)
+            for statement in _SQLITE_TRIGGERS:
+                cursor.execute(statement)
+            if not triggers_present:
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def uninstall_search_index(connection):
+    """Drop the search index created by `install_search_index`."""
+    _backends.pop(connection.alias, None)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            for statement in _POSTGRES_UNINSTALL:
+                cursor.execute(statement)
+        elif connection.vendor == 'sqlite':
+            for suffix in ('ai', 'ad', 'au'):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def search_backend(using='default'):
+    """Return 'postgresql', 'sqlite' or None (icontains fallback)."""
+    if using not in _backends:
+        connection = connections[using]
+        backend = None
+        if connection.vendor == 'postgresql':
+            backend = 'postgresql'
+        elif connection.vendor == 'sqlite':
+            if FTS_TABLE in connection.introspection.table_names():
+                backend = 'sqlite'
+        _backends[using] = backend
+    return _backends[using]
+
+
+def search_terms(text):
+    """Split free text into at most MAX_TERMS lowercase word tokens."""
+    return re.findall(r'[^\W_]+', (text or '').lower())[:MAX_TERMS]
+
+
+def search_products(queryset, text):
+    """
+    Restrict `queryset` to products matching `text` and annotate each row
+    with `search_rank`. Every term must match; the last term matches as a
+    prefix so results appear while the shopper is still typing.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    backend = search_backend(queryset.db)
+    table = queryset.model._meta.db_table
+
+    if backend == 'postgresql':
+        tsquery = ' & '.join(terms) + ':*'
+        return queryset.filter(
+            RawSQL(f"{table}.search_vector @@ to_tsquery('english', %s)", [tsquery], output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(
+                f"ts_rank({table}.search_vector, to_tsquery('english', %s))",
+                [tsquery],
+                output_field=FloatField(),
+            )
+        )
+
+    if backend == 'sqlite':
+        match = ' '.join(f'"{term}"' for term in terms) + '*'
+        return queryset.filter(search_entry__document__match=match).annotate(
+            search_rank=BM25('search_entry__document')
+        )
+
+    condition = Q()
+    for term in terms:
+        condition &= Q(name__icontains=term) | Q(description__icontains=term)
+    return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
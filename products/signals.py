@@ -0,0 +1,49 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .card_cache import invalidate_product_card
+from .models import Product, Review
+from .ratings import apply_rating_delta
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_rating(sender, instance, raw=False, **kwargs):
+    """Keep the stored rating of an edited review so post_save can apply the difference."""
+    instance._previous_rating = None
+    if instance.pk and not raw:
+        instance._previous_rating = (
+            Review.objects.filter(pk=instance.pk).values_list('product_id', 'rating').first()
+        )
+
+
+@receiver(post_save, sender=Review)
+def add_review_to_product_rating(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_rating', None)
+    if created or previous is None:
+        apply_rating_delta(instance.product_id, instance.rating, 1)
+    elif previous[0] != instance.product_id:
+        apply_rating_delta(previous[0], -previous[1], -1)
+        apply_rating_delta(instance.product_id, instance.rating, 1)
+    else:
+        apply_rating_delta(instance.product_id, instance.rating - previous[1], 0)
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_from_product_rating(sender, instance, **kwargs):
+    apply_rating_delta(instance.product_id, -instance.rating, -1)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def drop_product_card(sender, instance, **kwargs):
+    """A product's cached card is stale as soon as the product changes."""
+    invalidate_product_card(instance.pk)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def drop_reviewed_product_card(sender, instance, **kwargs):
+    """Cards show rating and review count, so review changes drop them too."""
+    invalidate_product_card(instance.product_id)
@@ -0,0 +1,124 @@
+"""
+Product stock reservation
+
+Checkout takes stock for the whole order with one conditional UPDATE:
+
+    UPDATE products_product
+       SET quantity_in_stock = quantity_in_stock - CASE id WHEN ... THEN n ... END,
+           sold_count = sold_count + CASE id WHEN ... THEN n ... END
+     WHERE id IN (...) AND quantity_in_stock >= CASE id WHEN ... THEN n ... END
+
+The database checks and decrements in the same statement, so concurrent
+checkouts can never take the same unit twice and rows are never rewritten
+from a stale copy. If fewer rows match than the order has products, some
+line was short: the statement is rolled back and `OutOfStock` names the
+product, so the caller's transaction (and the order rows in it) rolls back
+too. The statement costs the same whatever the size of the order.
+"""
+
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Now
+
+
+class OutOfStock(Exception):
+    """A product does not have the requested quantity in stock."""
+
+    def __init__(self, product_id, requested, available, name=''):
+        self.product_id = product_id
+        self.requested = requested
+        self.available = available
+        self.name = name
+        super().__init__(
+            f'Not enough stock for {name or f"product {product_id}"}: '
+            f'requested {requested}, in stock {available}'
+        )
+
+
+def _quantities(lines):
+    """Sum (product or product id, quantity) pairs per product id."""
+    totals = Counter()
+    for product, quantity in lines:
+        if quantity <= 0:
+            raise ValueError(f'Quantity must be positive, got {quantity}')
+        totals[getattr(product, 'pk', product)] += quantity
+    return sorted(totals.items())
+
+
+def _per_product(quantities):
+    """CASE expression giving each product's quantity in a batched UPDATE."""
+    return Case(
+        *[When(pk=product_id, then=Value(quantity)) for product_id, quantity in quantities],
+        output_field=IntegerField(),
+    )
+
+
+class _Shortage(Exception):
+    pass
+
+
+def _shortage(quantities):
+    """The first line the current stock cannot cover, as OutOfStock (or None)."""
+    from .models import Product
+
+    current = {
+        row['pk']: row
+        for row in Product.objects.filter(pk__in=[pk for pk, _ in quantities]).values('pk', 'name', 'quantity_in_stock')
+    }
+    for product_id, quantity in quantities:
+        row = current.get(product_id, {'name': '', 'quantity_in_stock': 0})
+        if row['quantity_in_stock'] < quantity:
+            return OutOfStock(product_id, quantity, row['quantity_in_stock'], row['name'])
+    return None
+
+
+def reserve_stock(lines, attempts=3):
+    """
+    Take stock for (product or product id, quantity) pairs, all or nothing.
+
+    Raises OutOfStock for the first product that cannot cover its
+    quantity; nothing is reserved in that case. Call it inside the
+    transaction that creates the order so both commit together.
+    """
+    from .models import Product
+
+    quantities = _quantities(lines)
+    if not quantities:
+        return
+    for _ in range(attempts):
+        requested = _per_product(quantities)
+        try:
+            with transaction.atomic():
+                updated = Product.objects.filter(
+                    pk__in=[pk for pk, _ in quantities], quantity_in_stock__gte=requested
+                ).update(
+                    quantity_in_stock=F('quantity_in_stock') - requested,
+                    sold_count=F('sold_count') + requested,
+                    updated_at=Now(),
+                )
+                if updated != len(quantities):
+                    raise _Shortage
+            return
+        except _Shortage:
+            shortage = _shortage(quantities)
+            if shortage:
+                raise shortage
+            # Restocked between the UPDATE and the check: try again
+    raise OutOfStock(quantities[0][0], quantities[0][1], 0)
+
+
+def release_stock(lines):
+    """Put back stock taken by reserve_stock (e.g. when an order is cancelled)."""
+    from .models import Product
+
+    quantities = _quantities(lines)
+    if not quantities:
+        return
+    returned = _per_product(quantities)
+    Product.objects.filter(pk__in=[pk for pk, _ in quantities]).update(
+        quantity_in_stock=F('quantity_in_stock') + returned,
+        sold_count=F('sold_count') - returned,
+        updated_at=Now(),
+    )
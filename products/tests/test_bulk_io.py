@@ -0,0 +1,139 @@
+import io
+import json
+from decimal import Decimal
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.bulk_io import import_products, iter_export
+from products.models import Category, Product
+
+
+HEADER = 'id,name,description,category,price,discount_percent,quantity_in_stock,is_eco_friendly\n'
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class BulkImportExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='importer', password='pass123', role='artisan')
+        self.artisan = ArtisanProfile.objects.create(
+            user=self.user, craft_type='textiles', description='d', workshop_location='x'
+        )
+        self.category = Category.objects.create(name='Textiles')
+        other = User.objects.create_user(username='other', password='pass123', role='artisan')
+        self.other_product = Product.objects.create(
+            artisan=ArtisanProfile.objects.create(
+                user=other, craft_type='pottery', description='d', workshop_location='y'
+            ),
+            name='Not yours', description='d', price=Decimal('20.00'), image='products/placeholder.jpg'
+        )
+
+    def _import(self, body, **kwargs):
+        return import_products(io.StringIO(HEADER + body), self.artisan, **kwargs)
+
+    def test_creates_updates_and_reports_bad_rows(self):
+        existing = Product.objects.create(
+            artisan=self.artisan, name='Old shawl', description='d',
+            price=Decimal('20.00'), image='products/placeholder.jpg'
+        )
+        report = self._import(
+            ',Scarf,Silk scarf,Textiles,25.00,10,4,yes\n'
+            f'{existing.id},Shawl,Wool shawl,{self.category.id},30.00,,2,no\n'
+            ',,No name,,abc,,1,maybe\n'
+            f'{self.other_product.id},Stolen,x,,10.00,,1,no\n'
+            ',Rug,Jute rug,Unknown,12.00,,1,no\n'
+        )
+        self.assertEqual((report.created, report.updated), (1, 1))
+        self.assertEqual([line for line, _ in report.errors], [4, 5, 6])
+        self.assertTrue(any('name' in message for message in report.errors[0][1]))
+        self.assertTrue(any('is_eco_friendly' in message for message in report.errors[0][1]))
+
+        scarf = Product.objects.get(name='Scarf')
+        self.assertEqual(scarf.category, self.category)
+        self.assertEqual(scarf.artisan, self.artisan)
+        self.assertEqual(scarf.selling_price, Decimal('22.50'))
+        self.assertTrue(scarf.is_eco_friendly)
+        existing.refresh_from_db()
+        self.assertEqual((existing.name, existing.price, existing.quantity_in_stock), ('Shawl', Decimal('30.00'), 2))
+        self.other_product.refresh_from_db()
+        self.assertEqual(self.other_product.name, 'Not yours')
+
+    def test_duplicate_ids_are_reported_not_applied_twice(self):
+        existing = Product.objects.create(
+            artisan=self.artisan, name='Old shawl', description='d',
+            price=Decimal('20.00'), image='products/placeholder.jpg'
+        )
+        report = self._import(
+            f'{existing.id},First,d,,30.00,,2,no\n'
+            f'{existing.id},Second,d,,31.00,,2,no\n',
+            batch_size=1,
+        )
+        self.assertEqual((report.created, report.updated), (0, 1))
+        self.assertEqual(report.errors, [(3, [f'id: Product {existing.id} already appears on line 2.'])])
+        existing.refresh_from_db()
+        self.assertEqual(existing.name, 'First')
+
+    def test_image_must_be_an_uploaded_product_image(self):
+        rows = [
+            {'name': 'Default', 'description': 'd', 'price': '15.00'},
+            {'name': 'Candle', 'description': 'd', 'price': '15.00', 'image': 'candle.jpg'},
+            {'name': 'Missing', 'description': 'd', 'price': '15.00', 'image': 'products/nope.jpg'},
+            {'name': 'Escape', 'description': 'd', 'price': '15.00', 'image': '../../artisanedge/settings.py'},
+        ]
+        body = ''.join(json.dumps(row) + '\n' for row in rows)
+        report = import_products(io.StringIO(body), self.artisan, fmt='jsonl')
+        self.assertEqual(report.created, 2)
+        self.assertEqual([line for line, _ in report.errors], [3, 4])
+        self.assertTrue(all(messages[0].startswith('image:') for _, messages in report.errors))
+        self.assertEqual(
+            dict(Product.objects.filter(name__in=['Default', 'Candle']).values_list('name', 'image')),
+            {'Default': 'products/placeholder.jpg', 'Candle': 'products/candle.jpg'},
+        )
+
+    def test_dry_run_writes_nothing(self):
+        report = self._import(',Scarf,Silk scarf,,25.00,,4,yes\n', dry_run=True)
+        self.assertEqual(report.created, 1)
+        self.assertFalse(Product.objects.filter(name='Scarf').exists())
+
+    def test_query_count_is_per_chunk_not_per_row(self):
+        rows = ''.join(f',Item {i},Handmade,Textiles,15.00,5,1,no\n' for i in range(60))
+        with CaptureQueriesContext(connection) as small:
+            self._import(rows[:rows.index(',Item 10,')], batch_size=20)
+        with CaptureQueriesContext(connection) as large:
+            self._import(rows, batch_size=20)
+        self.assertEqual(Product.objects.filter(name__startswith='Item').count(), 70)
+        # 10 rows fit in one chunk, 60 rows take three: a fixed cost per chunk
+        self.assertLessEqual(len(large), len(small) * 3)
+
+    def test_export_round_trips_through_import(self):
+        self._import(',Scarf,"Silk, hand-dyed",Textiles,25.00,10,4,yes\n')
+        exported = ''.join(iter_export(Product.objects.filter(artisan=self.artisan)))
+        self.assertIn('"Silk, hand-dyed"', exported)
+        report = import_products(io.StringIO(exported), self.artisan)
+        self.assertEqual((report.created, report.updated, report.errors), (0, 1, []))
+        self.assertEqual(Product.objects.filter(artisan=self.artisan).count(), 1)
+
+        lines = ''.join(iter_export(Product.objects.filter(artisan=self.artisan), 'jsonl')).splitlines()
+        self.assertEqual(json.loads(lines[0])['category'], 'Textiles')
+
+    def test_upload_and_download_views(self):
+        self.client.login(username='importer', password='pass123')
+        upload = SimpleUploadedFile('catalog.csv', (HEADER + ',Scarf,Silk scarf,,25.00,,4,yes\n').encode())
+        response = self.client.post(reverse('import_products'), {'file': upload})
+        self.assertContains(response, '1 created, 0 updated')
+
+        response = self.client.get(reverse('export_products'), {'format': 'csv'})
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        body = b''.join(response.streaming_content).decode()
+        self.assertIn('Scarf', body)
+        self.assertNotIn('Not yours', body)
+
+    def test_management_commands(self):
+        out = StringIO()
+        call_command('export_products', '--artisan', 'other', stdout=out)
+        self.assertIn('Not yours', out.getvalue())
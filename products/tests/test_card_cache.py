@@ -0,0 +1,71 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.card_cache import card_cache_stats, card_key
+from products.models import Product, Review
+
+
+class ProductCardCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username='carder', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='pottery', description='d', workshop_location='x'
+        )
+        self.products = [
+            Product.objects.create(
+                artisan=artisan, name=f'Vase {i}', description='Glazed stoneware',
+                price=Decimal('12.00'), image='products/placeholder.jpg'
+            )
+            for i in range(3)
+        ]
+        self.customer = User.objects.create_user(username='buyer', password='pass123', role='customer')
+
+    def _list(self):
+        return self.client.get(reverse('products_list'))
+
+    def test_second_request_is_served_from_cache(self):
+        self.assertEqual(self._list()['X-Card-Cache'], 'hits=0; misses=3')
+        response = self._list()
+        self.assertEqual(response['X-Card-Cache'], 'hits=3; misses=0')
+        self.assertContains(response, 'Vase 1')
+        self.assertEqual(card_cache_stats(), {'hits': 3, 'misses': 3, 'hit_ratio': 0.5})
+
+    def test_product_save_invalidates_only_its_card(self):
+        self._list()
+        product = self.products[0]
+        product.name = 'Renamed Vase'
+        product.save()
+        self.assertIsNone(cache.get(card_key(product.pk)))
+        response = self._list()
+        self.assertEqual(response['X-Card-Cache'], 'hits=2; misses=1')
+        self.assertContains(response, 'Renamed Vase')
+
+    def test_stale_entry_is_not_served_after_queryset_update(self):
+        self._list()
+        # update() sends no signal; the updated_at stamp still guards the entry
+        Product.objects.filter(pk=self.products[1].pk).update(
+            name='Bulk Renamed', updated_at=self.products[1].updated_at.replace(year=2030)
+        )
+        response = self._list()
+        self.assertContains(response, 'Bulk Renamed')
+
+    def test_review_invalidates_product_card(self):
+        self._list()
+        Review.objects.create(
+            product=self.products[2], customer=self.customer, rating=4, title='Nice', comment='Good'
+        )
+        self.assertIsNone(cache.get(card_key(self.products[2].pk)))
+        self.assertIsNotNone(cache.get(card_key(self.products[0].pk)))
+
+    def test_stats_view_is_staff_only(self):
+        url = reverse('card_cache_stats')
+        self.client.login(username='buyer', password='pass123')
+        self.assertEqual(self.client.get(url).status_code, 302)
+        User.objects.create_user(username='staff', password='pass123', is_staff=True)
+        self.client.login(username='staff', password='pass123')
+        self._list()
+        self.assertEqual(self.client.get(url).json()['misses'], 3)
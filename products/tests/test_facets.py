@@ -0,0 +1,79 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.facets import catalog_facets, parse_catalog_filters
+from products.models import Category, Product
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class CatalogFacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username='facet', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='textiles', description='d', workshop_location='x'
+        )
+        self.textiles = Category.objects.create(name='Textiles')
+        self.pottery = Category.objects.create(name='Pottery')
+        # price (USD) -> INR band: 8.00 ~ ₹664, 15.00 ~ ₹1,245, 50.00 ~ ₹4,150
+        rows = [
+            (self.textiles, '8.00', True, 5),
+            (self.textiles, '15.00', False, 0),
+            (self.pottery, '15.00', True, 2),
+            (self.pottery, '50.00', True, 0),
+            (None, '8.00', False, 1),
+        ]
+        for category, price, eco, stock in rows:
+            Product.objects.create(
+                artisan=artisan, category=category, name='Item', description='handmade',
+                price=Decimal(price), is_eco_friendly=eco, quantity_in_stock=stock,
+                image='products/placeholder.jpg'
+            )
+        self.categories = [self.textiles, self.pottery]
+        self.active = Product.objects.filter(status='active')
+
+    def _facets(self, **params):
+        query = QueryDict(mutable=True)
+        query.update(params)
+        return catalog_facets(self.active, parse_catalog_filters(query), self.categories)
+
+    def test_counts_for_unfiltered_catalog(self):
+        facets = self._facets()
+        self.assertEqual(facets['total'], 5)
+        self.assertEqual(facets['eco'], 3)
+        self.assertEqual(facets['in_stock'], 3)
+        self.assertEqual([c['count'] for c in facets['categories']], [2, 2])
+        self.assertEqual([b['count'] for b in facets['price_bands']], [2, 2, 0, 1])
+
+    def test_category_counts_ignore_selected_category(self):
+        facets = self._facets(category=str(self.pottery.id))
+        self.assertEqual(facets['total'], 2)
+        self.assertEqual(facets['in_stock'], 1)
+        self.assertEqual([c['count'] for c in facets['categories']], [2, 2])
+
+    def test_filters_narrow_counts(self):
+        facets = self._facets(eco='on', price_band='1')
+        self.assertEqual(facets['total'], 1)
+        self.assertEqual([c['count'] for c in facets['categories']], [0, 1])
+
+    def test_one_grouped_query_then_cached(self):
+        with self.assertNumQueries(1):
+            self._facets(in_stock='on')
+        with self.assertNumQueries(0):
+            self._facets(in_stock='on')
+
+    def test_search_and_malformed_filters(self):
+        response = self.client.get(reverse('products_list'), {'search': 'handmade', 'min_price': 'abc'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['facets']['total'], 5)
+        self.assertIsNone(response.context['filters']['min_price'])
+
+    def test_marketplace_gets_facets(self):
+        response = self.client.get(reverse('artisanapp:marketplace'), {'category': str(self.textiles.id)})
+        self.assertEqual(len(response.context['products']), 2)
+        self.assertEqual(response.context['facets']['total'], 2)
+        self.assertContains(response, f'{self.textiles.name} (2)')
@@ -0,0 +1,74 @@
+from decimal import Decimal
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.models import Product
+
+
+@override_settings(CATALOG_PAGE_SIZE=5, CATALOG_MAX_PAGE_SIZE=8)
+class ProductListPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username='pager', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=user,
+            craft_type='pottery',
+            description='desc',
+            years_of_experience=1,
+            workshop_location='Here'
+        )
+        Product.objects.bulk_create([
+            Product(
+                artisan=artisan,
+                name=f'Pot {i}',
+                description='desc',
+                price=Decimal('10.00') + i,
+                quantity_in_stock=3,
+                image='products/placeholder.jpg'
+            )
+            for i in range(12)
+        ])
+        cls.expected = list(Product.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def _ids(self, response):
+        return [p.id for p in response.context['products']]
+
+    def test_walks_every_product_once_in_order(self):
+        seen = []
+        response = self.client.get(reverse('products_list'))
+        while True:
+            seen.extend(self._ids(response))
+            page = response.context['page']
+            if not page.has_next:
+                break
+            response = self.client.get(reverse('products_list'), {'after': page.next_cursor})
+        self.assertEqual(seen, self.expected)
+
+    def test_previous_cursor_returns_prior_page(self):
+        first = self.client.get(reverse('products_list'))
+        second = self.client.get(reverse('products_list'), {'after': first.context['page'].next_cursor})
+        back = self.client.get(reverse('products_list'), {'before': second.context['page'].previous_cursor})
+        self.assertEqual(self._ids(back), self._ids(first))
+        self.assertFalse(back.context['page'].has_previous)
+
+    def test_page_size_is_capped(self):
+        response = self.client.get(reverse('products_list'), {'per_page': 1000})
+        self.assertEqual(len(response.context['products']), 8)
+
+    def test_tampered_cursor_falls_back_to_first_page(self):
+        response = self.client.get(reverse('products_list'), {'after': 'not-a-cursor'})
+        self.assertEqual(self._ids(response), self.expected[:5])
+
+    def test_price_sort_pages_by_price(self):
+        seen = []
+        params = {'sort': 'price'}
+        while True:
+            response = self.client.get(reverse('products_list'), params)
+            seen.extend(p.price for p in response.context['products'])
+            page = response.context['page']
+            if not page.has_next:
+                break
+            params = {'sort': 'price', 'after': page.next_cursor}
+        self.assertEqual(seen, sorted(seen))
+        self.assertEqual(len(seen), 12)
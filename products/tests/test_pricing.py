@@ -0,0 +1,126 @@
+import itertools
+from decimal import Decimal, ROUND_HALF_UP
+from types import SimpleNamespace
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.models import Product
+from products.pricing import normalize_prices, price_bounds
+
+
+PRICE_FIELDS = ('price', 'original_price', 'discount_percent', 'selling_price', 'cost_price')
+
+
+def legacy_normalize(self):
+    """The per-row logic Product.save() ran before products.pricing (reference copy)."""
+    try:
+        rate = Decimal(getattr(settings, 'USD_TO_INR_RATE', 83))
+        min_inr = Decimal(getattr(settings, 'MIN_PRICE_INR', 500))
+        max_inr = Decimal(getattr(settings, 'MAX_PRICE_INR', 5000))
+        min_usd = (min_inr / rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        max_usd = (max_inr / rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        if self.original_price is not None:
+            op = Decimal(self.original_price)
+            if op < min_usd:
+                op = min_usd
+            elif op > max_usd:
+                op = max_usd
+            self.original_price = op.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        else:
+            if self.price is not None:
+                self.original_price = Decimal(self.price)
+        if self.discount_percent is not None:
+            dp = Decimal(self.discount_percent)
+            if dp < Decimal('0'):
+                dp = Decimal('0')
+            if dp > Decimal('100'):
+                dp = Decimal('100')
+            self.discount_percent = dp.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        if self.original_price is not None and self.discount_percent is not None:
+            op = Decimal(self.original_price)
+            dp = Decimal(self.discount_percent)
+            sp = (op * (Decimal('100') - dp) / Decimal('100')).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            if sp >= op:
+                sp = (op - Decimal('0.01')).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            self.selling_price = sp
+        else:
+            if self.selling_price is None and self.price is not None:
+                self.selling_price = Decimal(self.price)
+        if self.selling_price is not None:
+            spv = Decimal(self.selling_price)
+            if spv < min_usd:
+                spv = min_usd
+            elif spv > max_usd:
+                spv = max_usd
+            self.selling_price = spv.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        if self.selling_price is not None:
+            self.price = self.selling_price
+        if self.cost_price:
+            cp = Decimal(self.cost_price)
+            if self.original_price is not None and cp > Decimal(self.original_price):
+                self.cost_price = Decimal(self.original_price)
+            if cp < min_usd:
+                self.cost_price = min_usd
+            elif cp > max_usd:
+                self.cost_price = max_usd
+    except Exception:
+        pass
+    return self
+
+
+def _combinations():
+    prices = (None, Decimal('0'), Decimal('3.50'), Decimal('12.345'), Decimal('40.00'), Decimal('99.99'))
+    discounts = (None, Decimal('-5'), Decimal('0'), Decimal('0.004'), Decimal('17.5'), Decimal('100'), Decimal('150'))
+    for price, original, discount, selling, cost in itertools.product(
+        prices, prices, discounts, (None, Decimal('20.00'), Decimal('80.00')), (None, Decimal('5.00'), Decimal('45.00'))
+    ):
+        yield dict(price=price, original_price=original, discount_percent=discount,
+                   selling_price=selling, cost_price=cost)
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class PricingEquivalenceTests(SimpleTestCase):
+    def _assert_matches_legacy(self):
+        combos = list(_combinations())
+        batch = normalize_prices([SimpleNamespace(**combo) for combo in combos])
+        for combo, normalized in zip(combos, batch):
+            expected = legacy_normalize(SimpleNamespace(**combo))
+            for field in PRICE_FIELDS:
+                self.assertEqual(
+                    getattr(normalized, field), getattr(expected, field), f'{field} differs for {combo}'
+                )
+
+    def test_batch_matches_legacy_per_row_logic(self):
+        self._assert_matches_legacy()
+
+    def test_bounds_follow_setting_changes(self):
+        self.assertEqual(price_bounds(), (Decimal('6.02'), Decimal('60.24')))
+        with self.settings(USD_TO_INR_RATE=100, MAX_PRICE_INR=9000):
+            self.assertEqual(price_bounds(), (Decimal('5.00'), Decimal('90.00')))
+            self._assert_matches_legacy()
+        self.assertEqual(price_bounds(), (Decimal('6.02'), Decimal('60.24')))
+
+    def test_invalid_values_are_left_for_validation(self):
+        product = SimpleNamespace(price='abc', original_price=None, discount_percent=None,
+                                  selling_price=None, cost_price=None)
+        normalize_prices([product])
+        self.assertEqual(product.price, 'abc')
+
+
+@override_settings(USD_TO_INR_RATE=83, MIN_PRICE_INR=500, MAX_PRICE_INR=5000)
+class ProductSavePricingTests(TestCase):
+    def test_save_and_bulk_create_store_the_same_prices(self):
+        user = User.objects.create_user(username='pricer', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='textiles', description='d', workshop_location='x'
+        )
+        fields = dict(artisan=artisan, description='d', image='products/placeholder.jpg',
+                      price=Decimal('75.00'), discount_percent=Decimal('10'), cost_price=Decimal('2.00'))
+        saved = Product.objects.create(name='Saved', **fields)
+        Product.objects.bulk_create(normalize_prices([Product(name='Bulk', **fields)]))
+        bulk = Product.objects.get(name='Bulk')
+        saved.refresh_from_db()
+        for field in PRICE_FIELDS:
+            self.assertEqual(getattr(bulk, field), getattr(saved, field))
+        self.assertEqual(saved.selling_price, Decimal('60.24'))
@@ -0,0 +1,86 @@
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.models import Product, Review
+
+
+class ProductRatingAggregateTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='rater', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='jewelry', description='d', workshop_location='x'
+        )
+        self.product = Product.objects.create(
+            artisan=artisan, name='Silver Anklet', description='Oxidised',
+            price=Decimal('30.00'), image='products/placeholder.jpg'
+        )
+        self.customers = [
+            User.objects.create_user(username=f'cust{i}', password='pass123', role='customer')
+            for i in range(3)
+        ]
+
+    def _review(self, customer, rating):
+        return Review.objects.create(
+            product=self.product, customer=customer, rating=rating, title='t', comment='c'
+        )
+
+    def _stored(self):
+        self.product.refresh_from_db()
+        return self.product.rating_total, self.product.review_count, self.product.rating
+
+    def test_create_update_delete_keep_aggregates_current(self):
+        first = self._review(self.customers[0], 5)
+        self._review(self.customers[1], 4)
+        self.assertEqual(self._stored(), (9, 2, Decimal('4.50')))
+
+        first.rating = 2
+        first.save()
+        self.assertEqual(self._stored(), (6, 2, Decimal('3.00')))
+
+        self._review(self.customers[2], 3)
+        self.assertEqual(self._stored(), (9, 3, Decimal('3.00')))
+
+        first.delete()
+        self.assertEqual(self._stored(), (7, 2, Decimal('3.50')))
+        Review.objects.all().delete()
+        self.assertEqual(self._stored(), (0, 0, Decimal('0.00')))
+
+    def test_average_is_rounded(self):
+        for customer, rating in zip(self.customers, (5, 4, 4)):
+            self._review(customer, rating)
+        self.assertEqual(self._stored(), (13, 3, Decimal('4.33')))
+
+    def test_rebuild_command_repairs_drift(self):
+        self._review(self.customers[0], 4)
+        self._review(self.customers[1], 1)
+        Product.objects.filter(pk=self.product.pk).update(rating_total=0, review_count=7, rating=1)
+        out = StringIO()
+        call_command('rebuild_product_ratings', stdout=out)
+        self.assertIn('1 product', out.getvalue())
+        self.assertEqual(self._stored(), (5, 2, Decimal('2.50')))
+
+    def test_detail_page_reads_stored_aggregate(self):
+        self._review(self.customers[0], 4)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('product_detail', args=[self.product.pk]))
+        self.assertEqual(response.context['avg_rating'], Decimal('4.00'))
+        self.assertFalse(any('AVG(' in query['sql'].upper() for query in queries))
+        self.assertContains(response, '(1 review)')
+
+    def test_rating_writes_bump_updated_at_for_the_card_cache(self):
+        stale = self.product.updated_at
+        Product.objects.filter(pk=self.product.pk).update(updated_at=stale.replace(year=2000))
+        self._review(self.customers[0], 4)
+        self.product.refresh_from_db()
+        self.assertGreater(self.product.updated_at.year, 2000)
+
+        Product.objects.filter(pk=self.product.pk).update(updated_at=stale.replace(year=2000))
+        call_command('rebuild_product_ratings', stdout=StringIO())
+        self.product.refresh_from_db()
+        self.assertGreater(self.product.updated_at.year, 2000)
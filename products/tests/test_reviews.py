@@ -0,0 +1,60 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.models import Product, Review
+
+
+@override_settings(REVIEWS_PAGE_SIZE=4)
+class ProductReviewPaginationTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='maker', password='pass123', role='artisan')
+        artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='woodwork', description='d', workshop_location='x'
+        )
+        self.product = Product.objects.create(
+            artisan=artisan, name='Teak Bowl', description='Turned',
+            price=Decimal('18.00'), image='products/placeholder.jpg'
+        )
+        now = timezone.now()
+        self.reviews = []
+        for i in range(10):
+            customer = User.objects.create_user(
+                username=f'reviewer{i}', password='pass123', role='customer', first_name=f'R{i}'
+            )
+            review = Review.objects.create(
+                product=self.product, customer=customer, rating=i % 5 + 1, title=f'Review {i}', comment='c'
+            )
+            # Two reviews share each timestamp so the id tie-breaker is exercised
+            Review.objects.filter(pk=review.pk).update(created_at=now - timedelta(minutes=i // 2))
+            self.reviews.append(review)
+        self.newest_first = sorted(
+            Review.objects.filter(product=self.product), key=lambda r: (r.created_at, r.id), reverse=True
+        )
+
+    def test_detail_page_shows_first_page_with_flat_query_count(self):
+        url = reverse('product_detail', args=[self.product.pk])
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+            self.assertContains(response, 'Load more reviews')
+        self.assertEqual(list(response.context['reviews']), self.newest_first[:4])
+
+    def test_load_more_endpoint_walks_all_reviews(self):
+        url = reverse('product_reviews', args=[self.product.pk])
+        seen, params = [], {}
+        while True:
+            with self.assertNumQueries(2):
+                data = self.client.get(url, params).json()
+            seen.extend(review['id'] for review in data['reviews'])
+            if not data['has_next']:
+                break
+            params = {'reviews_after': data['next_cursor']}
+        self.assertEqual(seen, [review.id for review in self.newest_first])
+        self.assertEqual(data['reviews'][-1]['customer'], self.newest_first[-1].customer.get_full_name())
+
+    def test_unknown_product_returns_404(self):
+        response = self.client.get(reverse('product_reviews', args=[9999]))
+        self.assertEqual(response.status_code, 404)
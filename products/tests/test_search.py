@@ -0,0 +1,78 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from products.models import Product
+from products.search import search_products, search_terms
+
+
+class ProductSearchTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='searcher', password='pass123', role='artisan')
+        self.artisan = ArtisanProfile.objects.create(
+            user=user,
+            craft_type='textiles',
+            description='desc',
+            years_of_experience=1,
+            workshop_location='Here'
+        )
+
+    def _product(self, name, description):
+        return Product.objects.create(
+            artisan=self.artisan,
+            name=name,
+            description=description,
+            price=Decimal('20.00'),
+            image='products/placeholder.jpg'
+        )
+
+    def _search(self, text):
+        return list(search_products(Product.objects.all(), text).order_by('-search_rank', '-id'))
+
+    def test_matches_name_and_description_ranked_by_relevance(self):
+        in_description = self._product('Cotton Tote', 'A bag dyed with indigo')
+        in_name = self._product('Indigo Shawl', 'Handwoven wool')
+        self._product('Clay Pot', 'Terracotta')
+        self.assertEqual(self._search('indigo'), [in_name, in_description])
+
+    def test_all_terms_required_and_last_term_is_prefix(self):
+        quilt = self._product('Kantha Quilt', 'Embroidered cotton')
+        self._product('Kantha Stole', 'Silk')
+        self.assertEqual(self._search('kantha quil'), [quilt])
+
+    def test_index_follows_save_and_delete(self):
+        product = self._product('Brass Lamp', 'Bell metal')
+        product.name = 'Copper Lamp'
+        product.save()
+        self.assertEqual(self._search('brass'), [])
+        self.assertEqual(self._search('copper'), [product])
+        product.delete()
+        self.assertEqual(self._search('copper'), [])
+
+    def test_punctuation_is_ignored(self):
+        self.assertEqual(search_terms('"pot"* OR (vase)'), ['pot', 'or', 'vase'])
+        self.assertEqual(self._search('*"'), [])
+
+    def test_catalog_and_marketplace_use_search(self):
+        match = self._product('Dokra Horse', 'Brass casting')
+        self._product('Bamboo Basket', 'Cane')
+        response = self.client.get(reverse('products_list'), {'search': 'dokra'})
+        self.assertEqual(list(response.context['products']), [match])
+        response = self.client.get(reverse('artisanapp:marketplace'), {'search': 'dokra'})
+        self.assertEqual(list(response.context['products']), [match])
+
+    def test_relevance_results_page_with_cursors(self):
+        for i in range(5):
+            self._product(f'Jute Mat {i}', 'jute ' * (i + 1))
+        expected = [p.id for p in self._search('jute')]
+        seen = []
+        params = {'search': 'jute', 'per_page': 2}
+        while True:
+            response = self.client.get(reverse('products_list'), params)
+            seen.extend(p.id for p in response.context['products'])
+            page = response.context['page']
+            if not page.has_next:
+                break
+            params = {'search': 'jute', 'per_page': 2, 'after': page.next_cursor}
+        self.assertEqual(seen, expected)
@@ -0,0 +1,53 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.urls import reverse
+from accounts.models import User
+from artisans.models import ArtisanProfile
+from core.sorting import resolve_sort
+from influencers.models import InfluencerProfile
+from products.models import Product
+
+
+class SortRegistryTests(TestCase):
+    def test_resolves_keys_legacy_orderings_and_unknown_values(self):
+        self.assertEqual(resolve_sort(Product.SORT_CHOICES, 'price_desc')[2], ('-price', '-id'))
+        self.assertEqual(resolve_sort(Product.SORT_CHOICES, '-price')[0], 'price_desc')
+        self.assertEqual(resolve_sort(Product.SORT_CHOICES, 'artisan__user__password')[0], 'newest')
+        self.assertEqual(resolve_sort(Product.SORT_CHOICES, None)[0], 'newest')
+
+    def test_every_mode_has_a_leading_index(self):
+        for model in (Product, ArtisanProfile, InfluencerProfile):
+            indexed = {tuple(index.fields) for index in model._meta.indexes}
+            for key, _, ordering in model.SORT_CHOICES:
+                fields = tuple(name.lstrip('-') for name in ordering)
+                self.assertTrue(
+                    any(fields == index[-len(fields):] for index in indexed),
+                    f'{model.__name__} sort {key!r} has no matching index',
+                )
+
+
+class ListingSortViewTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='sorter', password='pass123', role='artisan')
+        self.artisan = ArtisanProfile.objects.create(
+            user=user, craft_type='pottery', description='d', workshop_location='x'
+        )
+        for price in ('30.00', '10.00', '20.00'):
+            Product.objects.create(
+                artisan=self.artisan, name=f'P{price}', description='d',
+                price=Decimal(price), image='products/placeholder.jpg'
+            )
+
+    def test_catalog_applies_registered_sort(self):
+        response = self.client.get(reverse('products_list'), {'sort': 'price_asc'})
+        prices = [p.price for p in response.context['products']]
+        self.assertEqual(prices, sorted(prices))
+        self.assertEqual(response.context['sort'], 'price_asc')
+
+    def test_unregistered_sorts_fall_back_to_default(self):
+        response = self.client.get(reverse('artisans_list'), {'sort': 'user__password'})
+        self.assertEqual(response.context['sort'], 'rating')
+        response = self.client.get(reverse('influencers:list'), {'sort': '?'})
+        self.assertEqual(response.context['sort'], 'rating')
+        response = self.client.get(reverse('artisan_products', args=[self.artisan.id]), {'sort': 'description'})
+        self.assertEqual(response.context['sort'], 'newest')
@@ -1,10 +1,16 @@
+from django.conf import settings
+from django.http import JsonResponse
 from django.shortcuts import render, redirect
+from django.template.defaultfilters import date as format_date
 from django.views.decorators.http import require_http_methods
-from django.db.models import Q, Avg
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from .models import Product, Category, Review
-from accounts.decorators import customer_required
+from .card_cache import card_cache_stats, render_product_cards
+from .facets import apply_catalog_filters, catalog_facets, parse_catalog_filters, price_band_bounds
+from accounts.decorators import admin_required, customer_required
+from core.pagination import KeysetPaginator, get_page_size
+from core.sorting import resolve_sort, sort_options
 
 
 @require_http_methods(["GET"])
@@ -12,55 +18,74 @@ def products_list_view(request):
     """
     List all products with search, filter, and sort
     """
-    products = Product.objects.filter(status='active')
-    categories = Category.objects.all()
-    
-    # Search
-    search = request.GET.get('search', '')
-    if search:
-        products = products.filter(
-            Q(name__icontains=search) |
-            Q(description__icontains=search)
-        )
-    
-    # Category filter
-    category = request.GET.get('category')
-    if category:
-        products = products.filter(category__id=category)
+    active = Product.objects.filter(status='active')
+    categories = list(Category.objects.all())
+    
+    # Search (full-text, ranked by relevance), category, price, eco and stock filters
+    filters = parse_catalog_filters(request.GET)
+    bounds = price_band_bounds()
+    products = apply_catalog_filters(active, filters, bounds)
+    search = filters['search']
     # Always pass category as string for template comparison
-    category_str = str(category) if category else ''
-    
-    # Price range filter
-    min_price = request.GET.get('min_price')
-    max_price = request.GET.get('max_price')
-    if min_price:
-        products = products.filter(price__gte=float(min_price))
-    if max_price:
-        products = products.filter(price__lte=float(max_price))
-    
-    # Eco-friendly filter
-    eco_only = request.GET.get('eco', False)
-    if eco_only:
-        products = products.filter(is_eco_friendly=True)
-    
-    # In stock filter
-    in_stock = request.GET.get('in_stock', False)
-    if in_stock:
-        products = products.filter(quantity_in_stock__gt=0)
-    
-    # Sorting
-    sort = request.GET.get('sort', '-created_at')
-    products = products.order_by(sort)
+    category_str = str(filters['category']) if filters['category'] is not None else ''
+    
+    # Facet counts for the sidebar (one grouped query, cached per filter set)
+    facets = catalog_facets(active, filters, categories, bounds)
+    
+    # Sorting (whitelisted, index-backed) + keyset pagination (bounded page size)
+    if search and request.GET.get('sort', 'relevance') == 'relevance':
+        sort, ordering = 'relevance', ('-search_rank', '-id')
+    else:
+        sort, _, ordering = resolve_sort(Product.SORT_CHOICES, request.GET.get('sort'))
+    per_page = get_page_size(request, settings.CATALOG_PAGE_SIZE, settings.CATALOG_MAX_PAGE_SIZE)
+    page = KeysetPaginator(products, ordering, per_page).page(
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+    )
+    
+    # Product cards come from the rendered-fragment cache where possible
+    cards, card_hits, card_misses = render_product_cards(page.object_list)
+    
+    # Querystring for next/prev links, without the current cursor
+    query = request.GET.copy()
+    query.pop('after', None)
+    query.pop('before', None)
     
     context = {
-        'products': products,
+        'products': page.object_list,
+        'cards': cards,
+        'page': page,
+        'page_query': query.urlencode(),
         'categories': categories,
         'search': search,
         'category': category_str,
+        'filters': filters,
+        'facets': facets,
         'sort': sort,
+        'sort_options': sort_options(Product.SORT_CHOICES),
     }
     
-    return render(request, 'products/products_list.html', context)
+    response = render(request, 'products/products_list.html', context)
+    response['X-Card-Cache'] = f'hits={card_hits}; misses={card_misses}'
+    return response
+
+
+@admin_required
+@require_http_methods(["GET"])
+def card_cache_stats_view(request):
+    """
+    Product card cache hit/miss totals (staff only)
+    """
+    return JsonResponse(card_cache_stats())
+
+
+def _review_page(request, product):
+    """One keyset page of a product's reviews, newest first, with customers joined."""
+    reviews = Review.objects.filter(product=product).select_related('customer')
+    per_page = get_page_size(request, settings.REVIEWS_PAGE_SIZE, settings.REVIEWS_MAX_PAGE_SIZE)
+    return KeysetPaginator(reviews, ('-created_at', '-id'), per_page).page(
+        after=request.GET.get('reviews_after'),
+    )
 
 
 @require_http_methods(["GET"])
@@ -69,23 +94,54 @@ def product_detail_view(request, product_id):
     Product detail page
     """
     try:
-        product = Product.objects.get(id=product_id, status='active')
+        product = Product.objects.select_related('artisan__user', 'category').get(
+            id=product_id, status='active'
+        )
     except Product.DoesNotExist:
         return render(request, '404.html', status=404)
     
-    reviews = Review.objects.filter(product=product).order_by('-created_at')
-    avg_rating = reviews.aggregate(Avg('rating'))['rating__avg'] or 0
+    reviews_page = _review_page(request, product)
     
     context = {
         'product': product,
-        'reviews': reviews,
-        'avg_rating': avg_rating,
+        'reviews': reviews_page.object_list,
+        'reviews_page': reviews_page,
+        # Stored aggregate, maintained from Review writes (products.ratings)
+        'avg_rating': product.rating,
         'can_review': request.user.is_authenticated and request.user.is_customer(),
     }
     
     return render(request, 'products/product_detail.html', context)
 
 
+@require_http_methods(["GET"])
+def product_reviews_view(request, product_id):
+    """
+    Next page of a product's reviews as JSON ("load more" on the product page)
+    """
+    product = Product.objects.filter(id=product_id, status='active').only('id').first()
+    if product is None:
+        return JsonResponse({'error': 'Product not found.'}, status=404)
+    
+    page = _review_page(request, product)
+    return JsonResponse({
+        'reviews': [
+            {
+                'id': review.id,
+                'title': review.title,
+                'comment': review.comment,
+                'rating': review.rating,
+                'customer': review.customer.get_full_name(),
+                'created_at': review.created_at.isoformat(),
+                'created_display': format_date(review.created_at, 'M d, Y'),
+            }
+            for review in page.object_list
+        ],
+        'has_next': page.has_next,
+        'next_cursor': page.next_cursor,
+    })
+
+
 @login_required
 @customer_required
 @require_http_methods(["POST"])